@@ -0,0 +1,75 @@
+"""
+Memory benchmark comparing card storage layouts at production scale.
+"""
+import sys
+import tracemalloc
+from typing import Callable, Any
+from ex0.CreatureCard import CreatureCard
+from ex1.CardTable import CardTable, CREATURE
+
+
+class DictCreatureCard(CreatureCard):
+    """
+    CreatureCard subclass without __slots__, i.e. the old __dict__ layout.
+    """
+
+
+def measure(build: Callable[[int], Any], count: int) -> int:
+    """
+    Measure the memory retained by a structure built for `count` cards.
+
+    :param build: Callable returning the structure for `count` cards.
+    :param count: Number of cards to build.
+    :return: Bytes still allocated once the structure is built.
+    """
+    tracemalloc.start()
+    result = build(count)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current
+
+
+def build_dict_objects(count: int) -> list:
+    """Build `count` dict-backed creature cards."""
+    return [
+        DictCreatureCard("Goblin Warrior", i % 10, "Common", 2, 1)
+        for i in range(count)
+    ]
+
+
+def build_slotted_objects(count: int) -> list:
+    """Build `count` slotted creature cards."""
+    return [
+        CreatureCard("Goblin Warrior", i % 10, "Common", 2, 1)
+        for i in range(count)
+    ]
+
+
+def build_table(count: int) -> CardTable:
+    """Build a CardTable holding `count` creature rows."""
+    table = CardTable()
+    for i in range(count):
+        table.add_row(CREATURE, "Goblin Warrior", i % 10, "Common", 2, 1)
+    return table
+
+
+def main() -> None:
+    """
+    Print the retained memory of each layout.
+    """
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"=== Card memory layout benchmark ({count} cards) ===")
+    layouts = [
+        ("dict objects", build_dict_objects),
+        ("slotted objects", build_slotted_objects),
+        ("CardTable", build_table),
+    ]
+    for label, build in layouts:
+        used = measure(build, count)
+        print(f"{label:<16} {used / 1e6:10.1f} MB"
+              f" ({used / count:6.1f} B/card)")
+
+
+if __name__ == "__main__":
+    main()
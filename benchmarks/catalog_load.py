@@ -0,0 +1,94 @@
+"""
+Cold-load benchmark: JSON and CSV card catalogs against the mmap catalog.
+"""
+import csv
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import Dict, Any, List
+from ex3.CardCatalog import CardCatalog
+from ex3.build_catalog import read_rows
+
+FIELDS = ("id", "type", "name", "cost", "rarity", "attack", "health",
+          "durability", "mana", "effect")
+
+
+def make_rows(count: int, seed: int) -> List[Dict[str, Any]]:
+    """
+    Generate `count` seeded card definitions of every kind.
+    """
+    rng = random.Random(seed)
+    rows = []
+    for i in range(count):
+        tag = CardCatalog.KINDS[i % len(CardCatalog.KINDS)]
+        row: Dict[str, Any] = {
+            "id": f"card_{i}", "type": tag, "name": f"Card {i}",
+            "cost": rng.randrange(10),
+            "rarity": rng.choice(("Common", "Rare", "Epic", "Legendary"))
+        }
+        for field in CardCatalog.LAYOUTS[tag]:
+            row[field] = (f"Effect {i % 500}" if field == "effect"
+                          else rng.randrange(1, 10))
+        rows.append(row)
+    return rows
+
+
+def main() -> None:
+    """
+    Write the same catalog as JSON, CSV and binary, then time loading
+    each one and reading a few hundred templates from it.
+    """
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 300_000
+    rows = make_rows(count, 3)
+    lookups = random.Random(4).sample(range(count), min(count, 500))
+    print(f"=== Catalog cold-load benchmark ({count} cards) ===")
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = os.path.join(directory, "cards.json")
+        csv_path = os.path.join(directory, "cards.csv")
+        bin_path = os.path.join(directory, "cards.bin")
+        with open(json_path, "w") as out:
+            json.dump(rows, out)
+        with open(csv_path, "w", newline="") as out:
+            writer = csv.DictWriter(out, FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+        start = time.perf_counter()
+        CardCatalog.build(read_rows(csv_path), bin_path)
+        print(f"build from CSV: {time.perf_counter() - start:8.3f} s")
+
+        start = time.perf_counter()
+        with open(json_path) as source:
+            by_id = {row["id"]: row for row in json.load(source)}
+        for i in lookups:
+            by_id[f"card_{i}"]
+        json_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with open(csv_path, newline="") as source:
+            by_id = {row["id"]: row for row in csv.DictReader(source)}
+        for i in lookups:
+            by_id[f"card_{i}"]
+        csv_time = time.perf_counter() - start
+        del by_id
+
+        start = time.perf_counter()
+        with CardCatalog(bin_path) as catalog:
+            for i in lookups:
+                catalog.template(f"card_{i}")
+        mmap_time = time.perf_counter() - start
+
+        for label, path, elapsed in (
+            ("json", json_path, json_time),
+            ("csv", csv_path, csv_time),
+            ("mmap", bin_path, mmap_time),
+        ):
+            size = os.path.getsize(path) / 2 ** 20
+            print(f"{label:<5} {size:7.1f} MiB  {elapsed * 1000:9.2f} ms"
+                  f"  x{json_time / elapsed:7.1f} vs json")
+
+
+if __name__ == "__main__":
+    main()
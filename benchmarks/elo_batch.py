@@ -0,0 +1,60 @@
+"""
+Benchmark and consistency check for TournamentPlatform.create_matches.
+"""
+import random
+import sys
+import time
+from ex4.TournamentCard import TournamentCard
+from ex4.TournamentPlatform import TournamentPlatform
+
+
+def build_platform(n_cards: int) -> TournamentPlatform:
+    """
+    Register n_cards tournament cards with varied attack power.
+    """
+    platform = TournamentPlatform()
+    for i in range(n_cards):
+        card = TournamentCard(f"Card {i}", 3, "Common", i % 13)
+        platform.register_card(card, f"card_{i}")
+    return platform
+
+
+def main() -> None:
+    """
+    Play the same seeded round sequentially and as one batch, check that
+    both platforms end in the same state, and report the timings.
+    """
+    n_matches = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    n_cards = int(sys.argv[2]) if len(sys.argv) > 2 else 100_000
+    print(f"=== Elo batch benchmark ({n_matches} matches,"
+          f" {n_cards} cards) ===")
+    rng = random.Random(7)
+    pairs = []
+    for _ in range(n_matches):
+        a, b = rng.sample(range(n_cards), 2)
+        pairs.append((f"card_{a}", f"card_{b}"))
+
+    sequential = build_platform(n_cards)
+    start = time.perf_counter()
+    for card1_id, card2_id in pairs:
+        sequential.create_match(card1_id, card2_id)
+    seq_time = time.perf_counter() - start
+
+    batched = build_platform(n_cards)
+    start = time.perf_counter()
+    batched.create_matches(pairs)
+    batch_time = time.perf_counter() - start
+
+    same = all(
+        sequential.registry[cid].get_tournament_stats()
+        == batched.registry[cid].get_tournament_stats()
+        for cid in sequential.registry
+    ) and sequential.top_k(100) == batched.top_k(100)
+    print(f"sequential create_match: {seq_time:8.2f}s")
+    print(f"batched create_matches:  {batch_time:8.2f}s"
+          f"  (x{seq_time / batch_time:.1f})")
+    print(f"results identical: {same}")
+
+
+if __name__ == "__main__":
+    main()
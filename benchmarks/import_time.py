@@ -0,0 +1,68 @@
+"""
+Cold-start import benchmark for the DataDeck entry modules.
+
+Each module is imported in a fresh interpreter with -X importtime, and
+the median self-inclusive import time over several runs is checked
+against a per-module budget. Exits with status 1 if a budget is
+exceeded; --budget-scale adapts the budgets to slower machines.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+# Median cumulative import time budgets, in milliseconds.
+BUDGETS_MS: Dict[str, float] = {
+    "ex1.Deck": 30.0,
+    "ex3.FantasyCardFactory": 35.0,
+    "ex3.GameEngine": 35.0,
+    "ex4.TournamentPlatform": 35.0,
+}
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_time_us(module: str) -> int:
+    """
+    Import a module in a fresh interpreter and return its cumulative
+    import time in microseconds, as reported by -X importtime.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True, check=True)
+    for line in completed.stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == module \
+                and not fields[2][1:].startswith(" "):
+            return int(fields[1])
+    raise RuntimeError(f"No import time reported for {module}")
+
+
+def main() -> None:
+    """
+    Measure every entry module and compare it with its budget.
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.import_time")
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--budget-scale", type=float, default=1.0)
+    args = parser.parse_args()
+
+    print(f"=== Import time benchmark (median of {args.runs} runs) ===")
+    failures: List[str] = []
+    for module, budget in BUDGETS_MS.items():
+        samples = [import_time_us(module) / 1000 for _ in range(args.runs)]
+        median = statistics.median(samples)
+        limit = budget * args.budget_scale
+        status = "ok" if median <= limit else "OVER BUDGET"
+        if median > limit:
+            failures.append(module)
+        print(f"{module:<26} {median:7.2f} ms  (budget {limit:6.2f} ms)"
+              f"  {status}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Latency and throughput benchmark for the asyncio TournamentService.
+"""
+import asyncio
+import random
+import sys
+import time
+from typing import List
+from ex4.TournamentCard import TournamentCard
+from ex4.TournamentClient import TournamentClient
+from ex4.TournamentPlatform import TournamentPlatform
+from ex4.TournamentService import TournamentService
+
+
+def percentile(values: List[float], percent: float) -> float:
+    """
+    Nearest-rank percentile of an already sorted list.
+    """
+    rank = max(1, -(-len(values) * percent // 100))
+    return values[int(rank) - 1]
+
+
+async def run_clients(n_clients: int, requests_each: int,
+                      n_cards: int) -> None:
+    """
+    Run n_clients concurrent clients, each sending requests_each
+    requests (one leaderboard read for every nine matches).
+    """
+    platform = TournamentPlatform()
+    for i in range(n_cards):
+        card = TournamentCard(f"Card {i}", 3, "Common", i % 13)
+        platform.register_card(card, f"card_{i}")
+
+    async def session(client: TournamentClient, seed: int) -> None:
+        rng = random.Random(seed)
+        for n in range(requests_each):
+            if n % 10 == 9:
+                await client.leaderboard()
+            else:
+                a, b = rng.sample(range(n_cards), 2)
+                await client.play(f"card_{a}", f"card_{b}")
+
+    async with TournamentService(platform) as service:
+        clients = [TournamentClient(service) for _ in range(n_clients)]
+        start = time.perf_counter()
+        await asyncio.gather(*(
+            session(client, seed) for seed, client in enumerate(clients)
+        ))
+        elapsed = time.perf_counter() - start
+
+    latencies = sorted(
+        latency for client in clients for latency in client.latencies)
+    print(f"{n_clients:>6} clients: {len(latencies) / elapsed:>9.0f} req/s"
+          f"  p50 {percentile(latencies, 50) * 1e3:7.2f}ms"
+          f"  p99 {percentile(latencies, 99) * 1e3:7.2f}ms"
+          f"  batches {service.batches_run}")
+
+
+def main() -> None:
+    """
+    Measure the service at increasing numbers of concurrent clients.
+    """
+    requests_each = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    n_cards = int(sys.argv[2]) if len(sys.argv) > 2 else 10_000
+    print(f"=== Tournament service benchmark ({requests_each} requests"
+          f" per client, {n_cards} cards) ===")
+    for n_clients in (1_000, 5_000, 10_000, 50_000):
+        asyncio.run(run_clients(n_clients, requests_each, n_cards))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Match throughput benchmark for ShardedPlatform across shard counts.
+"""
+import random
+import sys
+import time
+from typing import List, Tuple
+from ex4.ShardedPlatform import ShardedPlatform
+from ex4.TournamentCard import TournamentCard
+
+
+def make_pairs(platform: ShardedPlatform, n_cards: int, n_matches: int,
+               cross_share: float, seed: int) -> List[Tuple[str, str]]:
+    """
+    Draw n_matches pairs, a cross_share of them across shards and the
+    rest between two cards of the same shard.
+    """
+    rng = random.Random(seed)
+    by_shard: List[List[str]] = [[] for _ in range(platform.n_shards)]
+    for i in range(n_cards):
+        card_id = f"card_{i}"
+        by_shard[platform.shard_of(card_id)].append(card_id)
+    pairs = []
+    for _ in range(n_matches):
+        if platform.n_shards > 1 and rng.random() < cross_share:
+            first, second = rng.sample(by_shard, 2)
+        else:
+            first = second = rng.choice(by_shard)
+        pairs.append((rng.choice(first), rng.choice(second)))
+    return [(a, b) for a, b in pairs if a != b]
+
+
+def main() -> None:
+    """
+    Play the same number of matches on 1, 2, 4 and 8 shards and report
+    matches per second and the speedup over one shard.
+    """
+    n_matches = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    n_cards = int(sys.argv[2]) if len(sys.argv) > 2 else 100_000
+    cross_share = float(sys.argv[3]) if len(sys.argv) > 3 else 0.0
+    batch_size = 50_000
+    print(f"=== Shard scaling benchmark ({n_matches} matches,"
+          f" {n_cards} cards, {cross_share:.0%} cross-shard) ===")
+    base_rate = 0.0
+    for n_shards in (1, 2, 4, 8):
+        with ShardedPlatform(n_shards) as platform:
+            platform.register_cards(
+                (f"card_{i}", TournamentCard(f"Card {i}", 3, "Common",
+                                             i % 13))
+                for i in range(n_cards))
+            pairs = make_pairs(platform, n_cards, n_matches, cross_share, 7)
+            start = time.perf_counter()
+            for lo in range(0, len(pairs), batch_size):
+                platform.create_matches(pairs[lo:lo + batch_size])
+            elapsed = time.perf_counter() - start
+        rate = len(pairs) / elapsed
+        base_rate = base_rate or rate
+        print(f"shards={n_shards}: {rate:10.0f} matches/s"
+              f"  speedup x{rate / base_rate:4.2f}")
+
+
+if __name__ == "__main__":
+    main()
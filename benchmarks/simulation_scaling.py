@@ -0,0 +1,37 @@
+"""
+Scaling benchmark for GameEngine.run_simulations across worker counts.
+"""
+import sys
+import time
+from ex3.AggressiveStrategy import AggressiveStrategy
+from ex3.FantasyCardFactory import FantasyCardFactory
+from ex3.GameEngine import GameEngine
+
+
+def main() -> None:
+    """
+    Run the same seeded batch with 1, 2, 4 and 8 workers and report
+    games per second, speedup and whether the results agree.
+    """
+    n_games = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    print(f"=== Monte-Carlo scaling benchmark ({n_games} games) ===")
+    engine = GameEngine()
+    factory = FantasyCardFactory()
+    strategy = AggressiveStrategy()
+
+    baseline = None
+    base_time = 0.0
+    for workers in (1, 2, 4, 8):
+        start = time.perf_counter()
+        result = engine.run_simulations(
+            factory, strategy, strategy, n_games, workers=workers, seed=42)
+        elapsed = time.perf_counter() - start
+        if baseline is None:
+            baseline, base_time = result, elapsed
+        print(f"workers={workers}: {n_games / elapsed:10.0f} games/s"
+              f"  speedup x{base_time / elapsed:4.2f}"
+              f"  deterministic={result == baseline}")
+
+
+if __name__ == "__main__":
+    main()
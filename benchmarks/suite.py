@@ -0,0 +1,397 @@
+"""
+Benchmark suite for the DataDeck hot paths, with JSON baselines.
+
+Usage:
+
+    python -m benchmarks.suite run [--output FILE] [--scale S]
+    python -m benchmarks.suite compare BASELINE [--threshold T]
+
+'run' measures every case (ops/sec, best of --repeat runs, and peak
+traced memory of one extra run) and optionally writes the results to a
+JSON baseline. 'compare' measures again and flags every case whose
+throughput dropped, or whose peak memory grew, by more than the
+threshold (a fraction, 0.10 by default; memory growth under
+MEMORY_SLACK bytes is ignored). It exits with status 1 when there is
+a regression. Every case uses fixed seeds.
+"""
+import argparse
+import fnmatch
+import json
+import platform as python_platform
+import random
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple, cast
+from ex1.Deck import Deck
+from ex3.AggressiveStrategy import AggressiveStrategy
+from ex3.FantasyCardFactory import FantasyCardFactory
+from ex3.GameEngine import GameEngine
+from ex4.TournamentCard import TournamentCard
+from ex4.TournamentPlatform import TournamentPlatform
+
+# A case builds fresh state and returns (operation, ops it performs).
+Case = Callable[[float], Tuple[Callable[[], Any], int]]
+CASES: Dict[str, Case] = {}
+
+# Peak memory growth below this many bytes is never a regression.
+MEMORY_SLACK = 64 * 1024
+
+
+def case(name: str) -> Callable[[Case], Case]:
+    """
+    Register a benchmark case under a name.
+    """
+    def register(setup: Case) -> Case:
+        CASES[name] = setup
+        return setup
+    return register
+
+
+def sized(base: int, scale: float) -> int:
+    """
+    Scale a production size, keeping at least one operation.
+    """
+    return max(1, int(base * scale))
+
+
+def themed_deck(size: int) -> Deck:
+    """
+    Build a seeded themed deck of the given size.
+    """
+    return cast(Deck, FantasyCardFactory().create_themed_deck(size, seed=1))
+
+
+def tournament(size: int) -> TournamentPlatform:
+    """
+    Build a platform with `size` cards and a seeded match history.
+    """
+    platform = TournamentPlatform()
+    for i in range(size):
+        card = TournamentCard(f"Card {i}", 3, "Common", i % 13)
+        platform.register_card(card, f"card_{i}")
+    rng = random.Random(5)
+    platform.create_matches(
+        (f"card_{rng.randrange(size)}", f"card_{rng.randrange(size)}")
+        for _ in range(size))
+    return platform
+
+
+@case("deck.draw_card")
+def deck_draw_card(scale: float) -> Tuple[Callable[[], Any], int]:
+    """
+    Draw every card of a large themed deck.
+    """
+    n = sized(100_000, scale)
+    deck = themed_deck(n)
+
+    def run() -> None:
+        draw = deck.draw_card
+        for _ in range(n):
+            draw()
+    return run, n
+
+
+@case("deck.get_deck_stats")
+def deck_get_deck_stats(scale: float) -> Tuple[Callable[[], Any], int]:
+    """
+    Read the stats of a large deck repeatedly.
+    """
+    deck = themed_deck(sized(100_000, scale))
+    calls = sized(100_000, scale)
+
+    def run() -> None:
+        stats = deck.get_deck_stats
+        for _ in range(calls):
+            stats()
+    return run, calls
+
+
+@case("deck.remove_card")
+def deck_remove_card(scale: float) -> Tuple[Callable[[], Any], int]:
+    """
+    Remove every card of a large deck by name, in random order.
+    """
+    deck = themed_deck(sized(100_000, scale))
+    names = [card.name for card in deck.cards]
+    random.Random(2).shuffle(names)
+
+    def run() -> None:
+        remove = deck.remove_card
+        for name in names:
+            remove(name)
+    return run, len(names)
+
+
+def shuffle_draw(scale: float, lazy: bool) -> Tuple[Callable[[], Any], int]:
+    """
+    Shuffle a large deck and draw an opening hand, repeatedly.
+    """
+    deck = Deck(rng=random.Random(3), lazy_shuffle=lazy)
+    deck.add_cards(themed_deck(sized(100_000, scale)).cards)
+    rounds = 20
+
+    def run() -> None:
+        for _ in range(rounds):
+            deck.shuffle()
+            deck.add_cards(deck.draw_many(min(7, len(deck))))
+    return run, rounds
+
+
+@case("deck.shuffle_draw")
+def deck_shuffle_draw(scale: float) -> Tuple[Callable[[], Any], int]:
+    """
+    Eagerly shuffle a large deck, then draw 7 cards.
+    """
+    return shuffle_draw(scale, lazy=False)
+
+
+@case("deck.lazy_shuffle_draw")
+def deck_lazy_shuffle_draw(scale: float) -> Tuple[Callable[[], Any], int]:
+    """
+    Lazily shuffle a large deck, then draw 7 cards.
+    """
+    return shuffle_draw(scale, lazy=True)
+
+
+@case("factory.create_cards")
+def factory_create_cards(scale: float) -> Tuple[Callable[[], Any], int]:
+    """
+    Create each kind of factory card in turn.
+    """
+    factory = FantasyCardFactory()
+    rounds = sized(100_000, scale)
+
+    def run() -> None:
+        for _ in range(rounds):
+            factory.create_creature("dragon")
+            factory.create_creature("goblin")
+            factory.create_spell("lightning")
+            factory.create_artifact("mana_ring")
+    return run, 4 * rounds
+
+
+@case("engine.simulate_turn")
+def engine_simulate_turn(scale: float) -> Tuple[Callable[[], Any], int]:
+    """
+    Simulate demo turns on a configured engine.
+    """
+    engine = GameEngine()
+    engine.configure_engine(FantasyCardFactory(), AggressiveStrategy())
+    turns = sized(100_000, scale)
+
+    def run() -> None:
+        simulate = engine.simulate_turn
+        for _ in range(turns):
+            simulate()
+    return run, turns
+
+
+@case("engine.simulate_game")
+def engine_simulate_game(scale: float) -> Tuple[Callable[[], Any], int]:
+    """
+    Play complete seeded games with 30-card decks; ops are game turns.
+
+    Games end when a player dies, so every measured turn still draws
+    and plays cards (unlike a long-lived game past its empty decks).
+    """
+    engine = GameEngine()
+    engine.configure_engine(FantasyCardFactory(), AggressiveStrategy())
+    games = sized(5_000, scale)
+    simulate = engine.simulate_game
+    turns = sum(simulate(100, seed=seed)["turns"] for seed in range(games))
+
+    def run() -> None:
+        for seed in range(games):
+            simulate(100, seed=seed)
+    return run, turns
+
+
+@case("strategy.execute_turn")
+def strategy_execute_turn(scale: float) -> Tuple[Callable[[], Any], int]:
+    """
+    Play seeded 5-card hands against 2-card boards.
+    """
+    strategy = AggressiveStrategy()
+    cards = list(themed_deck(7_000).cards)
+    hands = [cards[i:i + 5] for i in range(0, 5_000, 5)]
+    boards = [cards[i:i + 2] for i in range(5_000, 7_000, 2)]
+    states = [{"mana": 1 + i % 10} for i in range(len(hands))]
+    turns = sized(100_000, scale)
+
+    def run() -> None:
+        execute = strategy.execute_turn
+        count = len(hands)
+        for i in range(turns):
+            j = i % count
+            execute(hands[j], boards[j], states[j])
+    return run, turns
+
+
+@case("platform.create_match")
+def platform_create_match(scale: float) -> Tuple[Callable[[], Any], int]:
+    """
+    Play random matches one at a time.
+    """
+    size = sized(100_000, scale)
+    platform = tournament(size)
+    rng = random.Random(9)
+    pairs = [
+        (f"card_{a}", f"card_{b}")
+        for a, b in (rng.sample(range(size), 2) if size > 1 else (0, 0)
+                     for _ in range(sized(200_000, scale)))
+    ]
+
+    def run() -> None:
+        match = platform.create_match
+        for card1_id, card2_id in pairs:
+            match(card1_id, card2_id)
+    return run, len(pairs)
+
+
+@case("platform.get_leaderboard")
+def platform_get_leaderboard(scale: float) -> Tuple[Callable[[], Any], int]:
+    """
+    Format the full leaderboard.
+    """
+    platform = tournament(sized(100_000, scale))
+    calls = 5
+
+    def run() -> None:
+        for _ in range(calls):
+            platform.get_leaderboard()
+    return run, calls
+
+
+@case("platform.generate_tournament_report")
+def platform_report(scale: float) -> Tuple[Callable[[], Any], int]:
+    """
+    Generate the tournament report repeatedly.
+    """
+    platform = tournament(sized(100_000, scale))
+    calls = sized(100_000, scale)
+
+    def run() -> None:
+        report = platform.generate_tournament_report
+        for _ in range(calls):
+            report()
+    return run, calls
+
+
+def measure(setup: Case, scale: float, repeat: int) -> Dict[str, Any]:
+    """
+    Measure one case: best ops/sec over `repeat` runs, then the peak
+    memory allocated by the operation in one traced run.
+    """
+    best = float("inf")
+    ops = 0
+    for _ in range(repeat):
+        run, ops = setup(scale)
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    run, _ = setup(scale)
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "ops": ops,
+        "ops_per_sec": ops / best if best > 0 else float("inf"),
+        "peak_bytes": peak
+    }
+
+
+def run_suite(scale: float, repeat: int, pattern: str) -> Dict[str, Any]:
+    """
+    Measure every case whose name matches the glob pattern.
+    """
+    results = {}
+    for name, setup in CASES.items():
+        if fnmatch.fnmatch(name, pattern):
+            results[name] = result = measure(setup, scale, repeat)
+            print(f"{name:<38} {result['ops_per_sec']:>14,.0f} ops/s"
+                  f" {result['peak_bytes'] / 1024:>10,.0f} KiB peak")
+    return {
+        "python": python_platform.python_version(),
+        "scale": scale,
+        "repeat": repeat,
+        "results": results
+    }
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any],
+            threshold: float) -> List[str]:
+    """
+    List the regressions of `current` against `baseline`.
+    """
+    regressions = []
+    for name, now in current["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            continue
+        speed = now["ops_per_sec"] / before["ops_per_sec"]
+        memory = (now["peak_bytes"] + 1) / (before["peak_bytes"] + 1)
+        status = "ok"
+        if speed < 1 - threshold:
+            status = "REGRESSION"
+            regressions.append(f"{name}: throughput x{speed:.2f}")
+        if (memory > 1 + threshold
+                and now["peak_bytes"] - before["peak_bytes"] > MEMORY_SLACK):
+            status = "REGRESSION"
+            regressions.append(f"{name}: peak memory x{memory:.2f}")
+        print(f"{name:<38} speed x{speed:5.2f}  memory x{memory:5.2f}"
+              f"  {status}")
+    return regressions
+
+
+def main() -> None:
+    """
+    Parse the command line and run or compare the suite.
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="measure every case")
+    run_parser.add_argument("--output", help="write a JSON baseline")
+    compare_parser = commands.add_parser(
+        "compare", help="measure and compare with a baseline")
+    compare_parser.add_argument("baseline", help="JSON baseline file")
+    compare_parser.add_argument("--threshold", type=float, default=0.10)
+    for sub in (run_parser, compare_parser):
+        sub.add_argument("--scale", type=float, default=None,
+                         help="size multiplier (default 1, or the"
+                              " baseline's scale when comparing)")
+        sub.add_argument("--repeat", type=int, default=3)
+        sub.add_argument("--only", default="*",
+                         help="glob selecting case names")
+    args = parser.parse_args()
+
+    if args.command == "run":
+        scale = 1.0 if args.scale is None else args.scale
+        print(f"=== DataDeck benchmark suite (scale {scale}) ===")
+        results = run_suite(scale, args.repeat, args.only)
+        if args.output:
+            with open(args.output, "w") as out:
+                json.dump(results, out, indent=2)
+            print(f"Baseline written to {args.output}")
+        return
+
+    with open(args.baseline) as source:
+        baseline = json.load(source)
+    scale = baseline["scale"] if args.scale is None else args.scale
+    print(f"=== DataDeck benchmark suite (scale {scale}) ===")
+    current = run_suite(scale, args.repeat, args.only)
+    print(f"--- Compared with {args.baseline}"
+          f" (threshold {args.threshold:.0%}) ---")
+    regressions = compare(baseline, current, args.threshold)
+    if regressions:
+        print("Regressions:")
+        for line in regressions:
+            print(f"- {line}")
+        sys.exit(1)
+    print("No regressions.")
+
+
+if __name__ == "__main__":
+    main()
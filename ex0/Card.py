@@ -1,5 +1,5 @@
 from abc import ABC
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 
 class Card(ABC):
@@ -7,6 +7,12 @@ class Card(ABC):
     Abstract Base Class representing the foundational blueprint for all cards.
     """
 
+    __slots__ = ("name", "cost", "rarity")
+
+    # Tag under which the class is registered in CardRegistry; also used
+    # to classify cards without importing their concrete classes.
+    TYPE_TAG: Optional[str] = None
+
     def __init__(self, name: str, cost: int, rarity: str):
         """
         Initialize a new Card instance.
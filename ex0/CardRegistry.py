@@ -0,0 +1,61 @@
+import importlib
+from typing import Dict, List, Union
+
+
+class CardRegistry:
+    """
+    Registry of concrete card classes, keyed by type tag.
+
+    Classes are registered as 'module:ClassName' paths and only imported
+    the first time they are resolved, so code that merely classifies
+    cards (through their TYPE_TAG) or never builds a given kind of card
+    does not pay for importing it.
+    """
+
+    _paths: Dict[str, str] = {
+        "creatures": "ex0.CreatureCard:CreatureCard",
+        "spells": "ex1.SpellCard:SpellCard",
+        "artifacts": "ex1.ArtifactCard:ArtifactCard",
+        "elite": "ex2.EliteCard:EliteCard",
+        "tournament": "ex4.TournamentCard:TournamentCard",
+    }
+    _classes: Dict[str, type] = {}
+
+    @classmethod
+    def register(cls, tag: str, card_class: Union[str, type]) -> None:
+        """
+        Register (or replace) the class behind a type tag.
+
+        :param tag: The type tag, matching the class's TYPE_TAG.
+        :param card_class: The class, or its 'module:ClassName' path.
+        """
+        cls._classes.pop(tag, None)
+        if isinstance(card_class, str):
+            cls._paths[tag] = card_class
+        else:
+            cls._paths[tag] = (
+                f"{card_class.__module__}:{card_class.__qualname__}")
+            cls._classes[tag] = card_class
+
+    @classmethod
+    def resolve(cls, tag: str) -> type:
+        """
+        Return the class registered for a type tag, importing it if needed.
+
+        :param tag: The type tag.
+        :return: The card class.
+        :raises KeyError: If no class is registered for the tag.
+        """
+        card_class = cls._classes.get(tag)
+        if card_class is None:
+            module_name, _, class_name = cls._paths[tag].partition(":")
+            module = importlib.import_module(module_name)
+            card_class = cls._classes[tag] = getattr(module, class_name)
+        return card_class
+
+    @classmethod
+    def tags(cls) -> List[str]:
+        """
+        Return every registered type tag.
+        """
+        return list(cls._paths)
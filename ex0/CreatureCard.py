@@ -7,6 +7,10 @@ class CreatureCard(Card):
     Concrete implementation of a Card representing a creature with combat stats
     """
 
+    __slots__ = ("attack", "health")
+
+    TYPE_TAG = "creatures"
+
     def __init__(
         self, name: str, cost: int, rarity: str, attack: int, health: int
     ):
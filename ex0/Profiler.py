@@ -0,0 +1,184 @@
+import time
+from array import array
+from functools import partial
+from typing import Dict, Any, Callable, List, Optional, Tuple
+
+# Histogram bucket i counts calls lasting [2^(i-1), 2^i) nanoseconds.
+BUCKETS = 64
+
+
+class _TimedMethod(partial):
+    """
+    Timed wrapper installed by Profiler.attach().
+
+    A partial over the timing closure, so calls cost no more than the
+    closure itself, that pickles as the plain method it wraps: pickled
+    copies of an instrumented object (e.g. sent to worker processes)
+    run untimed, while the original keeps recording.
+    """
+
+    __slots__ = ("method",)
+
+    method: Callable
+
+    def __reduce__(self) -> Any:
+        return self.method.__reduce__()
+
+
+class Profiler:
+    """
+    Opt-in timers and call counters for selected methods.
+
+    attach() shadows methods of one object with timed wrappers stored as
+    instance attributes; detach() removes them again, so objects that
+    are not attached run the plain methods with no overhead at all.
+    Instrumented objects stay picklable; their copies are not timed.
+    Each timed method gets a preallocated histogram of call durations
+    (power-of-two nanosecond buckets) and a running total; snapshot()
+    exports everything as a dictionary.
+    """
+
+    def __init__(self):
+        """
+        Initialize a profiler with no attached methods.
+        """
+        self._names: List[str] = []
+        self._histograms: List[array] = []
+        self._totals = array("Q")
+        self._attached: List[Tuple[Any, str]] = []
+
+    def _timer(self, name: str) -> int:
+        """
+        Return the index of a named timer, creating it if needed.
+        """
+        if name in self._names:
+            return self._names.index(name)
+        self._names.append(name)
+        self._histograms.append(array("Q", bytes(8 * BUCKETS)))
+        self._totals.append(0)
+        return len(self._names) - 1
+
+    def attach(self, target: Any, label: str, *method_names: str) -> None:
+        """
+        Time the given methods of one object.
+
+        :param target: The object to instrument (needs a __dict__).
+        :param label: Prefix of the timer names, e.g. 'engine'.
+        :param method_names: Methods to time; each one is recorded
+                             under '<label>.<method>'.
+        :raises AttributeError: If a method is already attached.
+        """
+        for method_name in method_names:
+            if method_name in vars(target):
+                raise AttributeError(
+                    f"{label}.{method_name} is already instrumented")
+            index = self._timer(f"{label}.{method_name}")
+            wrapper = self._wrap(getattr(target, method_name), index)
+            setattr(target, method_name, wrapper)
+            self._attached.append((target, method_name))
+
+    def _wrap(self, method: Callable, index: int) -> Callable:
+        """
+        Build the timed wrapper of a bound method.
+        """
+        histogram = self._histograms[index]
+        totals = self._totals
+        clock = time.perf_counter_ns
+        last = BUCKETS - 1
+
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            start = clock()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed = clock() - start
+                histogram[min(elapsed.bit_length(), last)] += 1
+                totals[index] += elapsed
+        wrapper = _TimedMethod(timed)
+        wrapper.method = method
+        return wrapper
+
+    def attach_engine(self, engine: Any) -> None:
+        """
+        Time a GameEngine with its current factory and strategy.
+
+        :param engine: A configured GameEngine.
+        """
+        self.attach(engine, "engine", "simulate_turn", "simulate_game",
+                    "_play_turn")
+        if engine.factory is not None:
+            self.attach(engine.factory, "factory", "create_creature",
+                        "create_spell", "create_artifact",
+                        "create_themed_deck")
+        if engine.strategy is not None:
+            self.attach(engine.strategy, "strategy", "execute_turn",
+                        "select_plays")
+
+    def attach_platform(self, platform: Any) -> None:
+        """
+        Time the match and leaderboard paths of a TournamentPlatform.
+
+        :param platform: The platform to instrument.
+        """
+        self.attach(platform, "platform", "create_match", "create_matches",
+                    "get_leaderboard", "top_k", "page",
+                    "generate_tournament_report")
+
+    def detach(self) -> None:
+        """
+        Restore every instrumented method (recorded samples are kept).
+        """
+        for target, method_name in reversed(self._attached):
+            delattr(target, method_name)
+        self._attached = []
+
+    def reset(self) -> None:
+        """
+        Clear every recorded sample, in place (wrappers keep working).
+        """
+        for histogram in self._histograms:
+            for i in range(BUCKETS):
+                histogram[i] = 0
+        for i in range(len(self._totals)):
+            self._totals[i] = 0
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Export the recorded samples.
+
+        :return: For each timer, the call count, total and mean time,
+                 approximate p50/p99 (bucket upper bounds, in ns) and
+                 the non-empty histogram buckets as {upper_ns: calls}.
+        """
+        result = {}
+        for name, histogram, total in zip(
+                self._names, self._histograms, self._totals):
+            calls = sum(histogram)
+            result[name] = {
+                "calls": calls,
+                "total_ns": total,
+                "mean_ns": total // calls if calls else 0,
+                "p50_ns": self._percentile(histogram, calls, 50),
+                "p99_ns": self._percentile(histogram, calls, 99),
+                "histogram": {
+                    1 << i: count for i, count in enumerate(histogram)
+                    if count
+                }
+            }
+        return result
+
+    @staticmethod
+    def _percentile(histogram: array, calls: int,
+                    percent: int) -> Optional[int]:
+        """
+        Return the upper bound of the bucket holding a percentile.
+        """
+        if not calls:
+            return None
+        target = max(1, -(-calls * percent // 100))
+        seen = 0
+        for i, count in enumerate(histogram):
+            seen += count
+            if seen >= target:
+                return 1 << i
+        return 1 << (BUCKETS - 1)
@@ -7,6 +7,10 @@ class ArtifactCard(Card):
     Concrete implementation of a Card representing a permanent artifact.
     """
 
+    __slots__ = ("durability", "effect")
+
+    TYPE_TAG = "artifacts"
+
     def __init__(
         self, name: str, cost: int, rarity: str, durability: int, effect: str
     ):
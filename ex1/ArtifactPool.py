@@ -0,0 +1,154 @@
+from array import array
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Sequence
+from ex1.ArtifactCard import ArtifactCard
+
+
+class ArtifactPool:
+    """
+    Artifacts in play, with their durabilities kept in one array.
+
+    Activations only update the array; the 'durability' attribute of an
+    ArtifactCard is written back when the card is read through the pool
+    (card(), iteration, sync()) or leaves it (evict_depleted()). Cards
+    in a pool should not be activated directly.
+    """
+
+    def __init__(self, artifacts: Iterable[ArtifactCard] = ()):
+        """
+        Initialize the pool.
+
+        :param artifacts: Artifacts to put in play.
+        """
+        self._cards: List[ArtifactCard] = []
+        self.durabilities = array("i")
+        self.activations: int = 0
+        self.add_many(artifacts)
+
+    def __len__(self) -> int:
+        """
+        Return the number of artifacts in the pool.
+        """
+        return len(self._cards)
+
+    def __iter__(self) -> Iterator[ArtifactCard]:
+        """
+        Iterate over the artifacts, synced, in pool order.
+        """
+        for index in range(len(self._cards)):
+            yield self.card(index)
+
+    def add(self, artifact: ArtifactCard) -> int:
+        """
+        Put one artifact in play.
+
+        :param artifact: The artifact.
+        :return: Its index in the pool.
+        """
+        self._cards.append(artifact)
+        self.durabilities.append(artifact.durability)
+        return len(self._cards) - 1
+
+    def add_many(self, artifacts: Iterable[ArtifactCard]) -> None:
+        """
+        Put several artifacts in play.
+
+        :param artifacts: The artifacts, in order.
+        """
+        artifacts = list(artifacts)
+        self._cards.extend(artifacts)
+        self.durabilities.extend(
+            artifact.durability for artifact in artifacts)
+
+    def card(self, index: int) -> ArtifactCard:
+        """
+        Return an artifact with its durability brought up to date.
+
+        :param index: Position in the pool.
+        """
+        card = self._cards[index]
+        card.durability = self.durabilities[index]
+        return card
+
+    def sync(self) -> None:
+        """
+        Write every durability back to its ArtifactCard.
+        """
+        for card, durability in zip(self._cards, self.durabilities):
+            card.durability = durability
+
+    def activate(self, index: int) -> Dict[str, Any]:
+        """
+        Activate one artifact, like ArtifactCard.activate_ability().
+
+        :param index: Position in the pool.
+        :return: The activation result, or an error if depleted.
+        """
+        card = self.card(index)
+        result = card.activate_ability()
+        self.durabilities[index] = card.durability
+        return result
+
+    def activate_all(self, mask: Optional[Sequence[int]] = None) -> bytes:
+        """
+        Activate every selected artifact that has durability left.
+
+        :param mask: One truthy/falsy flag per artifact, or None to
+                     select them all.
+        :return: One byte per artifact: 1 if it was activated, else 0.
+        :raises ValueError: If the mask length does not match the pool.
+        """
+        durabilities = self.durabilities
+        if mask is None:
+            activated = bytes(durability > 0 for durability in durabilities)
+            self.durabilities = array("i", [
+                durability - 1 if durability > 0 else durability
+                for durability in durabilities
+            ])
+        else:
+            if len(mask) != len(durabilities):
+                raise ValueError("Mask length must match the pool size")
+            activated = bytes([
+                bool(selected) and durability > 0
+                for selected, durability in zip(mask, durabilities)
+            ])
+            self.durabilities = array("i", [
+                durability - used
+                for durability, used in zip(durabilities, activated)
+            ])
+        self.activations += sum(activated)
+        return activated
+
+    def depleted(self) -> List[int]:
+        """
+        Return the indices of artifacts with no durability left.
+        """
+        return [
+            index for index, durability in enumerate(self.durabilities)
+            if durability <= 0
+        ]
+
+    def evict_depleted(self) -> List[ArtifactCard]:
+        """
+        Remove every depleted artifact from the pool.
+
+        Remaining artifacts keep their relative order (their indices
+        shift down).
+
+        :return: The evicted artifacts, synced.
+        """
+        cards = self._cards
+        durabilities = self.durabilities
+        evicted = []
+        kept = []
+        for card, durability in zip(cards, durabilities):
+            if durability > 0:
+                kept.append(card)
+            else:
+                card.durability = durability
+                evicted.append(card)
+        if evicted:
+            self._cards = kept
+            self.durabilities = array(
+                "i", [durability for durability in durabilities
+                      if durability > 0])
+        return evicted
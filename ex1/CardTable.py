@@ -0,0 +1,274 @@
+from array import array
+from typing import Dict, Any, List, Iterator, Sequence, TYPE_CHECKING, cast
+from ex0.Card import Card
+from ex0.CardRegistry import CardRegistry
+
+if TYPE_CHECKING:
+    from ex0.CreatureCard import CreatureCard
+    from ex1.ArtifactCard import ArtifactCard
+    from ex1.SpellCard import SpellCard
+
+CREATURE = 0
+SPELL = 1
+ARTIFACT = 2
+
+
+class CardView:
+    """
+    Lightweight read-only view over one row of a CardTable.
+    """
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: "CardTable", index: int):
+        """
+        Bind the view to a table row.
+
+        :param table: The CardTable holding the row.
+        :param index: The row index.
+        """
+        self._table = table
+        self._index = index
+
+    @property
+    def kind(self) -> int:
+        """Card kind tag (CREATURE, SPELL or ARTIFACT)."""
+        return self._table.kinds[self._index]
+
+    @property
+    def name(self) -> str:
+        """Name of the card."""
+        return self._table.strings[self._table.names[self._index]]
+
+    @property
+    def cost(self) -> int:
+        """Mana cost of the card."""
+        return self._table.costs[self._index]
+
+    @property
+    def rarity(self) -> str:
+        """Rarity level of the card."""
+        return self._table.strings[self._table.rarities[self._index]]
+
+    @property
+    def attack(self) -> int:
+        """Attack of the card (0 for non-creatures)."""
+        return self._table.attacks[self._index]
+
+    @property
+    def health(self) -> int:
+        """Health of the card (0 for non-creatures)."""
+        return self._table.healths[self._index]
+
+    def is_playable(self, available_mana: int) -> bool:
+        """
+        Check if the card can be played given the available mana.
+
+        :param available_mana: The current amount of mana the player has.
+        :return: True if the cost is less than or equal to available mana.
+        """
+        return available_mana >= self.cost
+
+    def get_card_info(self) -> Dict[str, Any]:
+        """
+        Retrieve the same information the matching Card class reports.
+
+        :return: A dictionary identical to the card's get_card_info().
+        """
+        info: Dict[str, Any] = {
+            "name": self.name,
+            "cost": self.cost,
+            "rarity": self.rarity
+        }
+        if self.kind == CREATURE:
+            info.update({
+                "type": "Creature",
+                "attack": self.attack,
+                "health": self.health
+            })
+        return info
+
+    def to_card(self) -> Card:
+        """
+        Materialize the row as a full Card instance.
+
+        :return: A new CreatureCard, SpellCard or ArtifactCard.
+        """
+        return self._table.to_card(self._index)
+
+
+class CardTable:
+    """
+    Columnar card storage keeping each field in a typed array.
+
+    Strings (names, rarities, effects) are interned once in a shared
+    string table and rows only store their ids, so a row costs a few
+    bytes instead of a full Python object.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty table.
+        """
+        self.strings: List[str] = []
+        self._string_ids: Dict[str, int] = {}
+        self.kinds = array("B")
+        self.names = array("I")
+        self.costs = array("h")
+        self.rarities = array("I")
+        self.attacks = array("h")
+        self.healths = array("h")
+        self.durabilities = array("h")
+        self.effects = array("I")
+
+    def __len__(self) -> int:
+        """
+        Return the number of rows in the table.
+        """
+        return len(self.kinds)
+
+    def __getitem__(self, index: int) -> CardView:
+        """
+        Return a view over the row at the given index.
+
+        :param index: The row index (negative indexes are supported).
+        :raises IndexError: If the index is out of range.
+        """
+        size = len(self.kinds)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("CardTable index out of range")
+        return CardView(self, index)
+
+    def __iter__(self) -> Iterator[CardView]:
+        """
+        Iterate over views of every row in order.
+        """
+        for index in range(len(self.kinds)):
+            yield CardView(self, index)
+
+    def intern(self, text: str) -> int:
+        """
+        Return the string table id of a string, adding it if needed.
+
+        :param text: The string to intern.
+        :return: Its id in the string table.
+        """
+        string_id = self._string_ids.get(text)
+        if string_id is None:
+            string_id = self._string_ids[text] = len(self.strings)
+            self.strings.append(text)
+        return string_id
+
+    def add_row(
+        self, kind: int, name: str, cost: int, rarity: str,
+        attack: int = 0, health: int = 0,
+        durability: int = 0, effect: str = ""
+    ) -> int:
+        """
+        Append a row built from raw field values.
+
+        :param kind: CREATURE, SPELL or ARTIFACT.
+        :param name: Card name.
+        :param cost: Mana cost.
+        :param rarity: Rarity level.
+        :param attack: Creature attack.
+        :param health: Creature health.
+        :param durability: Artifact durability.
+        :param effect: Spell effect type or artifact effect.
+        :return: The index of the new row.
+        """
+        self.kinds.append(kind)
+        self.names.append(self.intern(name))
+        self.costs.append(cost)
+        self.rarities.append(self.intern(rarity))
+        self.attacks.append(attack)
+        self.healths.append(health)
+        self.durabilities.append(durability)
+        self.effects.append(self.intern(effect))
+        return len(self.kinds) - 1
+
+    def add_card(self, card: Card) -> int:
+        """
+        Append a row copied from a Card instance.
+
+        :param card: A CreatureCard, SpellCard or ArtifactCard.
+        :return: The index of the new row.
+        :raises ValueError: If the card type cannot be stored.
+        """
+        tag = card.TYPE_TAG
+        if tag == "creatures":
+            creature = cast("CreatureCard", card)
+            return self.add_row(
+                CREATURE, card.name, card.cost, card.rarity,
+                attack=creature.attack, health=creature.health)
+        if tag == "spells":
+            spell = cast("SpellCard", card)
+            return self.add_row(
+                SPELL, card.name, card.cost, card.rarity,
+                effect=spell.effect_type)
+        if tag == "artifacts":
+            artifact = cast("ArtifactCard", card)
+            return self.add_row(
+                ARTIFACT, card.name, card.cost, card.rarity,
+                durability=artifact.durability, effect=artifact.effect)
+        raise ValueError(
+            f"Cannot store {card.__class__.__name__} in a CardTable")
+
+    def extend_from_prototypes(
+        self, prototypes: Sequence[Card], picks: Sequence[int]
+    ) -> None:
+        """
+        Append one row per pick, copied from a small set of prototypes.
+
+        Each prototype is converted once; the rows are then gathered
+        column by column, so no per-row Python dispatch happens.
+
+        :param prototypes: The distinct cards rows are copied from.
+        :param picks: For each new row, the index of its prototype.
+        """
+        start = len(self.kinds)
+        for card in prototypes:
+            self.add_card(card)
+        for column in self._columns():
+            values = column[start:]
+            del column[start:]
+            gathered = map(values.__getitem__, picks)
+            column.extend(array(column.typecode, gathered))
+
+    def _columns(self) -> List[array]:
+        """
+        Return every typed column buffer.
+        """
+        return [
+            self.kinds, self.names, self.costs, self.rarities,
+            self.attacks, self.healths, self.durabilities, self.effects
+        ]
+
+    def to_card(self, index: int) -> Card:
+        """
+        Materialize a row as a full Card instance.
+
+        :param index: The row index.
+        :return: A new CreatureCard, SpellCard or ArtifactCard.
+        """
+        strings = self.strings
+        kind = self.kinds[index]
+        name = strings[self.names[index]]
+        cost = self.costs[index]
+        rarity = strings[self.rarities[index]]
+        if kind == CREATURE:
+            return CardRegistry.resolve("creatures")(
+                name, cost, rarity, self.attacks[index], self.healths[index])
+        effect = strings[self.effects[index]]
+        if kind == SPELL:
+            return CardRegistry.resolve("spells")(name, cost, rarity, effect)
+        return CardRegistry.resolve("artifacts")(
+            name, cost, rarity, self.durabilities[index], effect)
+
+    def nbytes(self) -> int:
+        """
+        Return the size in bytes of the typed column buffers.
+        """
+        return sum(col.itemsize * len(col) for col in self._columns())
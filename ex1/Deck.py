@@ -1,48 +1,316 @@
 import random
-from typing import Dict, Any, List
+from collections import Counter, deque
+from typing import (
+    Dict, Any, List, Deque, Iterable, Iterator, Optional, Tuple
+)
 from ex0.Card import Card
-from ex0.CreatureCard import CreatureCard
-from ex1.ArtifactCard import ArtifactCard
-from ex1.SpellCard import SpellCard
 
 
 class Deck:
     """
     A class to manage a collection of various card types.
+
+    Cards live in a double-ended pile of slot ids (top on the left) so
+    draws from either end are O(1). A name index maps each card name to
+    the slots holding it, in pile order, so removals by name never scan
+    the pile. Removed slots are left as tombstones and skipped on draw.
+
+    Deck statistics are kept as running counters updated on every add,
+    remove and draw, so reading them never walks the pile.
+
+    In lazy shuffle mode, shuffle() only marks the cards as an unordered
+    top region and each draw from the top picks one of them at random (a
+    single Fisher-Yates step), so drawing k cards costs O(k). Iterating
+    over the deck fixes the order of the cards it reads the same way.
+    The name index is rebuilt, and the rest of the region shuffled, only
+    when an operation needs the full pile order.
     """
 
-    def __init__(self):
+    def __init__(self, debug: bool = False,
+                 rng: Optional[random.Random] = None,
+                 lazy_shuffle: bool = False):
         """
         Initialize an empty deck.
+
+        :param debug: If True, every stats read is checked against a full
+                      recount of the deck.
+        :param rng: RNG used by shuffles and samples (the global random
+                    module by default).
+        :param lazy_shuffle: If True, shuffle() defers the work to draws.
+        """
+        self._pile: Deque[int] = deque()
+        self._slots: Dict[int, Card] = {}
+        self._positions: Optional[Dict[str, Deque[int]]] = {}
+        # Lazy shuffle region: the first _loose slots are unordered; the
+        # rest are already drawn from them, the top card last.
+        self._unshuffled: List[int] = []
+        self._loose: int = 0
+        self._next_slot: int = 0
+        self.debug = debug
+        self.rng: Any = rng if rng is not None else random
+        self.lazy_shuffle = lazy_shuffle
+        self._type_counts: Dict[str, int] = {
+            "creatures": 0, "spells": 0, "artifacts": 0
+        }
+        self._cost_sum: int = 0
+        self._cost_histogram: Counter = Counter()
+        self._rarity_counts: Counter = Counter()
+
+    @property
+    def cards(self) -> Tuple[Card, ...]:
+        """
+        Read-only snapshot of the cards in the deck, from top to bottom.
+
+        The deck is changed through its methods (add_card(), draw_card(),
+        ...); the snapshot is a tuple so that code still mutating it in
+        place, as with the former list attribute, fails loudly.
+
+        Building it finishes a pending lazy shuffle, which costs O(n);
+        to read only the top cards, iterate over the deck instead.
+
+        :return: A tuple of the Card instances in pile order.
+        """
+        self._settle()
+        slots = self._slots
+        return tuple([slots[s] for s in self._pile if s in slots])
+
+    def __len__(self) -> int:
+        """
+        Return the number of cards currently in the deck.
+        """
+        return len(self._slots)
+
+    def __iter__(self) -> Iterator[Card]:
+        """
+        Iterate over the cards from top to bottom.
+
+        A pending lazy shuffle is only carried out as far as the
+        iteration goes, one random pick per card read, so reading the
+        top k cards costs O(k). The order read is the order later draws
+        follow. The deck must not be changed during the iteration.
+        """
+        slots = self._slots
+        unshuffled = self._unshuffled
+        for i in range(len(unshuffled) - 1, -1, -1):
+            if i < self._loose:
+                self._settle_one()
+            yield slots[unshuffled[i]]
+        for slot in self._pile:
+            card = slots.get(slot)
+            if card is not None:
+                yield card
+
+    def copy(self) -> "Deck":
+        """
+        Return an independent deck holding the same cards in the same
+        order (including a pending lazy shuffle), with the same RNG.
+
+        The Card instances themselves are shared, not copied.
+
+        :return: The new Deck.
+        """
+        other = type(self).__new__(type(self))
+        other._pile = self._pile.copy()
+        other._slots = self._slots.copy()
+        positions = self._positions
+        other._positions = None if positions is None else {
+            name: entry.copy() for name, entry in positions.items()
+        }
+        other._unshuffled = self._unshuffled[:]
+        other._loose = self._loose
+        other._next_slot = self._next_slot
+        other.debug = self.debug
+        other.rng = self.rng
+        other.lazy_shuffle = self.lazy_shuffle
+        other._type_counts = self._type_counts.copy()
+        other._cost_sum = self._cost_sum
+        other._cost_histogram = self._cost_histogram.copy()
+        other._rarity_counts = self._rarity_counts.copy()
+        return other
+
+    def clear(self) -> None:
+        """
+        Remove every card from the deck and reset the counters.
         """
-        self.cards: List[Card] = []
+        self._pile.clear()
+        self._slots.clear()
+        self._positions = {}
+        self._unshuffled = []
+        self._loose = 0
+        self._next_slot = 0
+        for key in self._type_counts:
+            self._type_counts[key] = 0
+        self._cost_sum = 0
+        self._cost_histogram.clear()
+        self._rarity_counts.clear()
 
     def add_card(self, card: Card) -> None:
         """
-        Add a card to the deck.
+        Add a card to the bottom of the deck.
 
         :param card: The Card instance to add.
         """
-        self.cards.append(card)
+        slot = self._next_slot
+        self._next_slot += 1
+        self._slots[slot] = card
+        self._pile.append(slot)
+        if self._positions is not None:
+            positions = self._positions.get(card.name)
+            if positions is None:
+                positions = self._positions[card.name] = deque()
+            positions.append(slot)
+        self._count(card, 1)
+
+    def add_cards(self, cards: Iterable[Card]) -> None:
+        """
+        Add a batch of cards to the bottom of the deck, in order.
+
+        Equivalent to calling add_card() for each card, but the pile and
+        the counters are updated in bulk.
+
+        :param cards: The Card instances to add.
+        """
+        cards = list(cards)
+        start = self._next_slot
+        new_slots = range(start, start + len(cards))
+        self._next_slot += len(cards)
+        self._slots.update(zip(new_slots, cards))
+        self._pile.extend(new_slots)
+
+        positions = self._positions
+        type_counts = self._type_counts
+        card_type = self.card_type
+        costs = []
+        for slot, card in zip(new_slots, cards):
+            if positions is not None:
+                entry = positions.get(card.name)
+                if entry is None:
+                    entry = positions[card.name] = deque()
+                entry.append(slot)
+            key = card_type(card)
+            if key in type_counts:
+                type_counts[key] += 1
+            costs.append(card.cost)
+        self._cost_sum += sum(costs)
+        self._cost_histogram.update(costs)
+        self._rarity_counts.update(card.rarity for card in cards)
 
     def remove_card(self, card_name: str) -> bool:
         """
-        Remove a card from the deck by its name.
+        Remove the top-most card with the given name from the deck.
 
         :param card_name: The name of the card to remove.
         :return: True if a card was removed, False otherwise.
         """
-        for i, card in enumerate(self.cards):
-            if card.name == card_name:
-                self.cards.pop(i)
-                return True
-        return False
+        index = self._settle()
+        positions = index.get(card_name)
+        if not positions:
+            return False
+        slot = positions.popleft()
+        if not positions:
+            del index[card_name]
+        self._count(self._slots.pop(slot), -1)
+        if len(self._pile) > 2 * len(self._slots) + 64:
+            slots = self._slots
+            self._pile = deque(s for s in self._pile if s in slots)
+        return True
+
+    def contains(self, card_name: str) -> bool:
+        """
+        Check whether at least one card with the given name is in the deck.
+
+        :param card_name: The name of the card to look for.
+        :return: True if the deck holds such a card.
+        """
+        return card_name in self._settle()
+
+    def count(self, card_name: str) -> int:
+        """
+        Count the cards with the given name currently in the deck.
+
+        :param card_name: The name of the card to count.
+        :return: The number of matching cards.
+        """
+        positions = self._settle().get(card_name)
+        return len(positions) if positions else 0
 
     def shuffle(self) -> None:
         """
         Randomly reorder the cards in the deck.
+
+        In lazy shuffle mode this only turns the pile into the unordered
+        top region that draws pick from.
+        """
+        if self.lazy_shuffle:
+            pile = self._pile
+            unshuffled = self._unshuffled
+            if len(unshuffled) + len(pile) == len(self._slots):
+                unshuffled.extend(pile)
+            else:
+                slots = self._slots
+                unshuffled.extend(s for s in pile if s in slots)
+            pile.clear()
+            self._loose = len(unshuffled)
+            self._positions = None
+            return
+        cards = list(self.cards)
+        self.rng.shuffle(cards)
+        self._slots = dict(enumerate(cards))
+        self._pile = deque(range(len(cards)))
+        self._next_slot = len(cards)
+        self._reindex()
+
+    def _settle(self) -> Dict[str, Deque[int]]:
         """
-        random.shuffle(self.cards)
+        Finish a pending lazy shuffle: shuffle the unordered region onto
+        the top of the pile, below the cards already drawn from it, and
+        rebuild the name index.
+
+        :return: The name index.
+        """
+        if self._positions is not None:
+            return self._positions
+        unshuffled = self._unshuffled
+        top = unshuffled[self._loose:]
+        top.reverse()
+        loose = unshuffled[:self._loose]
+        self.rng.shuffle(loose)
+        top.extend(loose)
+        top.extend(self._pile)
+        self._pile = deque(top)
+        self._unshuffled = []
+        self._loose = 0
+        return self._reindex()
+
+    def _settle_one(self) -> None:
+        """
+        Fix the next card of the lazy shuffle region: one Fisher-Yates
+        step moves a random unordered slot just below the fixed ones.
+        """
+        unshuffled = self._unshuffled
+        last = self._loose - 1
+        pick = self.rng.randrange(last + 1)
+        unshuffled[pick], unshuffled[last] = unshuffled[last], unshuffled[pick]
+        self._loose = last
+
+    def _reindex(self) -> Dict[str, Deque[int]]:
+        """
+        Rebuild the name index from the pile order.
+
+        :return: The new name index.
+        """
+        slots = self._slots
+        positions: Dict[str, Deque[int]] = {}
+        for slot in self._pile:
+            card = slots.get(slot)
+            if card is None:
+                continue
+            entry = positions.get(card.name)
+            if entry is None:
+                entry = positions[card.name] = deque()
+            entry.append(slot)
+        self._positions = positions
+        return positions
 
     def draw_card(self) -> Card:
         """
@@ -51,35 +319,224 @@ class Deck:
         :return: The Card instance drawn.
         :raises IndexError: If the deck is empty.
         """
-        if not self.cards:
+        if not self._slots:
             raise IndexError("Cannot draw from an empty deck")
-        return self.cards.pop(0)
+        unshuffled = self._unshuffled
+        if unshuffled:
+            last = len(unshuffled) - 1
+            if self._loose > last:
+                pick = self.rng.randrange(last + 1)
+                slot = unshuffled[pick]
+                unshuffled[pick] = unshuffled[last]
+                unshuffled.pop()
+                self._loose = last
+            else:
+                slot = unshuffled.pop()
+            card = self._slots.pop(slot)
+            self._count(card, -1)
+            return card
+        pile = self._pile
+        slots = self._slots
+        slot = pile.popleft()
+        while slot not in slots:
+            slot = pile.popleft()
+        card = slots.pop(slot)
+        self._forget(card.name, from_top=True)
+        self._count(card, -1)
+        return card
 
-    def get_deck_stats(self) -> Dict[str, Any]:
+    def draw_many(self, k: int) -> List[Card]:
         """
-        Calculate statistics about the cards currently in the deck.
+        Remove and return the top k cards of the deck, top first.
 
-        :return: A dictionary containing card counts and average cost.
+        :param k: Number of cards to draw.
+        :return: The Card instances drawn.
+        :raises ValueError: If k is negative.
+        :raises IndexError: If the deck holds fewer than k cards.
+        """
+        if not isinstance(k, int) or k < 0:
+            raise ValueError("Number of cards must be a non-negative integer")
+        if k > len(self._slots):
+            raise IndexError(f"Cannot draw {k} cards from a deck of"
+                             f" {len(self._slots)}")
+        draw = self.draw_card
+        return [draw() for _ in range(k)]
+
+    def sample(self, k: int) -> List[Card]:
+        """
+        Return k distinct cards chosen at random, leaving the deck as is.
+
+        This costs O(k) while a lazy shuffle is pending (and no card was
+        added since), O(n) otherwise. It never carries out the shuffle.
+
+        :param k: Number of cards to sample.
+        :return: The sampled Card instances.
+        :raises ValueError: If k is negative or exceeds the deck size.
+        """
+        slots = self._slots
+        if not isinstance(k, int) or not 0 <= k <= len(slots):
+            raise ValueError("Sample size must be between 0 and the deck"
+                             " size")
+        unshuffled = self._unshuffled
+        if len(unshuffled) == len(slots):
+            picks = self.rng.sample(range(len(unshuffled)), k)
+            return [slots[unshuffled[i]] for i in picks]
+        population = [slots[s] for s in unshuffled]
+        population.extend(slots[s] for s in self._pile if s in slots)
+        return self.rng.sample(population, k)
+
+    def draw_bottom(self) -> Card:
+        """
+        Remove and return the bottom card of the deck.
+
+        :return: The Card instance drawn.
+        :raises IndexError: If the deck is empty.
+        """
+        if not self._slots:
+            raise IndexError("Cannot draw from an empty deck")
+        self._settle()
+        pile = self._pile
+        slots = self._slots
+        slot = pile.pop()
+        while slot not in slots:
+            slot = pile.pop()
+        card = slots.pop(slot)
+        self._forget(card.name, from_top=False)
+        self._count(card, -1)
+        return card
+
+    def _forget(self, card_name: str, from_top: bool) -> None:
+        """
+        Drop a drawn card's slot from the name index, if there is one.
+
+        Slots only ever join the bottom of the pile, so the drawn card is
+        always the first (or last) entry for its name.
+
+        :param card_name: The name of the drawn card.
+        :param from_top: True if the card came off the top of the pile.
+        """
+        index = self._positions
+        if index is None:
+            return
+        positions = index[card_name]
+        if from_top:
+            positions.popleft()
+        else:
+            positions.pop()
+        if not positions:
+            del index[card_name]
+
+    @staticmethod
+    def card_type(card: Card) -> Optional[str]:
+        """
+        Classify a card by the type tag of its class.
+
+        Only 'creatures', 'spells' and 'artifacts' are counted in the
+        deck statistics; reading the tag needs no import of the card
+        classes themselves.
+
+        :param card: The card to classify.
+        :return: The card's TYPE_TAG (None for untagged cards).
+        """
+        return getattr(card, "TYPE_TAG", None)
+
+    def _count(self, card: Card, delta: int) -> None:
+        """
+        Apply a card entering (+1) or leaving (-1) the deck to the counters.
+
+        :param card: The card being added or removed.
+        :param delta: +1 when the card is added, -1 when it leaves.
         """
-        stats = {
-            "total_cards": len(self.cards),
+        key = self.card_type(card)
+        if key in self._type_counts:
+            self._type_counts[key] += delta
+        self._cost_sum += card.cost * delta
+        self._cost_histogram[card.cost] += delta
+        if not self._cost_histogram[card.cost]:
+            del self._cost_histogram[card.cost]
+        self._rarity_counts[card.rarity] += delta
+        if not self._rarity_counts[card.rarity]:
+            del self._rarity_counts[card.rarity]
+
+    def _recount(self) -> Dict[str, Any]:
+        """
+        Recompute the deck statistics from scratch by walking every card.
+
+        :return: The same structure as get_deck_stats(), plus the mana
+                 curve and rarity counts.
+        """
+        cards = list(self._slots.values())
+        stats: Dict[str, Any] = {
+            "total_cards": len(cards),
             "creatures": 0,
             "spells": 0,
             "artifacts": 0,
             "avg_cost": 0.0
         }
-        if not self.cards:
-            return stats
-
         total_cost = 0
-        for card in self.cards:
+        for card in cards:
             total_cost += card.cost
-            if isinstance(card, CreatureCard):
-                stats["creatures"] += 1
-            elif isinstance(card, SpellCard):
-                stats["spells"] += 1
-            elif isinstance(card, ArtifactCard):
-                stats["artifacts"] += 1
-
-        stats["avg_cost"] = total_cost / stats["total_cards"]
+            key = self.card_type(card)
+            if key in self._type_counts:
+                stats[key] += 1
+        if cards:
+            stats["avg_cost"] = total_cost / len(cards)
+        stats["mana_curve"] = dict(sorted(
+            Counter(card.cost for card in cards).items()))
+        stats["rarities"] = dict(Counter(card.rarity for card in cards))
         return stats
+
+    def _check_counters(self) -> None:
+        """
+        Compare the running counters against a full recount.
+
+        :raises RuntimeError: If any counter has drifted.
+        """
+        expected = self._recount()
+        actual = self._snapshot()
+        actual["mana_curve"] = self.get_mana_curve()
+        actual["rarities"] = self.get_rarity_counts()
+        if actual != expected:
+            raise RuntimeError(
+                f"Deck counters out of sync: {actual} != {expected}")
+
+    def _snapshot(self) -> Dict[str, Any]:
+        """
+        Build the stats dictionary from the running counters.
+        """
+        total = len(self._slots)
+        counts = self._type_counts
+        return {
+            "total_cards": total,
+            "creatures": counts["creatures"],
+            "spells": counts["spells"],
+            "artifacts": counts["artifacts"],
+            "avg_cost": self._cost_sum / total if total else 0.0
+        }
+
+    def get_deck_stats(self) -> Dict[str, Any]:
+        """
+        Retrieve statistics about the cards currently in the deck.
+
+        :return: A dictionary containing card counts and average cost.
+        :raises RuntimeError: In debug mode, if the counters have drifted.
+        """
+        if self.debug:
+            self._check_counters()
+        return self._snapshot()
+
+    def get_mana_curve(self) -> Dict[int, int]:
+        """
+        Retrieve how many cards the deck holds at each mana cost.
+
+        :return: A dictionary mapping cost to card count, sorted by cost.
+        """
+        return dict(sorted(self._cost_histogram.items()))
+
+    def get_rarity_counts(self) -> Dict[str, int]:
+        """
+        Retrieve how many cards the deck holds of each rarity.
+
+        :return: A dictionary mapping rarity to card count.
+        """
+        return dict(self._rarity_counts)
@@ -1,5 +1,7 @@
-from typing import Dict, Any, List
+from array import array
+from typing import Dict, Any, List, Optional, Sequence, Tuple, cast
 from ex0.Card import Card
+from ex1.SpellEffect import SpellEffect
 
 
 class SpellCard(Card):
@@ -7,6 +9,10 @@ class SpellCard(Card):
     Concrete implementation of a Card representing a one-time spell effect.
     """
 
+    __slots__ = ("effect_type",)
+
+    TYPE_TAG = "spells"
+
     def __init__(self, name: str, cost: int, rarity: str, effect_type: str):
         """
         Initialize a new SpellCard instance.
@@ -32,13 +38,61 @@ class SpellCard(Card):
             "effect": f"Spell cast: {self.effect_type}"
         }
 
+    @property
+    def compiled_effect(self) -> SpellEffect:
+        """
+        Compiled form of the effect text (parsed once per text).
+
+        Not named 'effect': ArtifactCard.effect is the plain effect text.
+        """
+        return SpellEffect.compile(self.effect_type)
+
+    @property
+    def damage(self) -> int:
+        """
+        Direct damage dealt by the spell.
+
+        :return: N for effects like 'Deal N damage', 0 otherwise.
+        """
+        return SpellEffect.compile(self.effect_type).damage
+
+    def resolve_batch(
+        self, healths: Sequence[int], attacks: Optional[Sequence[int]] = None
+    ) -> Tuple[array, Optional[array]]:
+        """
+        Apply the spell to whole columns of target stats.
+
+        :param healths: Health of each target.
+        :param attacks: Attack of each target, if buffs should apply.
+        :return: New health and attack columns.
+        """
+        return SpellEffect.compile(self.effect_type).apply(healths, attacks)
+
     def resolve_effect(self, targets: List[Any]) -> Dict[str, Any]:
         """
         Resolve the specific mechanics of the spell on given targets.
 
+        Targets with 'health' and 'attack' stats (creatures) are updated
+        in one batched step; health does not go below 0. Other targets,
+        such as player names, are left untouched.
+
         :param targets: A list of targets affected by the spell.
         :return: A dictionary describing the resolution status.
         """
+        creatures = [
+            target for target in targets
+            if hasattr(target, "health") and hasattr(target, "attack")
+        ]
+        if creatures:
+            healths, attacks = self.resolve_batch(
+                [creature.health for creature in creatures],
+                [creature.attack for creature in creatures])
+            # Attacks were passed in, so the attack column is returned.
+            new_attacks = cast(array, attacks)
+            for creature, health, attack in zip(
+                    creatures, healths, new_attacks):
+                creature.health = health if health > 0 else 0
+                creature.attack = attack
         return {
             "spell": self.name,
             "targets": targets,
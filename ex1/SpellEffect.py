@@ -0,0 +1,81 @@
+import re
+from array import array
+from typing import Dict, Optional, Sequence, Tuple
+
+_OPERATION_PATTERN = re.compile(
+    r"deal (\d+) damage|(?:heal|restore) (\d+)|\+(\d+) attack|buff (\d+)",
+    re.IGNORECASE)
+
+
+class SpellEffect:
+    """
+    Structured form of a spell's effect text.
+
+    Effect texts are parsed once into three magnitudes: damage
+    ('Deal N damage'), heal ('Heal N' / 'Restore N') and attack buff
+    ('+N attack' / 'Buff N'). Texts mixing several operations add up;
+    unrecognized text compiles to an effect that does nothing. Compiled
+    effects are cached per text and must be treated as immutable.
+    """
+
+    __slots__ = ("damage", "heal", "buff")
+
+    _cache: Dict[str, "SpellEffect"] = {}
+
+    def __init__(self, damage: int = 0, heal: int = 0, buff: int = 0):
+        """
+        Build an effect from its magnitudes.
+
+        :param damage: Health removed from each target.
+        :param heal: Health restored to each target.
+        :param buff: Attack added to each target.
+        """
+        self.damage = damage
+        self.heal = heal
+        self.buff = buff
+
+    @classmethod
+    def compile(cls, text: str) -> "SpellEffect":
+        """
+        Return the compiled effect of a text, parsing it on first use.
+
+        :param text: Free-text effect, e.g. 'Deal 3 damage'.
+        :return: The shared SpellEffect for that text.
+        """
+        effect = cls._cache.get(text)
+        if effect is None:
+            magnitudes = [0, 0, 0, 0]
+            for match in _OPERATION_PATTERN.finditer(text):
+                for i, group in enumerate(match.groups()):
+                    if group is not None:
+                        magnitudes[i] += int(group)
+            damage, heal, buff, more_buff = magnitudes
+            effect = cls._cache[text] = cls(damage, heal, buff + more_buff)
+        return effect
+
+    def apply(
+        self, healths: Sequence[int], attacks: Optional[Sequence[int]] = None
+    ) -> Tuple[array, Optional[array]]:
+        """
+        Apply the effect to every target at once.
+
+        :param healths: Health of each target.
+        :param attacks: Attack of each target, if buffs should apply.
+        :return: New health and attack columns (attacks is None when
+                 none were given).
+        """
+        change = self.heal - self.damage
+        if change:
+            new_healths = array("i", [health + change for health in healths])
+        else:
+            new_healths = array("i", healths)
+        new_attacks = None
+        if attacks is not None:
+            buff = self.buff
+            new_attacks = array("i", [attack + buff for attack in attacks]
+                                if buff else attacks)
+        return new_healths, new_attacks
+
+    def __repr__(self) -> str:
+        return (f"SpellEffect(damage={self.damage}, heal={self.heal}, "
+                f"buff={self.buff})")
@@ -0,0 +1,183 @@
+from array import array
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from ex2.CombatResult import CombatResult
+
+# Health given to cards without a health stat: they never die in combat.
+NO_HEALTH = 2 ** 31 - 1
+
+
+class CombatResolver:
+    """
+    Batch resolver for N-vs-M combat between two battlefields.
+
+    Boards are passed as parallel columns (attack, health and block
+    values, one entry per card) plus a blockers column telling which
+    attacker each defender blocks. Each combat step is one pass over a
+    whole column, and the result is returned as a CombatResult holding
+    damage and survival arrays.
+
+    Rules:
+
+    - an unblocked attacker deals its attack to the defending player;
+    - a blocked attacker assigns its attack to its blockers in order,
+      lethal damage (health + block) to each before moving on, and any
+      excess to the last one;
+    - every card reduces the damage it takes by its block value;
+    - a card dies when the damage it takes reaches its health.
+    """
+
+    def __init__(self):
+        """
+        Initialize the resolver and its statistics.
+        """
+        self.combats_resolved: int = 0
+        self.cards_resolved: int = 0
+
+    def resolve(
+        self, attacks: Sequence[int], healths: Sequence[int],
+        blocks: Sequence[int], defender_attacks: Sequence[int],
+        defender_healths: Sequence[int], defender_blocks: Sequence[int],
+        blockers: Sequence[int],
+        attacker_names: Optional[Sequence[str]] = None,
+        defender_names: Optional[Sequence[str]] = None
+    ) -> CombatResult:
+        """
+        Resolve one combat step between attackers and defenders.
+
+        :param attacks: Attack of each attacker.
+        :param healths: Health of each attacker.
+        :param blocks: Damage reduction of each attacker.
+        :param defender_attacks: Attack of each defender.
+        :param defender_healths: Health of each defender.
+        :param defender_blocks: Damage reduction of each defender.
+        :param blockers: For each defender, the index of the attacker it
+                         blocks, or -1 if it does not block.
+        :param attacker_names: Optional names used in reports.
+        :param defender_names: Optional names used in reports.
+        :return: The combat outcome.
+        :raises ValueError: If columns of one side differ in length.
+        :raises IndexError: If a blocker targets a missing attacker.
+        """
+        n = len(attacks)
+        m = len(defender_attacks)
+        if len(healths) != n or len(blocks) != n:
+            raise ValueError("Attacker columns must have the same length")
+        if (len(defender_healths) != m or len(defender_blocks) != m
+                or len(blockers) != m):
+            raise ValueError("Defender columns must have the same length")
+
+        # Damage coming back from blockers, and how many block each one.
+        incoming = [0] * n
+        blocked = [0] * n
+        for attack, target in zip(defender_attacks, blockers):
+            if target >= 0:
+                if target >= n:
+                    raise IndexError(f"No attacker at index {target}")
+                incoming[target] += attack
+                blocked[target] += 1
+
+        # Damage assigned to each blocker: the whole attack when blocked
+        # alone, lethal-first assignment when blocked by several.
+        assigned = [
+            attacks[target] if target >= 0 and blocked[target] == 1 else 0
+            for target in blockers
+        ]
+        if any(count > 1 for count in blocked):
+            self._assign_gang_blocks(
+                attacks, blocked, blockers, defender_healths,
+                defender_blocks, assigned)
+
+        attacker_damage = array("i", [
+            hit - block if hit > block else 0
+            for hit, block in zip(incoming, blocks)
+        ])
+        defender_damage = array("i", [
+            hit - block if hit > block else 0
+            for hit, block in zip(assigned, defender_blocks)
+        ])
+        attackers_alive = bytes(
+            damage < health
+            for damage, health in zip(attacker_damage, healths))
+        defenders_alive = bytes(
+            damage < health
+            for damage, health in zip(defender_damage, defender_healths))
+        player_damage = sum(
+            attack for attack, count in zip(attacks, blocked) if not count)
+
+        self.combats_resolved += 1
+        self.cards_resolved += n + m
+        return CombatResult(
+            attacker_damage, defender_damage, attackers_alive,
+            defenders_alive, player_damage, attacks, defender_blocks,
+            attacker_names, defender_names)
+
+    @staticmethod
+    def _assign_gang_blocks(
+        attacks: Sequence[int], blocked: List[int],
+        blockers: Sequence[int], defender_healths: Sequence[int],
+        defender_blocks: Sequence[int], assigned: List[int]
+    ) -> None:
+        """
+        Fill assigned[] for defenders sharing an attacker with others.
+        """
+        remaining: Dict[int, int] = {}
+        seen: Dict[int, int] = {}
+        for j, target in enumerate(blockers):
+            if target < 0 or blocked[target] < 2:
+                continue
+            left = remaining.get(target, attacks[target])
+            seen[target] = seen.get(target, 0) + 1
+            if seen[target] == blocked[target]:
+                give = left
+            else:
+                give = min(left, defender_healths[j] + defender_blocks[j])
+            assigned[j] = give
+            remaining[target] = left - give
+
+    @staticmethod
+    def combat_columns(
+        cards: Sequence[Any]
+    ) -> Tuple[array, array, array, List[str]]:
+        """
+        Extract attack, health, block and name columns from cards.
+
+        Attack is read from 'attack_power' (EliteCard, TournamentCard)
+        or 'attack' (CreatureCard). Cards without health never die, and
+        the block value is the class's DAMAGE_BLOCKED (0 if undefined).
+
+        :param cards: Card objects, in board order.
+        :return: (attacks, healths, blocks, names).
+        """
+        attacks = array("i")
+        healths = array("i")
+        blocks = array("i")
+        names = []
+        for card in cards:
+            attack = getattr(card, "attack_power", None)
+            if attack is None:
+                attack = card.attack
+            attacks.append(attack)
+            healths.append(getattr(card, "health", NO_HEALTH))
+            blocks.append(getattr(type(card), "DAMAGE_BLOCKED", 0))
+            names.append(card.name)
+        return attacks, healths, blocks, names
+
+    def resolve_cards(
+        self, attackers: Sequence[Any], defenders: Sequence[Any],
+        blockers: Sequence[int]
+    ) -> CombatResult:
+        """
+        Resolve combat between two boards of card objects.
+
+        :param attackers: The attacking cards.
+        :param defenders: The defending cards.
+        :param blockers: For each defender, the attacker index it
+                         blocks, or -1.
+        :return: The combat outcome, with card names in its reports.
+        """
+        attacks, healths, blocks, names = self.combat_columns(attackers)
+        d_attacks, d_healths, d_blocks, d_names = (
+            self.combat_columns(defenders))
+        return self.resolve(
+            attacks, healths, blocks, d_attacks, d_healths, d_blocks,
+            blockers, names, d_names)
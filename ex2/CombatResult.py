@@ -0,0 +1,93 @@
+from array import array
+from typing import Dict, Any, List, Optional, Sequence
+
+
+class CombatResult:
+    """
+    Outcome of one batch combat, stored column-wise.
+
+    Per-card damage and survival live in flat arrays indexed like the
+    resolver's input columns; the per-card dictionaries returned by
+    attacker_report() and defender_report() are only built on request.
+    """
+
+    __slots__ = (
+        "attacker_damage", "defender_damage", "attackers_alive",
+        "defenders_alive", "player_damage", "_attacks", "_defender_blocks",
+        "_attacker_names", "_defender_names"
+    )
+
+    def __init__(
+        self, attacker_damage: array, defender_damage: array,
+        attackers_alive: bytes, defenders_alive: bytes, player_damage: int,
+        attacks: Sequence[int], defender_blocks: Sequence[int],
+        attacker_names: Optional[Sequence[str]] = None,
+        defender_names: Optional[Sequence[str]] = None
+    ):
+        """
+        Store the columns computed by a CombatResolver.
+
+        :param attacker_damage: Damage taken by each attacker.
+        :param defender_damage: Damage taken by each defender.
+        :param attackers_alive: 1 for each surviving attacker, else 0.
+        :param defenders_alive: 1 for each surviving defender, else 0.
+        :param player_damage: Damage dealt by unblocked attackers.
+        :param attacks: Attack column of the attackers.
+        :param defender_blocks: Block column of the defenders.
+        :param attacker_names: Optional attacker names for reports.
+        :param defender_names: Optional defender names for reports.
+        """
+        self.attacker_damage = attacker_damage
+        self.defender_damage = defender_damage
+        self.attackers_alive = attackers_alive
+        self.defenders_alive = defenders_alive
+        self.player_damage = player_damage
+        self._attacks = attacks
+        self._defender_blocks = defender_blocks
+        self._attacker_names = attacker_names
+        self._defender_names = defender_names
+
+    def attacker_deaths(self) -> List[int]:
+        """
+        Return the indices of the attackers that died.
+        """
+        return [i for i, alive in enumerate(self.attackers_alive)
+                if not alive]
+
+    def defender_deaths(self) -> List[int]:
+        """
+        Return the indices of the defenders that died.
+        """
+        return [j for j, alive in enumerate(self.defenders_alive)
+                if not alive]
+
+    def attacker_report(self, index: int) -> Dict[str, Any]:
+        """
+        Build the result dictionary of one attacker.
+
+        :param index: Position of the attacker in the input columns.
+        :return: Attacker name, damage dealt and taken, and survival.
+        """
+        names = self._attacker_names
+        return {
+            "attacker": names[index] if names is not None else index,
+            "damage_dealt": self._attacks[index],
+            "damage_taken": self.attacker_damage[index],
+            "still_alive": bool(self.attackers_alive[index])
+        }
+
+    def defender_report(self, index: int) -> Dict[str, Any]:
+        """
+        Build the result dictionary of one defender, shaped like the
+        dictionaries returned by Combatable.defend().
+
+        :param index: Position of the defender in the input columns.
+        :return: Defender name, damage taken and blocked, and survival.
+        """
+        names = self._defender_names
+        return {
+            "defender": names[index] if names is not None else index,
+            "damage_taken": self.defender_damage[index],
+            "damage_blocked": self._defender_blocks[index],
+            "still_alive": bool(self.defenders_alive[index])
+        }
@@ -7,6 +7,8 @@ class Combatable(ABC):
     Abstract interface defining combat capabilities for cards.
     """
 
+    __slots__ = ()
+
     def attack(self, target: Any) -> Dict[str, Any]:
         """
         Execute an attack against a specified target.
@@ -9,6 +9,11 @@ class EliteCard(Card, Combatable, Magical):
     Powerful card implementing multiple inheritance for combat and magic.
     """
 
+    __slots__ = ("attack_power", "mana_reserve")
+
+    TYPE_TAG = "elite"
+    DAMAGE_BLOCKED = 3
+
     def __init__(
         self, name: str, cost: int, rarity: str,
         attack_power: int, mana_reserve: int
@@ -60,7 +65,7 @@ class EliteCard(Card, Combatable, Magical):
         :param incoming_damage: Initial damage value.
         :return: Damage mitigation report.
         """
-        blocked = 3
+        blocked = self.DAMAGE_BLOCKED
         taken = max(0, incoming_damage - blocked)
         return {
             "defender": self.name,
@@ -79,17 +84,28 @@ class EliteCard(Card, Combatable, Magical):
 
     def cast_spell(self, spell_name: str, targets: List[Any]) -> dict:
         """
-        Cast a magical spell consuming mana.
+        Cast a magical spell, paying its cost from the mana reserve.
 
         :param spell_name: Name of the spell.
         :param targets: Affected targets.
-        :return: Result of the spell casting.
-        """
+        :return: Result of the spell casting, or an 'Insufficient mana'
+                 error (reserve untouched) if the reserve is too low.
+        """
+        cost = self.spell_cost(spell_name)
+        if cost > self.mana_reserve:
+            return {
+                "caster": self.name,
+                "spell": spell_name,
+                "error": "Insufficient mana",
+                "mana_required": cost,
+                "mana_available": self.mana_reserve
+            }
+        self.mana_reserve -= cost
         return {
             "caster": self.name,
             "spell": spell_name,
             "targets": targets,
-            "mana_used": 4
+            "mana_used": cost
         }
 
     def channel_mana(self, amount: int) -> Dict[str, Any]:
@@ -1,11 +1,39 @@
 from abc import ABC
+from typing import Dict
 
 
 class Magical(ABC):
     """
     Abstract interface defining magical capabilities for cards.
+
+    SPELL_COSTS maps spell names to their mana cost; spells missing from
+    the table cost DEFAULT_SPELL_COST. Subclasses may override both.
+    Implementing classes hold their current mana in mana_reserve.
     """
 
+    __slots__ = ()
+
+    mana_reserve: int
+
+    SPELL_COSTS: Dict[str, int] = {
+        "Fireball": 4,
+        "Lightning Bolt": 3,
+        "Frost Nova": 3,
+        "Healing Light": 2,
+        "Arcane Shield": 2,
+        "Meteor": 7,
+    }
+    DEFAULT_SPELL_COST = 4
+
+    def spell_cost(self, spell_name: str) -> int:
+        """
+        Return the mana cost of a spell.
+
+        :param spell_name: The name of the spell.
+        :return: The cost from SPELL_COSTS, or DEFAULT_SPELL_COST.
+        """
+        return self.SPELL_COSTS.get(spell_name, self.DEFAULT_SPELL_COST)
+
     def cast_spell(self, spell_name: str, targets: list) -> dict:
         """
         Cast a magical spell targeting specific entities.
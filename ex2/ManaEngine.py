@@ -0,0 +1,214 @@
+from array import array
+from typing import Dict, Any, Callable, Iterable, List, Optional, Sequence
+from ex2.Magical import Magical
+
+
+class ManaEngine:
+    """
+    Mana accounting for many casters at once.
+
+    Each player (or attached Magical card) owns one slot in a ledger of
+    flat integer arrays: current reserve, per-turn regeneration and an
+    optional cap. Casts are paid from the ledger, so batched casts never
+    touch per-object attributes. Player slots look costs up in a shared
+    cost table; attached cards keep their own class's costs (see
+    Magical.spell_cost()) and get their reserve written back by sync().
+    """
+
+    def __init__(
+        self, cost_table: Optional[Dict[str, int]] = None,
+        default_cost: Optional[int] = None,
+        max_reserve: Optional[int] = None
+    ):
+        """
+        Initialize an empty ledger.
+
+        :param cost_table: Spell name -> cost for player slots
+                           (Magical.SPELL_COSTS if omitted).
+        :param default_cost: Cost of spells missing from the table
+                             (Magical.DEFAULT_SPELL_COST if omitted).
+        :param max_reserve: Cap applied by regeneration and channeling,
+                            or None for no cap.
+        """
+        self.cost_table = dict(
+            Magical.SPELL_COSTS if cost_table is None else cost_table)
+        self.default_cost = (
+            Magical.DEFAULT_SPELL_COST if default_cost is None
+            else default_cost)
+        self.max_reserve = max_reserve
+        self.reserves = array("i")
+        self.regeneration = array("i")
+        self.casts_resolved: int = 0
+        self.casts_failed: int = 0
+        self._cards: Dict[int, Any] = {}
+        # Slot -> spell_cost() of the attached card.
+        self._card_costs: Dict[int, Callable[[str], int]] = {}
+
+    def __len__(self) -> int:
+        """
+        Return the number of ledger slots.
+        """
+        return len(self.reserves)
+
+    def add_player(self, reserve: int = 0, regeneration: int = 0) -> int:
+        """
+        Open a ledger slot.
+
+        :param reserve: Starting mana.
+        :param regeneration: Mana regained at every regenerate() call.
+        :return: The slot index.
+        :raises ValueError: If reserve or regeneration is negative.
+        """
+        if reserve < 0 or regeneration < 0:
+            raise ValueError("Mana values must be non-negative")
+        self.reserves.append(reserve)
+        self.regeneration.append(regeneration)
+        return len(self.reserves) - 1
+
+    def attach(self, card: Magical, regeneration: int = 0) -> int:
+        """
+        Open a slot holding a Magical card's current reserve.
+
+        Casts from the slot cost what the card itself would charge, so
+        subclasses overriding SPELL_COSTS keep their prices.
+
+        :param card: A card with a mana_reserve attribute.
+        :param regeneration: Mana regained at every regenerate() call.
+        :return: The slot index.
+        """
+        slot = self.add_player(card.mana_reserve, regeneration)
+        self._cards[slot] = card
+        self._card_costs[slot] = card.spell_cost
+        return slot
+
+    def sync(self) -> None:
+        """
+        Write the ledger reserves back to the attached cards.
+        """
+        reserves = self.reserves
+        for slot, card in self._cards.items():
+            card.mana_reserve = reserves[slot]
+
+    def cost_of(self, spell_name: str, slot: Optional[int] = None) -> int:
+        """
+        Return the cost of a spell.
+
+        :param spell_name: The name of the spell.
+        :param slot: The caster's slot, for the costs of an attached card.
+        """
+        card_cost = self._card_costs.get(slot) if slot is not None else None
+        if card_cost is not None:
+            return card_cost(spell_name)
+        return self.cost_table.get(spell_name, self.default_cost)
+
+    def cast(self, slot: int, spell_name: str) -> Dict[str, Any]:
+        """
+        Pay for one spell from a slot.
+
+        :param slot: The caster's ledger slot.
+        :param spell_name: The name of the spell.
+        :return: The mana used and remaining, or an 'Insufficient mana'
+                 error (reserve untouched).
+        """
+        cost = self.cost_of(spell_name, slot)
+        available = self.reserves[slot]
+        if cost > available:
+            self.casts_failed += 1
+            return {
+                "spell": spell_name,
+                "error": "Insufficient mana",
+                "mana_required": cost,
+                "mana_available": available
+            }
+        self.reserves[slot] = available - cost
+        self.casts_resolved += 1
+        return {
+            "spell": spell_name,
+            "mana_used": cost,
+            "mana_remaining": available - cost
+        }
+
+    def cast_batch(
+        self, slots: Sequence[int], spell_names: Sequence[str]
+    ) -> array:
+        """
+        Pay for many casts, in order.
+
+        Casts from the same slot are paid one after the other, so a
+        later cast fails if earlier ones drained the reserve.
+
+        :param slots: Caster slot of each cast.
+        :param spell_names: Spell name of each cast.
+        :return: Mana spent by each cast, -1 for a failed cast.
+        :raises ValueError: If the two sequences differ in length.
+        """
+        if len(slots) != len(spell_names):
+            raise ValueError("Slots and spells must have the same length")
+        reserves = self.reserves
+        cost_of = self.cost_table.get
+        default = self.default_cost
+        card_costs = self._card_costs
+        spent: List[int] = []
+        failed = 0
+        for slot, spell_name in zip(slots, spell_names):
+            card_cost = card_costs.get(slot) if card_costs else None
+            if card_cost is None:
+                cost = cost_of(spell_name, default)
+            else:
+                cost = card_cost(spell_name)
+            available = reserves[slot]
+            if cost > available:
+                spent.append(-1)
+                failed += 1
+            else:
+                reserves[slot] = available - cost
+                spent.append(cost)
+        self.casts_resolved += len(spent) - failed
+        self.casts_failed += failed
+        return array("i", spent)
+
+    def channel(self, slot: int, amount: int) -> int:
+        """
+        Add mana to a slot, up to the cap (a reserve already above the
+        cap is kept as is).
+
+        :param slot: The ledger slot.
+        :param amount: Mana to add.
+        :return: The new reserve.
+        :raises ValueError: If amount is not positive.
+        """
+        if amount <= 0:
+            raise ValueError("Channeled mana must be positive")
+        reserve = self.reserves[slot]
+        total = reserve + amount
+        if self.max_reserve is not None and total > self.max_reserve:
+            total = max(reserve, self.max_reserve)
+        self.reserves[slot] = total
+        return total
+
+    def regenerate(self) -> None:
+        """
+        Start a new turn: every slot regains its regeneration amount.
+        """
+        cap = self.max_reserve
+        totals: Iterable[int]
+        if cap is None:
+            totals = map(int.__add__, self.reserves, self.regeneration)
+        else:
+            totals = (
+                reserve if reserve >= cap else min(cap, reserve + regen)
+                for reserve, regen in zip(self.reserves, self.regeneration))
+        self.reserves = array("i", totals)
+
+    def get_ledger_stats(self) -> Dict[str, Any]:
+        """
+        Summarize the ledger.
+
+        :return: Slot count, total mana held and cast counters.
+        """
+        return {
+            "players": len(self.reserves),
+            "total_mana": sum(self.reserves),
+            "casts_resolved": self.casts_resolved,
+            "casts_failed": self.casts_failed
+        }
@@ -1,5 +1,77 @@
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+from ex1.Deck import Deck
 from ex3.GameStrategy import GameStrategy
 
+# (cost, value, count) for every distinct kind of card in hand.
+HandKey = Tuple[Tuple[int, int, int], ...]
+# (cost, value) of every card in hand, in hand order.
+HandEntries = Tuple[Tuple[int, int], ...]
+
+
+@lru_cache(maxsize=65536)
+def _best_counts(groups: HandKey, budget: int) -> Tuple[int, ...]:
+    """
+    Solve the bounded knapsack over a hand for a mana budget.
+
+    Maximizes total value, then mana spent. Results are memoized on the
+    multiset of (cost, value) in hand, so equivalent hands are solved
+    once whatever their card order.
+
+    :param groups: Sorted (cost, value, count) triples.
+    :param budget: Mana available this turn.
+    :return: How many cards of each group to play.
+    """
+    # best[b] = (value, mana spent, counts) using at most b mana
+    best: List[Tuple[int, int, Tuple[int, ...]]] = [(0, 0, ())] * (budget + 1)
+    for cost, value, count in groups:
+        new_best = []
+        for b in range(budget + 1):
+            prev_value, prev_mana, prev_counts = best[b]
+            choice = (prev_value, prev_mana, prev_counts + (0,))
+            k = 1
+            while k <= count and k * cost <= b:
+                prev_value, prev_mana, prev_counts = best[b - k * cost]
+                option = (prev_value + k * value, prev_mana + k * cost)
+                if option > choice[:2]:
+                    choice = option + (prev_counts + (k,),)
+                k += 1
+            new_best.append(choice)
+        best = new_best
+    return best[budget][2]
+
+
+@lru_cache(maxsize=65536)
+def _best_plays(entries: HandEntries, budget: int) -> Tuple[int, ...]:
+    """
+    Choose which cards of a hand to play for a mana budget.
+
+    Memoized on the exact hand, so a repeated hand costs one lookup;
+    the knapsack itself is shared by every ordering of the same cards
+    through _best_counts().
+
+    :param entries: (cost, value) of each card, in hand order.
+    :param budget: Mana available this turn.
+    :return: Positions of the cards to play, in hand order.
+    """
+    counts: Dict[Tuple[int, int], int] = {}
+    for entry in entries:
+        counts[entry] = counts.get(entry, 0) + 1
+    groups = tuple(sorted(
+        (cost, value, count) for (cost, value), count in counts.items()
+    ))
+    chosen = _best_counts(groups, budget)
+
+    remaining = {
+        (cost, value): k for (cost, value, _), k in zip(groups, chosen)
+    }
+    plays = []
+    for index, entry in enumerate(entries):
+        if remaining[entry]:
+            remaining[entry] -= 1
+            plays.append(index)
+    return tuple(plays)
+
 
 class AggressiveStrategy(GameStrategy):
     """
@@ -7,6 +79,8 @@ class AggressiveStrategy(GameStrategy):
     and playing low-cost cards early.
     """
 
+    DEFAULT_MANA = 5
+
     def get_strategy_name(self) -> str:
         """
         Return the unique name of this strategy.
@@ -26,26 +100,85 @@ class AggressiveStrategy(GameStrategy):
             return ["Enemy Player"]
         return available_targets
 
-    def execute_turn(self, hand: list, battlefield: list) -> dict:
+    @staticmethod
+    def card_value(card: Any) -> int:
+        """
+        Damage a card contributes this turn when played.
+
+        :param card: A card from the hand.
+        :return: Creature attack, spell damage, or 0 for anything else.
+        """
+        card_type = Deck.card_type(card)
+        if card_type == "creatures":
+            return card.attack
+        if card_type == "spells":
+            return card.damage
+        return 0
+
+    def select_plays(
+        self, hand: list, battlefield: list,
+        game_state: Optional[Dict[str, Any]] = None
+    ) -> Sequence[int]:
+        """
+        Choose the hand positions to play this turn.
+
+        Picks the subset of the hand that deals the most damage within
+        the available mana (spending as much mana as possible on ties).
+
+        :param hand: List of Card objects currently in hand.
+        :param battlefield: List of cards currently on the field.
+        :param game_state: Current game status; its 'mana' entry is the
+                           budget (DEFAULT_MANA if missing).
+        :return: Hand indices of the cards to play, in hand order.
+        """
+        mana_limit = self.DEFAULT_MANA
+        if game_state is not None:
+            mana_limit = game_state.get("mana", mana_limit)
+        # card_value() inlined: this runs for every card, every turn.
+        entries = []
+        for card in hand:
+            card_type = getattr(card, "TYPE_TAG", None)
+            if card_type == "creatures":
+                entries.append((card.cost, card.attack))
+            elif card_type == "spells":
+                entries.append((card.cost, card.damage))
+            else:
+                entries.append((card.cost, 0))
+        return _best_plays(tuple(entries), max(0, mana_limit))
+
+    def execute_turn(
+        self, hand: list, battlefield: list,
+        game_state: Optional[Dict[str, Any]] = None
+    ) -> dict:
         """
         Execute a game turn based on aggressive logic.
 
+        Plays the cards chosen by select_plays(), then attacks with the
+        whole battlefield.
+
         :param hand: List of Card objects currently in hand.
         :param battlefield: List of cards currently on the field.
+        :param game_state: Current game status; its 'mana' entry is the
+                           budget (DEFAULT_MANA if missing).
         :return: A dictionary containing the summary of actions taken.
         """
+        card_value = self.card_value
         played = []
         mana_used = 0
-        mana_limit = 5
+        damage = 0
+        for index in self.select_plays(hand, battlefield, game_state):
+            card = hand[index]
+            played.append(card.name)
+            mana_used += card.cost
+            damage += card_value(card)
 
-        for card in hand:
-            if mana_used + card.cost <= mana_limit:
-                played.append(card.name)
-                mana_used += card.cost
+        for card in battlefield:
+            if Deck.card_type(card) == "creatures":
+                damage += card.attack
 
         return {
             "cards_played": played,
             "mana_used": mana_used,
             "targets_attacked": self.prioritize_targets(["Enemy Player"]),
-            "damage_dealt": 8
+            "damage_dealt": damage
         }
@@ -0,0 +1,297 @@
+import mmap
+import os
+import struct
+from typing import Dict, Any, Iterable, List, Tuple, Type
+from ex0.Card import Card
+from ex0.CardRegistry import CardRegistry
+
+_HEADER = struct.Struct("<8sIII4x")
+_RECORD = struct.Struct("<BxhIIIIii")
+_MAGIC = b"DDCAT001"
+_NO_STRING = 0xFFFFFFFF
+
+Template = Tuple[Type[Card], Tuple[Any, ...]]
+
+
+class CardCatalog:
+    """
+    Read-only card catalog stored in one binary file and read via mmap.
+
+    The file holds, after a fixed header:
+
+    - one fixed-width record per card (kind, cost, string ids of its id,
+      name, rarity and effect text, and two integer stats);
+    - two indexes of record numbers, sorted by card id and by name;
+    - the offsets of every interned string, then the UTF-8 string blob.
+
+    Opening a catalog only maps the file: templates are decoded on
+    demand, by id or by name, with binary searches over the indexes.
+    """
+
+    # Card kinds, by their record code, named after CardRegistry tags.
+    KINDS = ("creatures", "spells", "artifacts", "elite", "tournament")
+
+    # Constructor arguments of each kind after (name, cost, rarity);
+    # 'effect' is read from the text field, the rest from the stats.
+    LAYOUTS: Dict[str, Tuple[str, ...]] = {
+        "creatures": ("attack", "health"),
+        "spells": ("effect",),
+        "artifacts": ("durability", "effect"),
+        "elite": ("attack", "mana"),
+        "tournament": ("attack",),
+    }
+
+    def __init__(self, path: str):
+        """
+        Map a catalog file.
+
+        :param path: Path of a file written by CardCatalog.build().
+        :raises ValueError: If the file is not a card catalog.
+        """
+        self.path = path
+        with open(path, "rb") as source:
+            if os.fstat(source.fileno()).st_size < _HEADER.size:
+                raise ValueError("Not a card catalog")
+            self._mapped = mmap.mmap(source.fileno(), 0,
+                                     access=mmap.ACCESS_READ)
+        magic, count, string_count, _ = (
+            _HEADER.unpack_from(self._mapped))
+        if magic != _MAGIC:
+            self._mapped.close()
+            raise ValueError("Not a card catalog")
+        self._count = count
+        view = memoryview(self._mapped)
+        offset = _HEADER.size + count * _RECORD.size
+        self._by_id = view[offset:offset + 4 * count].cast("I")
+        offset += 4 * count
+        self._by_name = view[offset:offset + 4 * count].cast("I")
+        offset += 4 * count
+        self._offsets = view[
+            offset:offset + 4 * (string_count + 1)].cast("I")
+        self._blob = offset + 4 * (string_count + 1)
+        self._views = [self._by_id, self._by_name, self._offsets, view]
+
+    def __len__(self) -> int:
+        """
+        Return the number of cards in the catalog.
+        """
+        return self._count
+
+    def __contains__(self, card_id: object) -> bool:
+        """
+        Check whether a card id is in the catalog.
+        """
+        return isinstance(card_id, str) and self._find(
+            self._by_id, 2, card_id) is not None
+
+    def __enter__(self) -> "CardCatalog":
+        """
+        Return the catalog itself.
+        """
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """
+        Unmap the catalog.
+        """
+        self.close()
+
+    def close(self) -> None:
+        """
+        Unmap the catalog file.
+        """
+        for view in self._views:
+            view.release()
+        self._views = []
+        self._mapped.close()
+
+    def _string(self, string_id: int) -> str:
+        """
+        Decode one interned string.
+        """
+        offsets = self._offsets
+        start = self._blob + offsets[string_id]
+        end = self._blob + offsets[string_id + 1]
+        return str(self._mapped[start:end], "utf-8")
+
+    def _record(self, number: int) -> Tuple[int, ...]:
+        """
+        Unpack one record: (kind, cost, id, name, rarity, text, stat1,
+        stat2), with strings as string ids.
+        """
+        return _RECORD.unpack_from(
+            self._mapped, _HEADER.size + number * _RECORD.size)
+
+    def _find(self, index: memoryview, field: int, key: str) -> Any:
+        """
+        Binary search an index for the first record whose string field
+        equals key.
+
+        :param index: Record numbers sorted by that field.
+        :param field: Position of the string id in a record tuple.
+        :param key: The string to look for.
+        :return: The record number, or None if no record matches.
+        """
+        target = key.encode()
+        mapped = self._mapped
+        offsets = self._offsets
+        blob = self._blob
+        low, high = 0, len(index)
+        while low < high:
+            middle = (low + high) // 2
+            string_id = self._record(index[middle])[field]
+            start = blob + offsets[string_id]
+            if mapped[start:blob + offsets[string_id + 1]] < target:
+                low = middle + 1
+            else:
+                high = middle
+        if low == len(index):
+            return None
+        number = index[low]
+        if self._string(self._record(number)[field]) != key:
+            return None
+        return number
+
+    def _number(self, card_id: str) -> int:
+        """
+        Return the record number of a card id.
+
+        :raises KeyError: If the id is not in the catalog.
+        """
+        number = self._find(self._by_id, 2, card_id)
+        if number is None:
+            raise KeyError(f"Card {card_id} not in catalog")
+        return number
+
+    def _template(self, number: int) -> Template:
+        """
+        Decode the template of one record.
+        """
+        kind, cost, _, name, rarity, text, stat1, stat2 = (
+            self._record(number))
+        tag = self.KINDS[kind]
+        args: List[Any] = [self._string(name), cost, self._string(rarity)]
+        stats = iter((stat1, stat2))
+        for field in self.LAYOUTS[tag]:
+            if field == "effect":
+                args.append(self._string(text))
+            else:
+                args.append(next(stats))
+        return CardRegistry.resolve(tag), tuple(args)
+
+    def kind(self, card_id: str) -> str:
+        """
+        Return the kind (CardRegistry tag) of a catalog card.
+
+        :param card_id: The card id.
+        :raises KeyError: If the id is not in the catalog.
+        """
+        return self.KINDS[self._record(self._number(card_id))[0]]
+
+    def template(self, card_id: str) -> Template:
+        """
+        Return the template of a card: its class and constructor args.
+
+        :param card_id: The card id.
+        :raises KeyError: If the id is not in the catalog.
+        """
+        return self._template(self._number(card_id))
+
+    def template_by_name(self, name: str) -> Template:
+        """
+        Return the template of the first card with a given name.
+
+        :param name: The card name.
+        :raises KeyError: If no card has that name.
+        """
+        number = self._find(self._by_name, 3, name)
+        if number is None:
+            raise KeyError(f"No card named {name} in catalog")
+        return self._template(number)
+
+    def create(self, card_id: str) -> Card:
+        """
+        Build a new card from its catalog template.
+
+        :param card_id: The card id.
+        :raises KeyError: If the id is not in the catalog.
+        """
+        cls, args = self.template(card_id)
+        return cls(*args)
+
+    @classmethod
+    def build(cls, rows: Iterable[Dict[str, Any]], path: str) -> int:
+        """
+        Write a catalog file from card definitions.
+
+        Each row needs 'id', 'type' (a KINDS tag), 'name', 'cost' and
+        'rarity', plus the LAYOUTS fields of its type. Values may be
+        strings, as read from a CSV file.
+
+        :param rows: The card definitions.
+        :param path: Output path; written atomically.
+        :return: The number of cards written.
+        :raises ValueError: If a row has an unknown type, a missing
+                            field, a value out of range for its field
+                            or a duplicate id.
+        """
+        strings: Dict[str, int] = {}
+
+        def intern(text: str) -> int:
+            string_id = strings.get(text)
+            if string_id is None:
+                string_id = strings[text] = len(strings)
+            return string_id
+
+        records = []
+        packed: List[bytes] = []
+        seen = set()
+        for row in rows:
+            try:
+                tag = row["type"]
+                kind = cls.KINDS.index(tag)
+                card_id = str(row["id"])
+                numbers = [
+                    int(row[field]) for field in cls.LAYOUTS[tag]
+                    if field != "effect"
+                ]
+                text = (intern(str(row["effect"]))
+                        if "effect" in cls.LAYOUTS[tag] else _NO_STRING)
+                numbers += [0] * (2 - len(numbers))
+                record = (kind, int(row["cost"]), intern(card_id),
+                          intern(str(row["name"])),
+                          intern(str(row["rarity"])), text, *numbers)
+                # Packing checks every value against its field's range.
+                packed.append(_RECORD.pack(*record))
+            except (KeyError, ValueError, struct.error) as error:
+                raise ValueError(
+                    f"Invalid card definition {row!r}: {error}") from None
+            if card_id in seen:
+                raise ValueError(f"Duplicate card id {card_id}")
+            seen.add(card_id)
+            records.append(record)
+
+        encoded = [text.encode() for text in strings]
+        offsets = [0]
+        for data in encoded:
+            offsets.append(offsets[-1] + len(data))
+        by_id = sorted(range(len(records)),
+                       key=lambda number: encoded[records[number][2]])
+        by_name = sorted(range(len(records)),
+                         key=lambda number: encoded[records[number][3]])
+
+        tmp_path = path + ".tmp"
+        try:
+            with open(tmp_path, "wb") as out:
+                out.write(_HEADER.pack(
+                    _MAGIC, len(records), len(encoded), offsets[-1]))
+                out.write(b"".join(packed))
+                for values in (by_id, by_name, offsets):
+                    out.write(struct.pack(f"<{len(values)}I", *values))
+                out.write(b"".join(encoded))
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return len(records)
@@ -1,5 +1,5 @@
 from abc import ABC
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from ex0.Card import Card
 
 
@@ -38,12 +38,15 @@ class CardFactory(ABC):
         """
         raise NotImplementedError()
 
-    def create_themed_deck(self, size: int) -> Dict[str, Any]:
+    def create_themed_deck(
+        self, size: int, seed: Optional[int] = None
+    ) -> Any:
         """
         Generate a complete themed deck of a specific size.
 
         :param size: Number of cards to include in the deck.
-        :return: A dictionary containing the deck collection.
+        :param seed: Optional seed making the generated deck reproducible.
+        :return: The generated deck collection.
         :raises NotImplementedError: If the subclass does not implement this.
         """
         raise NotImplementedError()
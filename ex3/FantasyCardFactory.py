@@ -1,16 +1,144 @@
-from typing import Dict, Any, List
+import random
+from typing import (
+    Dict, Any, List, Tuple, Type, Optional, Union,
+    TYPE_CHECKING, cast
+)
+from ex0.Card import Card
+from ex0.CardRegistry import CardRegistry
 from ex3.CardFactory import CardFactory
-from ex0.CreatureCard import CreatureCard
-from ex1.SpellCard import SpellCard
-from ex1.ArtifactCard import ArtifactCard
+from ex1.Deck import Deck
+
+if TYPE_CHECKING:
+    from ex0.CreatureCard import CreatureCard
+    from ex1.ArtifactCard import ArtifactCard
+    from ex1.CardTable import CardTable
+    from ex1.SpellCard import SpellCard
+    from ex3.CardCatalog import CardCatalog
+
+Template = Tuple[Type[Card], Tuple[Any, ...]]
+
+_SLOTS: Dict[type, Tuple[str, ...]] = {}
+
+
+def _clone(card: Card) -> Card:
+    """
+    Make a shallow copy of a card, slot by slot.
+
+    The slot names of each class are collected once. Unlike a
+    constructor call, a copy skips argument validation, and it is
+    cheaper than copy.copy(), which goes through __reduce_ex__.
+
+    :param card: The card to copy.
+    :return: A new card of the same class with the same field values.
+    """
+    cls = type(card)
+    slots = _SLOTS.get(cls)
+    if slots is None:
+        names = []
+        for klass in reversed(cls.__mro__):
+            declared = klass.__dict__.get("__slots__", ())
+            for name in (declared,) if isinstance(declared, str) \
+                    else declared:
+                if name not in ("__dict__", "__weakref__"):
+                    names.append(name)
+        slots = _SLOTS[cls] = tuple(names)
+    copy = object.__new__(cls)
+    for name in slots:
+        setattr(copy, name, getattr(card, name))
+    if cls.__dictoffset__:
+        copy.__dict__.update(card.__dict__)
+    return copy
 
 
 class FantasyCardFactory(CardFactory):
     """
     Concrete factory for creating Fantasy-themed cards.
+
+    Each requested card is built once from its template (class plus
+    constructor arguments) and kept as a prototype in a bounded LRU
+    cache; later creations return slot-by-slot copies of the prototype.
+
+    With a CardCatalog, any catalog card can be created by id or name,
+    and catalog entries whose ids match the built-in templates ('dragon',
+    'goblin', 'lightning', 'mana_ring') replace them when they are of
+    the same kind. A pickled factory reopens its catalog by path.
     """
 
-    def create_creature(self, name_or_power: Any) -> CreatureCard:
+    # CardRegistry tag of each cache key kind.
+    KIND_TAGS = {
+        "creature": "creatures",
+        "spell": "spells",
+        "artifact": "artifacts",
+    }
+
+    # Templates a themed deck draws from, with the stats bucket of each.
+    THEMED_DECK_POOL = (
+        (("creature", "dragon"), "creatures"),
+        (("creature", "goblin"), "creatures"),
+        (("spell", "lightning"), "spells"),
+        (("artifact", "mana_ring"), "artifacts"),
+    )
+
+    def __init__(self, cache_size: int = 128,
+                 catalog: Optional["CardCatalog"] = None):
+        """
+        Initialize the factory with an empty prototype cache.
+
+        :param cache_size: Maximum number of prototypes kept in the cache.
+        :param catalog: Optional catalog of card templates.
+        :raises ValueError: If cache_size is not a positive integer.
+        """
+        if not isinstance(cache_size, int) or cache_size < 1:
+            raise ValueError("Cache size must be a positive integer")
+        self.cache_size = cache_size
+        self.catalog = catalog
+        # Cache key -> prototype, least recently used first.
+        self._prototypes: Dict[Tuple[str, str], Card] = {}
+        self.cache_hits: int = 0
+        self.cache_misses: int = 0
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Pickle the factory, with its memory-mapped catalog as a path.
+        """
+        state = dict(self.__dict__)
+        if self.catalog is not None:
+            state["catalog"] = self.catalog.path
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """
+        Restore a pickled factory, reopening its catalog file.
+
+        :raises OSError: If the catalog file cannot be opened.
+        """
+        if state["catalog"] is not None:
+            from ex3.CardCatalog import CardCatalog
+            state["catalog"] = CardCatalog(state["catalog"])
+        self.__dict__.update(state)
+
+    def _create(self, key: Tuple[str, str]) -> Card:
+        """
+        Copy the cached prototype of a card, building it on a miss.
+
+        :param key: Cache key (card kind, template name).
+        :return: A new Card instance equal to the prototype.
+        """
+        prototypes = self._prototypes
+        prototype = prototypes.pop(key, None)
+        if prototype is None:
+            self.cache_misses += 1
+            cls, args = self._resolve(key)
+            prototype = cls(*args)
+            if len(prototypes) >= self.cache_size:
+                del prototypes[next(iter(prototypes))]
+        else:
+            self.cache_hits += 1
+        # Re-inserting moves the key to the most recently used end.
+        prototypes[key] = prototype
+        return _clone(prototype)
+
+    def create_creature(self, name_or_power: Any) -> "CreatureCard":
         """
         Create a fantasy creature card based on a keyword or power level.
 
@@ -18,35 +146,165 @@ class FantasyCardFactory(CardFactory):
         :return: A CreatureCard instance (Dragon or Goblin).
         """
         if name_or_power == "dragon":
-            return CreatureCard("Fire Dragon", 5, "Legendary", 7, 5)
-        return CreatureCard("Goblin Warrior", 2, "Common", 2, 1)
+            return cast("CreatureCard", self._create(("creature", "dragon")))
+        return cast("CreatureCard", self._create(("creature", "goblin")))
 
-    def create_spell(self, name_or_power: Any) -> SpellCard:
+    def create_spell(self, name_or_power: Any) -> "SpellCard":
         """
         Create a fantasy-themed spell card.
 
         :param name_or_power: The type of spell to create.
         :return: A SpellCard instance.
         """
-        return SpellCard("Lightning Bolt", 3, "Common", "Deal 3 damage")
+        return cast("SpellCard", self._create(("spell", "lightning")))
 
-    def create_artifact(self, name_or_power: Any) -> ArtifactCard:
+    def create_artifact(self, name_or_power: Any) -> "ArtifactCard":
         """
         Create a fantasy-themed artifact card.
 
         :param name_or_power: The type of artifact to create.
         :return: An ArtifactCard instance.
         """
-        return ArtifactCard("Mana Ring", 2, "Rare", 5, "+1 mana")
+        return cast("ArtifactCard", self._create(("artifact", "mana_ring")))
+
+    def create_card(self, card_id: str) -> Card:
+        """
+        Create any card of the catalog from its id.
+
+        :param card_id: The catalog id of the card.
+        :return: A new card of the catalog entry's class.
+        :raises KeyError: If there is no catalog or the id is not in it.
+        """
+        return self._create(("id", card_id))
+
+    def create_card_by_name(self, name: str) -> Card:
+        """
+        Create the first catalog card with a given name.
+
+        :param name: The card name.
+        :return: A new card of the catalog entry's class.
+        :raises KeyError: If there is no catalog or no card has the name.
+        """
+        return self._create(("name", name))
+
+    def _resolve(self, key: Tuple[str, str]) -> Template:
+        """
+        Resolve the template behind a cache key.
+
+        Card classes come from the CardRegistry, so each one is only
+        imported once the factory first builds that kind of card.
+        A catalog entry only replaces a built-in template of its kind:
+        e.g. a spell with id 'dragon' does not turn dragons into spells.
+
+        :param key: Cache key (card kind, template name), or ('id', id)
+                    and ('name', name) for catalog lookups.
+        :return: The card class and its constructor arguments.
+        :raises KeyError: If a catalog lookup fails.
+        """
+        kind, name = key
+        catalog = self.catalog
+        if kind in ("id", "name"):
+            if catalog is None:
+                raise KeyError("Factory has no card catalog")
+            if kind == "id":
+                return catalog.template(name)
+            return catalog.template_by_name(name)
+        if (catalog is not None and name in catalog
+                and catalog.kind(name) == self.KIND_TAGS[kind]):
+            return catalog.template(name)
+        if kind == "creature":
+            creature = CardRegistry.resolve("creatures")
+            if name == "dragon":
+                return creature, ("Fire Dragon", 5, "Legendary", 7, 5)
+            return creature, ("Goblin Warrior", 2, "Common", 2, 1)
+        if kind == "spell":
+            return CardRegistry.resolve("spells"), (
+                "Lightning Bolt", 3, "Common", "Deal 3 damage")
+        return CardRegistry.resolve("artifacts"), (
+            "Mana Ring", 2, "Rare", 5, "+1 mana")
 
-    def create_themed_deck(self, size: int) -> Dict[str, Any]:
+    def get_cache_stats(self) -> Dict[str, int]:
         """
-        Return a summary of a generated fantasy-themed deck.
+        Retrieve the prototype cache counters.
+
+        :return: A dictionary with hits, misses, size and max size.
+        """
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "size": len(self._prototypes),
+            "max_size": self.cache_size
+        }
+
+    def clear_cache(self) -> None:
+        """
+        Drop every cached prototype and reset the counters.
+        """
+        self._prototypes.clear()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def create_themed_deck(
+        self, size: int,
+        seed: Optional[int] = None,
+        type_weights: Optional[Dict[str, float]] = None,
+        rarity_weights: Optional[Dict[str, float]] = None,
+        as_table: bool = False
+    ) -> Union[Deck, "CardTable"]:
+        """
+        Generate a fantasy-themed deck of the requested size in one batch.
+
+        Each template in THEMED_DECK_POOL is weighted by its type weight
+        (shared evenly between templates of that type) times its rarity
+        weight, then all picks are drawn with a single RNG call.
 
         :param size: The number of cards in the deck.
-        :return: A dictionary describing the themed deck.
+        :param seed: Seed for a private RNG, for reproducible decks.
+        :param type_weights: Relative weight of 'creatures', 'spells' and
+                             'artifacts' (all equal by default).
+        :param rarity_weights: Relative weight of each rarity (all equal by
+                               default; unlisted rarities are excluded).
+        :param as_table: If True, return a CardTable instead of a Deck.
+        :return: The generated Deck or CardTable.
+        :raises ValueError: If size or any weight is negative, or if every
+                            weight is zero.
         """
-        return {"theme": "Fantasy", "size": size}
+        if not isinstance(size, int) or size < 0:
+            raise ValueError("Deck size must be a non-negative integer")
+        if type_weights is None:
+            type_weights = {"creatures": 1, "spells": 1, "artifacts": 1}
+        for given in (type_weights, rarity_weights or {}):
+            if any(weight < 0 for weight in given.values()):
+                raise ValueError("Deck weights must not be negative")
+
+        templates = [self._resolve(key) for key, _ in self.THEMED_DECK_POOL]
+        per_type: Dict[str, int] = {}
+        for _, bucket in self.THEMED_DECK_POOL:
+            per_type[bucket] = per_type.get(bucket, 0) + 1
+        weights = []
+        for (_, bucket), (_, args) in zip(self.THEMED_DECK_POOL, templates):
+            weight = type_weights.get(bucket, 0) / per_type[bucket]
+            if rarity_weights is not None:
+                weight *= rarity_weights.get(args[2], 0)
+            weights.append(weight)
+        if size and not any(weights):
+            raise ValueError("Deck weights exclude every card template")
+
+        # choices() rejects all-zero weights even when k is 0.
+        picks: List[int] = []
+        if size:
+            rng = random.Random(seed)
+            picks = rng.choices(range(len(templates)), weights, k=size)
+
+        prototypes = [cls(*args) for cls, args in templates]
+        if as_table:
+            from ex1.CardTable import CardTable
+            table = CardTable()
+            table.extend_from_prototypes(prototypes, picks)
+            return table
+        deck = Deck()
+        deck.add_cards([_clone(prototypes[i]) for i in picks])
+        return deck
 
     def get_supported_types(self) -> Dict[str, List[str]]:
         """
@@ -1,6 +1,62 @@
-from typing import Dict, Any, Optional
+import random
+from collections import Counter
+from typing import Dict, Any, Optional, List, Tuple, TYPE_CHECKING, cast
+from ex1.Deck import Deck
 from ex3.CardFactory import CardFactory
 from ex3.GameStrategy import GameStrategy
+from ex3.PlayerState import PlayerState
+
+if TYPE_CHECKING:
+    from ex0.CreatureCard import CreatureCard
+    from ex1.SpellCard import SpellCard
+
+ChunkResult = Tuple[int, int, int, int, Counter, Counter]
+
+
+def _game_seed(seed: int, index: int) -> int:
+    """
+    Derive the seed of one game from the batch seed and the game index.
+
+    Seeds only depend on the index, never on how games are split into
+    chunks, which keeps batch results independent of the worker count.
+    """
+    return (seed << 32) | index
+
+
+def _run_chunk(
+    factory: CardFactory, strategy_a: GameStrategy,
+    strategy_b: GameStrategy, seed: int, start: int, stop: int,
+    n_turns: int, deck_size: int
+) -> ChunkResult:
+    """
+    Play games start..stop-1 of a batch in a fresh engine.
+
+    Strategy A moves first in even games and second in odd ones.
+
+    :return: Wins of A, wins of B, draws, total turns, and the per-game
+             damage histograms of A and B.
+    """
+    engine = GameEngine()
+    wins_a = wins_b = draws = total_turns = 0
+    damage_a: Counter = Counter()
+    damage_b: Counter = Counter()
+    for index in range(start, stop):
+        a_first = not index & 1
+        engine.configure_engine(factory, strategy_a if a_first else strategy_b)
+        result = engine.simulate_game(
+            n_turns, deck_size, _game_seed(seed, index),
+            opponent_strategy=strategy_b if a_first else strategy_a)
+        a_seat = 0 if a_first else 1
+        total_turns += result["turns"]
+        damage_a[result["damage"][a_seat]] += 1
+        damage_b[result["damage"][a_seat ^ 1]] += 1
+        if result["winner"] is None:
+            draws += 1
+        elif result["winner"] == a_seat:
+            wins_a += 1
+        else:
+            wins_b += 1
+    return wins_a, wins_b, draws, total_turns, damage_a, damage_b
 
 
 class GameEngine:
@@ -9,6 +65,12 @@ class GameEngine:
     and gameplay logic via a Strategy.
     """
 
+    STARTING_LIFE = 20
+    OPENING_HAND = 3
+    MAX_MANA = 10
+    HAND_LIMIT = 10
+    BOARD_LIMIT = 7
+
     def __init__(self):
         """
         Initialize the GameEngine with no configuration.
@@ -16,6 +78,12 @@ class GameEngine:
         self.factory: Optional[CardFactory] = None
         self.strategy: Optional[GameStrategy] = None
         self.cards_created: int = 0
+        self.turns_simulated: int = 0
+        self.total_damage: int = 0
+        self.games_played: int = 0
+        self._players: List[PlayerState] = []
+        self._deck_size: int = 0
+        self._turn_state: Dict[str, Any] = {}
 
     def configure_engine(
         self, factory: CardFactory, strategy: GameStrategy
@@ -26,6 +94,8 @@ class GameEngine:
         :param factory: The CardFactory implementation to use.
         :param strategy: The GameStrategy implementation to use.
         """
+        if factory is not self.factory:
+            self._players = []
         self.factory = factory
         self.strategy = strategy
 
@@ -46,11 +116,224 @@ class GameEngine:
         self.cards_created += 3
         hand = [c1, c2, c3]
         turn_actions = self.strategy.execute_turn(hand, [])
+        self.turns_simulated += 1
+        self.total_damage += turn_actions.get("damage_dealt", 0)
         return {
             "strategy": self.strategy.get_strategy_name(),
             "actions": turn_actions
         }
 
+    def simulate_game(
+        self, n_turns: int, deck_size: int = 30, seed: Optional[int] = None,
+        opponent_strategy: Optional[GameStrategy] = None
+    ) -> Dict[str, Any]:
+        """
+        Play one two-player game for at most n_turns turns.
+
+        Both players use the configured strategy and a themed deck from
+        the configured factory. Each turn the active player gains mana,
+        draws, plays the cards chosen by the strategy that it can afford,
+        then attacks with its whole battlefield. The game stops early as
+        soon as a player's life drops to zero.
+
+        :param n_turns: Maximum number of turns (both players combined).
+        :param deck_size: Number of cards in each player's deck.
+        :param seed: Seed making decks and shuffles reproducible.
+        :param opponent_strategy: Strategy of the second player, if it
+                                  differs from the configured one.
+        :return: A dictionary summarizing the game.
+        :raises AttributeError: If factory or strategy is not configured.
+        :raises ValueError: If n_turns is negative.
+        """
+        if not self.factory or not self.strategy:
+            raise AttributeError(
+                "Engine must be configured before simulation.")
+        if not isinstance(n_turns, int) or n_turns < 0:
+            raise ValueError("Number of turns must be a non-negative integer")
+
+        rng = random.Random(seed)
+        if not self._players or self._deck_size != deck_size:
+            self._players = [
+                PlayerState(self._build_library(deck_size, index))
+                for index in range(2)
+            ]
+            self._deck_size = deck_size
+        players = self._players
+        for player in players:
+            player.reset(rng, self.STARTING_LIFE, self.OPENING_HAND)
+        strategies = (self.strategy, opponent_strategy or self.strategy)
+
+        winner: Optional[int] = None
+        turns = 0
+        while turns < n_turns:
+            active = turns & 1
+            self._play_turn(
+                strategies[active], players[active], players[active ^ 1])
+            turns += 1
+            if players[active ^ 1].life <= 0:
+                winner = active
+                break
+
+        self.turns_simulated += turns
+        self.games_played += 1
+        return {
+            "strategy": self.strategy.get_strategy_name(),
+            "turns": turns,
+            "winner": winner,
+            "life": [p.life for p in players],
+            "damage": [p.damage_dealt for p in players]
+        }
+
+    def run_simulations(
+        self, factory: CardFactory, strategy_a: GameStrategy,
+        strategy_b: GameStrategy, n_games: int, workers: int = 1,
+        seed: Optional[int] = None, n_turns: int = 100,
+        deck_size: int = 30, chunk_size: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Estimate the win rate of strategy A against strategy B.
+
+        Games are split into chunks and fanned out over a process pool.
+        Every game is seeded from (seed, game index) and chunk results
+        are merged in submission order, so the outcome for a given seed
+        does not depend on the number of workers or the chunk size.
+
+        :param factory: Factory building both players' decks.
+        :param strategy_a: Strategy of the first contender.
+        :param strategy_b: Strategy of the second contender.
+        :param n_games: Number of games to play.
+        :param workers: Number of worker processes (1 runs in-process).
+        :param seed: Batch seed (random if omitted, reported back).
+        :param n_turns: Turn cap of each game.
+        :param deck_size: Number of cards in each deck.
+        :param chunk_size: Games per submitted task (about 4 per worker
+                           by default).
+        :return: Win counts, win rate, average game length and the
+                 per-game damage distributions of both strategies.
+        :raises ValueError: If n_games is negative or workers < 1.
+        """
+        if not isinstance(n_games, int) or n_games < 0:
+            raise ValueError("Number of games must be a non-negative integer")
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError("Number of workers must be a positive integer")
+        if seed is None:
+            seed = random.getrandbits(32)
+        if chunk_size is None:
+            chunk_size = max(1, -(-n_games // (workers * 4)))
+        bounds = [
+            (start, min(start + chunk_size, n_games))
+            for start in range(0, n_games, chunk_size)
+        ]
+        args = (factory, strategy_a, strategy_b, seed)
+        tail = (n_turns, deck_size)
+
+        if workers == 1:
+            chunks = [_run_chunk(*args, lo, hi, *tail) for lo, hi in bounds]
+        else:
+            # Imported here: concurrent.futures is slow to import and only
+            # parallel runs need it.
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(_run_chunk, *args, lo, hi, *tail)
+                    for lo, hi in bounds
+                ]
+                chunks = [future.result() for future in futures]
+
+        wins_a = wins_b = draws = total_turns = 0
+        damage_a: Counter = Counter()
+        damage_b: Counter = Counter()
+        for chunk in chunks:
+            wins_a += chunk[0]
+            wins_b += chunk[1]
+            draws += chunk[2]
+            total_turns += chunk[3]
+            damage_a.update(chunk[4])
+            damage_b.update(chunk[5])
+
+        self.games_played += n_games
+        self.turns_simulated += total_turns
+        return {
+            "games": n_games,
+            "seed": seed,
+            "wins_a": wins_a,
+            "wins_b": wins_b,
+            "draws": draws,
+            "win_rate_a": wins_a / n_games if n_games else 0.0,
+            "avg_turns": total_turns / n_games if n_games else 0.0,
+            "damage_a": dict(sorted(damage_a.items())),
+            "damage_b": dict(sorted(damage_b.items()))
+        }
+
+    def _build_library(self, deck_size: int, deck_seed: int) -> list:
+        """
+        Generate one player's decklist from the configured factory.
+
+        Decklists are seeded by player index so they stay identical
+        across games and only the shuffles depend on the game seed.
+
+        :param deck_size: Number of cards in the decklist.
+        :param deck_seed: Seed passed to the factory.
+        :return: The list of generated cards.
+        :raises AttributeError: If no factory is configured.
+        :raises TypeError: If the factory does not produce an ex1.Deck.
+        """
+        if self.factory is None:
+            raise AttributeError(
+                "Engine must be configured before simulation.")
+        deck = self.factory.create_themed_deck(deck_size, seed=deck_seed)
+        if not isinstance(deck, Deck):
+            raise TypeError("Factory must build decks as ex1.Deck")
+        self.cards_created += len(deck)
+        return list(deck.cards)
+
+    def _play_turn(
+        self, strategy: GameStrategy,
+        player: PlayerState, opponent: PlayerState
+    ) -> None:
+        """
+        Run one turn for the active player against its opponent.
+
+        :param strategy: The strategy of the player taking the turn.
+        :param player: The state of the player taking the turn.
+        :param opponent: The state of the other player.
+        """
+        player.turns_taken += 1
+        mana = min(player.turns_taken, self.MAX_MANA)
+        hand = player.hand
+        if player.deck:
+            hand.append(player.draw_card())
+
+        turn_state = self._turn_state
+        turn_state["mana"] = mana
+        turn_state["life"] = player.life
+        turn_state["opponent_life"] = opponent.life
+        plays = strategy.select_plays(hand, player.battlefield, turn_state)
+        damage = 0
+        played = []
+        for index in plays:
+            card = hand[index]
+            if card.cost > mana:
+                continue
+            played.append(index)
+            mana -= card.cost
+            card_type = getattr(card, "TYPE_TAG", None)
+            if card_type == "spells":
+                damage += cast("SpellCard", card).damage
+            elif len(player.battlefield) < self.BOARD_LIMIT:
+                player.battlefield.append(card)
+                if card_type == "creatures":
+                    player.board_attack += cast("CreatureCard", card).attack
+        for index in sorted(played, reverse=True):
+            del hand[index]
+
+        damage += player.board_attack
+        opponent.life -= damage
+        player.damage_dealt += damage
+        self.total_damage += damage
+        if len(hand) > self.HAND_LIMIT:
+            del hand[:len(hand) - self.HAND_LIMIT]
+
     def get_engine_status(self) -> Dict[str, Any]:
         """
         Retrieve the current status and statistics of the engine.
@@ -61,8 +344,8 @@ class GameEngine:
             self.strategy.get_strategy_name() if self.strategy else None
         )
         return {
-            "turns_simulated": 1,
+            "turns_simulated": self.turns_simulated,
             "strategy_used": strategy_name,
-            "total_damage": 8,
+            "total_damage": self.total_damage,
             "cards_created": self.cards_created
         }
@@ -1,5 +1,5 @@
 from abc import ABC
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Sequence
 
 
 class GameStrategy(ABC):
@@ -8,18 +8,47 @@ class GameStrategy(ABC):
     """
 
     def execute_turn(
-        self, hand: List[Any], battlefield: List[Any]
+        self, hand: List[Any], battlefield: List[Any],
+        game_state: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Determine actions to take during a single game turn.
 
         :param hand: List of cards currently held by the player.
         :param battlefield: List of cards currently in play.
+        :param game_state: Current game status (e.g. available 'mana').
         :return: A dictionary describing the actions performed.
         :raises NotImplementedError: If not implemented by subclass.
         """
         raise NotImplementedError()
 
+    def select_plays(
+        self, hand: List[Any], battlefield: List[Any],
+        game_state: Optional[Dict[str, Any]] = None
+    ) -> Sequence[int]:
+        """
+        Choose the cards to play this turn, as positions in the hand.
+
+        Game loops call this instead of execute_turn() so they do not
+        have to find the played cards in the hand again by name. This
+        default maps the names reported by execute_turn() to the first
+        unused matching positions; subclasses can pick positions
+        directly (and must, if their execute_turn() calls this).
+
+        :param hand: List of cards currently held by the player.
+        :param battlefield: List of cards currently in play.
+        :param game_state: Current game status (e.g. available 'mana').
+        :return: Hand indices of the cards to play, in play order.
+        """
+        actions = self.execute_turn(hand, battlefield, game_state)
+        plays: List[int] = []
+        for name in actions.get("cards_played", ()):
+            for index, card in enumerate(hand):
+                if card.name == name and index not in plays:
+                    plays.append(index)
+                    break
+        return plays
+
     def get_strategy_name(self) -> str:
         """
         Retrieve the unique name identifier for the strategy.
@@ -0,0 +1,75 @@
+import random
+from typing import Any, List
+from ex0.Card import Card
+
+
+class PlayerState:
+    """
+    Mutable per-player game state reused from one game to the next.
+
+    The decklist (library) is fixed; reset() copies it into a plain
+    list draw pile and clears the hand and battlefield in place. Each
+    draw takes a random card from the pile (a single Fisher-Yates step,
+    in the same order as a lazily shuffled ex1.Deck with the same RNG),
+    so a game never shuffles or re-indexes the whole deck, and only
+    pays for the cards it actually draws.
+    """
+
+    __slots__ = (
+        "library", "deck", "rng", "hand", "battlefield",
+        "life", "turns_taken", "board_attack", "damage_dealt"
+    )
+
+    def __init__(self, library: List[Card]):
+        """
+        Initialize the state for a player using the given decklist.
+
+        :param library: The cards the player's deck is built from.
+        """
+        self.library = library
+        self.deck: List[Card] = list(library)
+        self.rng: Any = random
+        self.hand: List[Card] = []
+        self.battlefield: List[Card] = []
+        self.life = 0
+        self.turns_taken = 0
+        self.board_attack = 0
+        self.damage_dealt = 0
+
+    def reset(
+        self, rng: random.Random, starting_life: int, opening_hand: int
+    ) -> None:
+        """
+        Prepare the player for a new game.
+
+        :param rng: RNG used to draw from the decklist.
+        :param starting_life: Life total at the start of the game.
+        :param opening_hand: Number of cards drawn before the first turn.
+        """
+        self.deck[:] = self.library
+        self.rng = rng
+        self.hand.clear()
+        self.battlefield.clear()
+        self.life = starting_life
+        self.turns_taken = 0
+        self.board_attack = 0
+        self.damage_dealt = 0
+        hand = self.hand
+        for _ in range(min(opening_hand, len(self.deck))):
+            hand.append(self.draw_card())
+
+    def draw_card(self) -> Card:
+        """
+        Remove and return a random card of the draw pile.
+
+        :return: The Card instance drawn.
+        :raises IndexError: If the draw pile is empty.
+        """
+        deck = self.deck
+        if not deck:
+            raise IndexError("Cannot draw from an empty deck")
+        pick = self.rng.randrange(len(deck))
+        card = deck[pick]
+        deck[pick] = deck[-1]
+        deck.pop()
+        return card
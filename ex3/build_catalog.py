@@ -0,0 +1,52 @@
+"""
+Build a binary card catalog from a CSV or JSONL file.
+
+Usage:
+
+    python -m ex3.build_catalog SOURCE OUTPUT
+
+SOURCE is a .csv file with a header row, or a .jsonl file with one JSON
+object per line. Both use the fields described in CardCatalog.build():
+id, type, name, cost, rarity, and the layout fields of each type
+(attack, health, durability, mana, effect).
+"""
+import csv
+import json
+import sys
+from typing import Dict, Any, Iterator
+from ex3.CardCatalog import CardCatalog
+
+
+def read_rows(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the card definitions of a CSV or JSONL file.
+
+    :param path: Path of the source file.
+    :raises ValueError: If the file extension is not .csv or .jsonl.
+    """
+    if path.endswith(".csv"):
+        with open(path, newline="", encoding="utf-8") as source:
+            yield from csv.DictReader(source)
+    elif path.endswith(".jsonl"):
+        with open(path, encoding="utf-8") as source:
+            for line in source:
+                if line.strip():
+                    yield json.loads(line)
+    else:
+        raise ValueError(f"Unsupported catalog source: {path}")
+
+
+def main() -> None:
+    """
+    Build the catalog named on the command line.
+    """
+    if len(sys.argv) != 3:
+        print(__doc__.strip())
+        sys.exit(2)
+    source, output = sys.argv[1:]
+    count = CardCatalog.build(read_rows(source), output)
+    print(f"Wrote {count} cards to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+from typing import Dict
+
+
+class EloTable(Dict[int, int]):
+    """
+    Elo points a match winner takes from the loser, by rating gap.
+
+    The points only depend on the gap (winner rating minus loser
+    rating), so each value is computed on its first lookup and kept:
+    later lookups are plain dictionary hits.
+    """
+
+    def __init__(self, k_factor: int):
+        """
+        Create an empty table.
+
+        :param k_factor: Maximum points moved by a single match.
+        """
+        super().__init__()
+        self.k_factor = k_factor
+
+    def __missing__(self, rating_gap: int) -> int:
+        """
+        Compute and store the points for a new rating gap.
+
+        :param rating_gap: Winner rating minus loser rating.
+        :return: round(K * (1 - E)) with E the winner's expected score.
+        """
+        expected = 1 / (1 + 10 ** (-rating_gap / 400))
+        delta = self[rating_gap] = round(self.k_factor * (1 - expected))
+        return delta
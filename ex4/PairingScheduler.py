@@ -0,0 +1,170 @@
+from typing import Dict, Any, List, Optional, Set, Tuple, Iterator
+
+
+class PairingScheduler:
+    """
+    Swiss and round-robin pairing generator for a TournamentPlatform.
+
+    Swiss rounds walk entrants in rating order (the platform's sorted
+    leaderboard, so no sort is needed for the full registry) and pair
+    each one with the closest-rated waiting entrant it has not met yet,
+    looking at most WINDOW entrants back. Entrants left waiting have all
+    met each other; before two of them are paired for a rematch, they
+    and the last REPAIR_PAIRS pairs formed are re-paired without
+    rematches if possible. A round over n entrants costs O(n * WINDOW)
+    (plus a bounded search per forced rematch), or O(n log n) when an
+    explicit entrant list has to be sorted first.
+    """
+
+    WINDOW = 8
+    REPAIR_PAIRS = 4
+
+    def __init__(self, platform: Any):
+        """
+        Attach the scheduler to a platform.
+
+        :param platform: The TournamentPlatform whose cards are paired.
+        """
+        self.platform = platform
+        self.opponents: Dict[str, Set[str]] = {}
+        self.byes: Set[str] = set()
+        self.rounds_paired: int = 0
+
+    def _in_rating_order(self, entrants: Optional[List[str]]) -> List[str]:
+        """
+        Return entrant IDs sorted from highest to lowest rating.
+
+        :param entrants: Card IDs to pair, or None for every card.
+        """
+        if entrants is None:
+            return list(self.platform.ranked_ids())
+        registry = self.platform.registry
+        return sorted(entrants, key=lambda cid: -registry[cid].rating)
+
+    def swiss_round(
+        self, entrants: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Generate the next Swiss round and record it in the history.
+
+        With an odd number of entrants, the lowest-rated entrant who has
+        not had a bye yet sits out. Rematches are avoided whenever a
+        fresh opponent is within WINDOW places, or re-pairing the last
+        REPAIR_PAIRS pairs makes room for one; otherwise the two oldest
+        waiting entrants meet again.
+
+        :param entrants: Card IDs to pair, or None for every card.
+        :return: A dictionary with the 'pairs' to play and the 'bye'.
+        """
+        order = self._in_rating_order(entrants)
+        bye = None
+        if len(order) % 2:
+            bye_at = len(order) - 1
+            while bye_at >= 0 and order[bye_at] in self.byes:
+                bye_at -= 1
+            bye = order.pop(bye_at if bye_at >= 0 else len(order) - 1)
+            self.byes.add(bye)
+
+        opponents = self.opponents
+        empty: Set[str] = set()
+        waiting: List[str] = []
+        pairs: List[Tuple[str, str]] = []
+        for card_id in order:
+            met = opponents.get(card_id, empty)
+            for i in range(len(waiting) - 1, -1, -1):
+                if waiting[i] not in met:
+                    pairs.append((waiting.pop(i), card_id))
+                    break
+            else:
+                waiting.append(card_id)
+                if len(waiting) > self.WINDOW:
+                    self._pair_off(waiting.pop(0), waiting.pop(0), pairs)
+        while waiting:
+            self._pair_off(waiting.pop(0), waiting.pop(0), pairs)
+
+        for first, second in pairs:
+            opponents.setdefault(first, set()).add(second)
+            opponents.setdefault(second, set()).add(first)
+        self.rounds_paired += 1
+        return {"pairs": pairs, "bye": bye}
+
+    def _pair_off(
+        self, first: str, second: str, pairs: List[Tuple[str, str]]
+    ) -> None:
+        """
+        Pair two entrants who already met, unless re-pairing avoids it.
+
+        The two entrants and those of the last REPAIR_PAIRS pairs formed
+        (the closest in rating) are re-paired from scratch if some
+        pairing of that block has no rematch at all; otherwise the two
+        entrants meet again.
+
+        :param first: The higher-rated entrant.
+        :param second: The lower-rated entrant.
+        :param pairs: The pairs formed so far this round (updated).
+        """
+        start = max(0, len(pairs) - self.REPAIR_PAIRS)
+        block = [card_id for pair in pairs[start:] for card_id in pair]
+        block += [first, second]
+        registry = self.platform.registry
+        block.sort(key=lambda cid: -registry[cid].rating)
+        fresh = self._fresh_pairing(block)
+        if fresh is None:
+            pairs.append((first, second))
+        else:
+            pairs[start:] = fresh
+
+    def _fresh_pairing(
+        self, block: List[str]
+    ) -> Optional[List[Tuple[str, str]]]:
+        """
+        Pair a block of entrants with no rematch, by backtracking.
+
+        :param block: Entrant IDs in rating order (even count).
+        :return: The pairs, closest-rated partners first, or None if
+                 every pairing of the block contains a rematch.
+        """
+        if not block:
+            return []
+        head = block[0]
+        met = self.opponents.get(head, set())
+        for i in range(1, len(block)):
+            if block[i] not in met:
+                rest = self._fresh_pairing(block[1:i] + block[i + 1:])
+                if rest is not None:
+                    return [(head, block[i])] + rest
+        return None
+
+    def round_robin(
+        self, entrants: List[str], chunk_size: int = 10_000
+    ) -> Iterator[List[Tuple[str, str]]]:
+        """
+        Stream every pairing of a round robin, in chunks.
+
+        Uses the circle method: len(entrants) - 1 rounds (one more with
+        a rotating bye when odd) in which everyone plays once. Pairs are
+        yielded round by round in lists of at most chunk_size, so the
+        n^2 / 2 matches never have to be held in memory at once.
+
+        :param entrants: Card IDs taking part.
+        :param chunk_size: Maximum number of pairs per yielded list.
+        :raises ValueError: If chunk_size is not a positive integer.
+        """
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise ValueError("Chunk size must be a positive integer")
+        seats: List[Optional[str]] = list(entrants)
+        if len(seats) % 2:
+            seats.append(None)
+        n = len(seats)
+        chunk: List[Tuple[str, str]] = []
+        for _ in range(n - 1):
+            for i in range(n // 2):
+                first, second = seats[i], seats[n - 1 - i]
+                if first is not None and second is not None:
+                    chunk.append((first, second))
+                    if len(chunk) == chunk_size:
+                        yield chunk
+                        chunk = []
+            seats.insert(1, seats.pop())
+        if chunk:
+            yield chunk
@@ -8,6 +8,8 @@ class Rankable(ABC):
     Defines the contract for Elo rating and match history management.
     """
 
+    __slots__ = ()
+
     def calculate_rating(self) -> int:
         """
         Calculate and return the current rating of the entity.
@@ -0,0 +1,157 @@
+from bisect import bisect_left, bisect_right, insort
+from itertools import accumulate
+from typing import Any, Iterator, List, Optional
+
+
+class RatingIndex:
+    """
+    Order-statistics container keeping comparable keys in sorted order.
+
+    Keys are stored in a list of sorted buckets (at most 2 * LOAD keys
+    each) with a parallel list of bucket maxima, so inserts and removals
+    bisect twice and only shift one small bucket. Bucket start offsets
+    are rebuilt lazily, which makes rank lookups and slicing cheap when
+    several reads follow a batch of updates.
+    """
+
+    LOAD = 512
+
+    def __init__(self):
+        """
+        Initialize an empty index.
+        """
+        self._buckets: List[List[Any]] = []
+        self._maxes: List[Any] = []
+        self._offsets: Optional[List[int]] = None
+        self._len = 0
+
+    def __len__(self) -> int:
+        """
+        Return the number of keys in the index.
+        """
+        return self._len
+
+    @classmethod
+    def from_sorted(cls, keys: List[Any]) -> "RatingIndex":
+        """
+        Build an index from keys that are already sorted.
+
+        :param keys: The keys, in ascending order.
+        :return: A new index holding those keys.
+        """
+        index = cls()
+        load = cls.LOAD
+        index._buckets = [
+            keys[i:i + load] for i in range(0, len(keys), load)
+        ]
+        index._maxes = [bucket[-1] for bucket in index._buckets]
+        index._len = len(keys)
+        return index
+
+    def add(self, key: Any) -> None:
+        """
+        Insert a key, keeping the index sorted.
+
+        :param key: The key to insert.
+        """
+        buckets = self._buckets
+        maxes = self._maxes
+        self._len += 1
+        self._offsets = None
+        if not buckets:
+            buckets.append([key])
+            maxes.append(key)
+            return
+        pos = bisect_left(maxes, key)
+        if pos == len(maxes):
+            pos -= 1
+            buckets[pos].append(key)
+            maxes[pos] = key
+        else:
+            insort(buckets[pos], key)
+        bucket = buckets[pos]
+        if len(bucket) > 2 * self.LOAD:
+            half = bucket[self.LOAD:]
+            del bucket[self.LOAD:]
+            maxes[pos] = bucket[-1]
+            buckets.insert(pos + 1, half)
+            maxes.insert(pos + 1, half[-1])
+
+    def remove(self, key: Any) -> None:
+        """
+        Remove a key from the index.
+
+        :param key: The key to remove.
+        :raises ValueError: If the key is not in the index.
+        """
+        pos, i = self._find(key)
+        bucket = self._buckets[pos]
+        del bucket[i]
+        self._len -= 1
+        self._offsets = None
+        if bucket:
+            self._maxes[pos] = bucket[-1]
+        else:
+            del self._buckets[pos]
+            del self._maxes[pos]
+
+    def index(self, key: Any) -> int:
+        """
+        Return the 0-based position of a key in sorted order.
+
+        :param key: The key to look up.
+        :raises ValueError: If the key is not in the index.
+        """
+        pos, i = self._find(key)
+        return self._bucket_offsets()[pos] + i
+
+    def islice(self, start: int, stop: int) -> Iterator[Any]:
+        """
+        Iterate over the keys at sorted positions start..stop-1.
+
+        :param start: First position (clamped to 0).
+        :param stop: Position after the last one (clamped to the size).
+        """
+        start = max(0, start)
+        stop = min(stop, self._len)
+        if start >= stop:
+            return
+        buckets = self._buckets
+        if start < len(buckets[0]):
+            pos, i = 0, start
+        else:
+            offsets = self._bucket_offsets()
+            pos = bisect_right(offsets, start) - 1
+            i = start - offsets[pos]
+        remaining = stop - start
+        while remaining:
+            bucket = buckets[pos]
+            chunk = bucket[i:i + remaining]
+            yield from chunk
+            remaining -= len(chunk)
+            pos += 1
+            i = 0
+
+    def _find(self, key: Any) -> tuple:
+        """
+        Locate a key as (bucket position, index in bucket).
+
+        :raises ValueError: If the key is not in the index.
+        """
+        pos = bisect_left(self._maxes, key)
+        if pos < len(self._maxes):
+            bucket = self._buckets[pos]
+            i = bisect_left(bucket, key)
+            if i < len(bucket) and bucket[i] == key:
+                return pos, i
+        raise ValueError(f"{key!r} is not in the index")
+
+    def _bucket_offsets(self) -> List[int]:
+        """
+        Return the sorted position of each bucket's first key.
+        """
+        if self._offsets is None:
+            self._offsets = [0]
+            self._offsets.extend(accumulate(map(len, self._buckets)))
+            self._offsets.pop()
+        return self._offsets
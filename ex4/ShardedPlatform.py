@@ -0,0 +1,405 @@
+import heapq
+import multiprocessing
+import zlib
+from itertools import islice
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+from ex4.EloTable import EloTable
+from ex4.TournamentCard import TournamentCard
+from ex4.TournamentPlatform import TournamentPlatform
+
+# (-rating, global registration order, name, wins, losses)
+LeaderRow = Tuple[int, int, str, int, int]
+
+
+def _serve_shard(conn: Any) -> None:
+    """
+    Worker loop owning one shard's TournamentPlatform.
+
+    Every request is a (command, *args) tuple answered with either
+    (True, result) or (False, exception).
+    """
+    platform = TournamentPlatform()
+    global_orders: Dict[str, int] = {}
+    pending: List[Tuple[str, str]] = []
+    result: Any
+    while True:
+        command, *args = conn.recv()
+        if command == "stop":
+            conn.close()
+            return
+        try:
+            if command == "register":
+                for card_id, order, record in args[0]:
+                    card = TournamentCard.from_record(*record)
+                    platform.register_card(card, card_id)
+                    global_orders.setdefault(card_id, order)
+                result = None
+            elif command == "prepare":
+                local_pairs, read_ids = args
+                registry = platform.registry
+                for pair in local_pairs:
+                    for card_id in pair:
+                        if card_id not in registry:
+                            raise KeyError(card_id)
+                result = [
+                    (registry[card_id].attack_power, registry[card_id].rating)
+                    for card_id in read_ids
+                ]
+                pending = local_pairs
+            elif command == "commit":
+                registry = platform.registry
+                for card_id, wins, losses, rating_change in args[0]:
+                    card = registry[card_id]
+                    card.update_wins(wins, rating_change)
+                    card.update_losses(losses, 0)
+                    platform.reindex(card_id)
+                result = platform.create_matches(pending)
+                pending = []
+            elif command == "abort":
+                pending = []
+                result = None
+            elif command == "top":
+                registry = platform.registry
+                rows: List[LeaderRow] = []
+                for card_id in platform.ranked_ids(0, args[0]):
+                    card = registry[card_id]
+                    rows.append((-card.rating, global_orders[card_id],
+                                 card.name, card.wins, card.losses))
+                result = rows
+            elif command == "ratings":
+                registry = platform.registry
+                result = [registry[card_id].rating for card_id in args[0]]
+            elif command == "histogram":
+                result = platform.rating_histogram()
+            elif command == "size":
+                result = len(platform.registry)
+            else:
+                raise ValueError(f"Unknown shard command: {command}")
+        except Exception as error:
+            conn.send((False, error))
+        else:
+            conn.send((True, result))
+
+
+class ShardedPlatform:
+    """
+    Tournament platform partitioned over worker processes.
+
+    Cards are assigned to shards by a CRC-32 hash of their ID; each
+    shard is a TournamentPlatform living in its own process, reached
+    through a pipe. A batch of matches runs in two phases:
+
+    - prepare: every shard validates its same-shard pairs and reports
+      (attack, rating) for its cards involved in cross-shard pairs;
+    - commit: the coordinator resolves cross-shard pairs in order and
+      sends each shard its rating and record changes, after which the
+      shard plays its same-shard pairs locally, in parallel with the
+      other shards.
+
+    A batch therefore resolves all of its cross-shard pairs, in order,
+    before any same-shard pair, and only then each shard's same-shard
+    pairs in order. Winners are decided by attack power and do not
+    change, but Elo deltas depend on the ratings at the time of each
+    match, so the ratings after a batch differ from those of a single
+    TournamentPlatform playing the same pairs in input order. Single
+    matches (create_match) are not affected. Leaderboards are a k-way
+    merge of the shards' top-k lists, ranked exactly like a single
+    TournamentPlatform holding the same ratings.
+    """
+
+    K_FACTOR = TournamentPlatform.K_FACTOR
+
+    def __init__(self, n_shards: int, start_method: Optional[str] = None):
+        """
+        Start one worker process per shard.
+
+        :param n_shards: Number of shards (worker processes).
+        :param start_method: multiprocessing start method (platform
+                             default when None).
+        :raises ValueError: If n_shards is not a positive integer.
+        """
+        if not isinstance(n_shards, int) or n_shards < 1:
+            raise ValueError("Shard count must be a positive integer")
+        # Typed as Any: the stubs' BaseContext has no Process attribute.
+        context: Any = multiprocessing.get_context(start_method)
+        self.n_shards = n_shards
+        self.matches_played: int = 0
+        self._registered: int = 0
+        self._elo_deltas = EloTable(self.K_FACTOR)
+        self._conns = []
+        self._workers = []
+        for _ in range(n_shards):
+            parent, child = context.Pipe()
+            worker = context.Process(
+                target=_serve_shard, args=(child,), daemon=True)
+            worker.start()
+            child.close()
+            self._conns.append(parent)
+            self._workers.append(worker)
+
+    def __enter__(self) -> "ShardedPlatform":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Stop every worker process.
+        """
+        for conn in self._conns:
+            conn.send(("stop",))
+            conn.close()
+        for worker in self._workers:
+            worker.join()
+        self._conns = []
+        self._workers = []
+
+    def shard_of(self, card_id: str) -> int:
+        """
+        Return the index of the shard owning a card ID.
+
+        :param card_id: The card identifier.
+        """
+        return zlib.crc32(card_id.encode()) % self.n_shards
+
+    def _broadcast(self, requests: List[tuple]) -> List[Any]:
+        """
+        Send one request to each shard, then collect every reply.
+
+        All requests are sent before any reply is read, so the shards
+        work on them concurrently.
+
+        :param requests: One (command, *args) tuple per shard.
+        :return: The shards' results, in shard order.
+        :raises Exception: The first error reported by a shard.
+        """
+        for conn, request in zip(self._conns, requests):
+            conn.send(request)
+        replies = [conn.recv() for conn in self._conns]
+        for ok, payload in replies:
+            if not ok:
+                raise payload
+        return [payload for _, payload in replies]
+
+    def register_card(self, card: TournamentCard, card_id: str) -> str:
+        """
+        Register a card on its shard.
+
+        :param card: The TournamentCard instance to register.
+        :param card_id: A unique identifier for the card.
+        :return: The registered card identifier.
+        """
+        self.register_cards([(card_id, card)])
+        return card_id
+
+    def register_cards(
+        self, entries: Iterable[Tuple[str, TournamentCard]]
+    ) -> None:
+        """
+        Register many cards with one round trip per shard.
+
+        :param entries: (card_id, card) pairs, in registration order.
+        """
+        batches: List[list] = [[] for _ in range(self.n_shards)]
+        for card_id, card in entries:
+            batches[self.shard_of(card_id)].append((
+                card_id, self._registered,
+                (card.name, card.cost, card.rarity, card.attack_power,
+                 card.rating, card.wins, card.losses)))
+            self._registered += 1
+        self._broadcast([("register", batch) for batch in batches])
+
+    def create_match(self, card1_id: str, card2_id: str) -> Dict[str, Any]:
+        """
+        Play a single match.
+
+        :param card1_id: ID of the first participant.
+        :param card2_id: ID of the second participant.
+        :return: The same summary as TournamentPlatform.create_match():
+                 winner and loser IDs and their new ratings.
+        :raises KeyError: If a card ID is not registered.
+        """
+        winner = self.create_matches([(card1_id, card2_id)])[0]
+        loser = card2_id if winner == card1_id else card1_id
+        winner_rating, loser_rating = self._ratings([winner, loser])
+        return {
+            "winner": winner,
+            "loser": loser,
+            "winner_rating": winner_rating,
+            "loser_rating": loser_rating
+        }
+
+    def _ratings(self, card_ids: List[str]) -> List[int]:
+        """
+        Read the current ratings of some cards from their shards.
+
+        :param card_ids: IDs of registered cards.
+        :return: Their ratings, in the same order.
+        """
+        requested: List[List[str]] = [[] for _ in range(self.n_shards)]
+        for card_id in card_ids:
+            requested[self.shard_of(card_id)].append(card_id)
+        replies = [
+            iter(ratings) for ratings in self._broadcast(
+                [("ratings", ids) for ids in requested])
+        ]
+        return [next(replies[self.shard_of(card_id)]) for card_id in card_ids]
+
+    def create_matches(
+        self, pairs: Iterable[Tuple[str, str]]
+    ) -> List[str]:
+        """
+        Play a batch of matches across the shards.
+
+        :param pairs: (card1_id, card2_id) pairs to play.
+        :return: The winner ID of each match, in input order.
+        :raises KeyError: If a card ID is not registered; no shard is
+                          modified in that case.
+        """
+        n_shards = self.n_shards
+        local: List[List[Tuple[str, str]]] = [[] for _ in range(n_shards)]
+        local_index: List[List[int]] = [[] for _ in range(n_shards)]
+        cross: List[Tuple[int, str, str]] = []
+        read_ids: List[List[str]] = [[] for _ in range(n_shards)]
+        slots: Dict[str, int] = {}
+
+        def slot_of(card_id: str, shard: int) -> int:
+            slot = slots.get(card_id)
+            if slot is None:
+                slot = slots[card_id] = len(slots)
+                read_ids[shard].append(card_id)
+            return slot
+
+        count = 0
+        for i, (card1_id, card2_id) in enumerate(pairs):
+            shard1 = self.shard_of(card1_id)
+            shard2 = self.shard_of(card2_id)
+            if shard1 == shard2:
+                local[shard1].append((card1_id, card2_id))
+                local_index[shard1].append(i)
+            else:
+                cross.append((i, card1_id, card2_id))
+                slot_of(card1_id, shard1)
+                slot_of(card2_id, shard2)
+            count += 1
+
+        try:
+            stats = self._broadcast([
+                ("prepare", local[s], read_ids[s]) for s in range(n_shards)
+            ])
+        except Exception:
+            self._broadcast([("abort",)] * n_shards)
+            raise
+
+        attacks = [0] * len(slots)
+        ratings = [0] * len(slots)
+        for shard_ids, shard_stats in zip(read_ids, stats):
+            for card_id, (attack, rating) in zip(shard_ids, shard_stats):
+                slot = slots[card_id]
+                attacks[slot] = attack
+                ratings[slot] = rating
+        base_ratings = list(ratings)
+        wins = [0] * len(slots)
+        losses = [0] * len(slots)
+        winners: List[str] = [""] * count
+        elo_deltas = self._elo_deltas
+        for i, card1_id, card2_id in cross:
+            s1 = slots[card1_id]
+            s2 = slots[card2_id]
+            if attacks[s1] >= attacks[s2]:
+                w, lo, winners[i] = s1, s2, card1_id
+            else:
+                w, lo, winners[i] = s2, s1, card2_id
+            delta = elo_deltas[ratings[w] - ratings[lo]]
+            ratings[w] += delta
+            ratings[lo] -= delta
+            wins[w] += 1
+            losses[lo] += 1
+
+        updates: List[list] = [[] for _ in range(n_shards)]
+        for shard, shard_ids in enumerate(read_ids):
+            for card_id in shard_ids:
+                slot = slots[card_id]
+                updates[shard].append((
+                    card_id, wins[slot], losses[slot],
+                    ratings[slot] - base_ratings[slot]))
+        local_winners = self._broadcast([
+            ("commit", updates[s]) for s in range(n_shards)
+        ])
+        for indices, shard_winners in zip(local_index, local_winners):
+            for i, winner in zip(indices, shard_winners):
+                winners[i] = winner
+        self.matches_played += count
+        return winners
+
+    def _merged_rows(self, k: int) -> List[LeaderRow]:
+        """
+        Merge the shards' top-k lists into the global top k.
+        """
+        shard_rows = self._broadcast([("top", k)] * self.n_shards)
+        return list(islice(heapq.merge(*shard_rows), k))
+
+    def top_k(self, k: int) -> List[str]:
+        """
+        Format the k highest-rated entries of the leaderboard.
+
+        :param k: Number of entries to return.
+        :return: The formatted leaderboard rows, best first.
+        """
+        return self.page(0, k)
+
+    def page(self, offset: int, limit: int) -> List[str]:
+        """
+        Format a window of the leaderboard.
+
+        Each shard returns its best offset + limit rows, which always
+        contain every row of the global window.
+
+        :param offset: 0-based rank of the first entry.
+        :param limit: Maximum number of entries to return.
+        :return: The formatted leaderboard rows of that window.
+        """
+        offset = max(0, offset)
+        rows = self._merged_rows(offset + limit)[offset:]
+        return [
+            f"{rank}. {name} - Rating: {-neg_rating} ({wins}-{losses})"
+            for rank, (neg_rating, _, name, wins, losses)
+            in enumerate(rows, offset + 1)
+        ]
+
+    def get_leaderboard(self) -> List[str]:
+        """
+        Generate the full formatted leaderboard.
+
+        :return: A list of strings representing the ranked players.
+        """
+        return self.page(0, sum(self._broadcast([("size",)] * self.n_shards)))
+
+    def generate_tournament_report(self) -> Dict[str, Any]:
+        """
+        Generate global statistics from the merged shard histograms.
+
+        :return: The same metrics as TournamentPlatform's report.
+        """
+        histogram: Dict[int, int] = {}
+        for shard_histogram in self._broadcast(
+                [("histogram",)] * self.n_shards):
+            for rating, cards in shard_histogram.items():
+                histogram[rating] = histogram.get(rating, 0) + cards
+        count = sum(histogram.values())
+        p0, p50, p90, p99, p100 = TournamentPlatform.histogram_percentiles(
+            histogram, sorted(histogram), count, (0, 50, 90, 99, 100))
+        total = sum(rating * cards for rating, cards in histogram.items())
+
+        return {
+            "total_cards": count,
+            "matches_played": self.matches_played,
+            "avg_rating": total // count if count > 0 else 0,
+            "min_rating": p0,
+            "max_rating": p100,
+            "p50_rating": p50,
+            "p90_rating": p90,
+            "p99_rating": p99,
+            "platform_status": "active"
+        }
@@ -0,0 +1,86 @@
+from collections.abc import MutableMapping
+from typing import Dict, Iterator, List, Sequence
+from ex4.TournamentCard import TournamentCard
+
+
+class SnapshotRegistry(MutableMapping):
+    """
+    Card registry of a platform restored from a snapshot.
+
+    Every snapshot card is known by ID from the start, but its
+    TournamentCard is only built from the snapshot columns the first
+    time it is looked up. Until then the card costs nothing beyond its
+    ID and strings: the numeric columns stay zero-copy views of the
+    snapshot file. Cards registered after the restore are stored as
+    they are. Iteration follows registration order, like a dict.
+    """
+
+    def __init__(
+        self, ids: List[str], strings: List[str],
+        columns: Dict[str, Sequence[int]]
+    ):
+        """
+        Index the snapshot cards by ID.
+
+        :param ids: Card IDs, in registration order.
+        :param strings: The snapshot strings: (id, name, rarity) of each
+                        card, flattened.
+        :param columns: The numeric snapshot columns, by name.
+        """
+        # Card ID -> registration order in the snapshot (-1 if the card
+        # was registered after the restore).
+        self._orders: Dict[str, int] = dict(zip(ids, range(len(ids))))
+        self._cards: Dict[str, TournamentCard] = {}
+        self._strings = strings
+        self._columns = columns
+
+    def __getitem__(self, card_id: str) -> TournamentCard:
+        """
+        Return a card, building it from the snapshot on first access.
+
+        :raises KeyError: If no card has this ID.
+        """
+        card = self._cards.get(card_id)
+        if card is None:
+            order = self._orders[card_id]
+            columns = self._columns
+            card = self._cards[card_id] = TournamentCard.from_record(
+                self._strings[3 * order + 1], columns["costs"][order],
+                self._strings[3 * order + 2], columns["attacks"][order],
+                columns["ratings"][order], columns["wins"][order],
+                columns["losses"][order])
+        return card
+
+    def __setitem__(self, card_id: str, card: TournamentCard) -> None:
+        """
+        Register or replace a card.
+        """
+        self._cards[card_id] = card
+        self._orders.setdefault(card_id, -1)
+
+    def __delitem__(self, card_id: str) -> None:
+        """
+        Remove a card.
+
+        :raises KeyError: If no card has this ID.
+        """
+        del self._orders[card_id]
+        self._cards.pop(card_id, None)
+
+    def __contains__(self, card_id: object) -> bool:
+        """
+        Check whether a card ID is registered, without building it.
+        """
+        return card_id in self._orders
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterate over the card IDs in registration order.
+        """
+        return iter(self._orders)
+
+    def __len__(self) -> int:
+        """
+        Return the number of registered cards.
+        """
+        return len(self._orders)
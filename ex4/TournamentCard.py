@@ -1,4 +1,4 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from ex0.Card import Card
 from ex2.Combatable import Combatable
 from ex4.Rankable import Rankable
@@ -10,6 +10,10 @@ class TournamentCard(Card, Combatable, Rankable):
     Combines base card properties, combat abilities, and ranking stats.
     """
 
+    __slots__ = ("attack_power", "wins", "losses", "rating")
+
+    TYPE_TAG = "tournament"
+
     def __init__(self, name: str, cost: int, rarity: str, attack: int):
         """
         Initialize a TournamentCard with ranking and combat attributes.
@@ -26,6 +30,27 @@ class TournamentCard(Card, Combatable, Rankable):
         self.losses = 0
         self.rating = 1200  # Base Elo rating
 
+    @classmethod
+    def from_record(
+        cls, name: str, cost: int, rarity: str, attack: int,
+        rating: int, wins: int, losses: int
+    ) -> "TournamentCard":
+        """
+        Rebuild a card from persisted fields without re-running __init__.
+
+        Used when restoring large platforms, where the fields were
+        already validated when the card was first created.
+        """
+        card = cls.__new__(cls)
+        card.name = name
+        card.cost = cost
+        card.rarity = rarity
+        card.attack_power = attack
+        card.rating = rating
+        card.wins = wins
+        card.losses = losses
+        return card
+
     def play(self, game_state: Dict[str, Any]) -> Dict[str, Any]:
         """Implement the Card play interface."""
         return {
@@ -53,15 +78,35 @@ class TournamentCard(Card, Combatable, Rankable):
         """Retrieve current ranking value."""
         return self.rating
 
-    def update_wins(self, wins: int) -> None:
-        """Update wins and increase rating points."""
+    def update_wins(
+        self, wins: int, rating_change: Optional[int] = None
+    ) -> None:
+        """
+        Update wins and increase rating points.
+
+        :param wins: The number of wins to add.
+        :param rating_change: Elo points gained; a flat 16 per win when
+                              the opponent is unknown.
+        """
         self.wins += wins
-        self.rating += (wins * 16)
+        if rating_change is None:
+            rating_change = wins * 16
+        self.rating += rating_change
 
-    def update_losses(self, losses: int) -> None:
-        """Update losses and decrease rating points."""
+    def update_losses(
+        self, losses: int, rating_change: Optional[int] = None
+    ) -> None:
+        """
+        Update losses and decrease rating points.
+
+        :param losses: The number of losses to add.
+        :param rating_change: Elo points lost; a flat 16 per loss when
+                              the opponent is unknown.
+        """
         self.losses += losses
-        self.rating -= (losses * 16)
+        if rating_change is None:
+            rating_change = losses * 16
+        self.rating -= rating_change
 
     def get_rank_info(self) -> Dict[str, Any]:
         """Return a summary of ranking and record."""
@@ -0,0 +1,50 @@
+import time
+from typing import List, Tuple
+from ex4.TournamentService import TournamentService
+
+
+class TournamentClient:
+    """
+    In-process client for a TournamentService.
+
+    Calls the service coroutines directly (no network hop) and records
+    the latency of every request, which makes it usable both for tests
+    and as a simulated front-end connection in benchmarks.
+    """
+
+    def __init__(self, service: TournamentService):
+        """
+        Connect the client to a running service.
+
+        :param service: The service to send requests to.
+        """
+        self.service = service
+        self.latencies: List[float] = []
+
+    async def play(self, card1_id: str, card2_id: str) -> str:
+        """
+        Submit a match and wait for its result.
+
+        :param card1_id: ID of the first participant.
+        :param card2_id: ID of the second participant.
+        :return: The winner's ID.
+        """
+        start = time.perf_counter()
+        winner = await self.service.submit_match(card1_id, card2_id)
+        self.latencies.append(time.perf_counter() - start)
+        return winner
+
+    async def leaderboard(
+        self, offset: int = 0, limit: int = 10
+    ) -> Tuple[int, List[str]]:
+        """
+        Read a leaderboard window.
+
+        :param offset: 0-based rank of the first row.
+        :param limit: Maximum number of rows.
+        :return: The snapshot version and the formatted rows.
+        """
+        start = time.perf_counter()
+        result = await self.service.get_leaderboard(offset, limit)
+        self.latencies.append(time.perf_counter() - start)
+        return result
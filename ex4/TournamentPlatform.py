@@ -1,19 +1,92 @@
-from typing import Dict, List, Any
+from collections import Counter
+from typing import (
+    Dict, List, Any, Iterable, Iterator, MutableMapping, Optional,
+    Sequence, Tuple, TYPE_CHECKING
+)
+from ex4.EloTable import EloTable
+from ex4.PairingScheduler import PairingScheduler
+from ex4.RatingIndex import RatingIndex
 from ex4.TournamentCard import TournamentCard
 
+if TYPE_CHECKING:
+    from ex4.TournamentStore import TournamentStore
+
 
 class TournamentPlatform:
     """
     Management system for competitive tournament play.
     Handles card registration, matchmaking, and leaderboards.
+
+    The leaderboard is kept as a RatingIndex of (-rating, registration
+    order) keys, updated whenever a rating changes, so ranked queries
+    never sort the registry and only format the rows they return.
+    Ratings must change through the platform (or be followed by
+    reindex()) for the index to stay accurate.
+
+    Matches use Elo: the winner takes round(K * (1 - E)) points from
+    the loser, E being the winner's expected score.
+
+    With a TournamentStore attached (see open()), registrations and
+    match results are also appended to the store's log.
+
+    Rating aggregates (sum and an exact rating histogram) are updated
+    alongside the leaderboard, so reports never walk the registry.
     """
 
-    def __init__(self):
+    K_FACTOR = 32
+
+    def __init__(self, store: Optional["TournamentStore"] = None):
         """
         Initialize the tournament platform with an empty registry.
+
+        :param store: Optional store logging every registration and match.
         """
-        self.registry: Dict[str, TournamentCard] = {}
+        self.registry: MutableMapping[str, TournamentCard] = {}
         self.matches_played: int = 0
+        self._ranking = RatingIndex()
+        self._ranked_keys: Dict[str, Tuple[int, int]] = {}
+        self._ids_by_order: List[str] = []
+        self._elo_deltas = EloTable(self.K_FACTOR)
+        self.scheduler = PairingScheduler(self)
+        self.store = store
+        self._rating_sum: int = 0
+        self._rating_histogram: Counter = Counter()
+        self._histogram_keys: Optional[List[int]] = None
+
+    @classmethod
+    def open(
+        cls, directory: str, **store_options: Any
+    ) -> "TournamentPlatform":
+        """
+        Restore a platform from a store directory and keep logging to it.
+
+        :param directory: The store directory (created if missing).
+        :param store_options: Extra TournamentStore options.
+        :return: The restored platform, with the store attached.
+        """
+        from ex4.TournamentStore import TournamentStore
+        store = TournamentStore(directory, **store_options)
+        platform = cls()
+        store.restore(platform)
+        platform.store = store
+        return platform
+
+    def save_snapshot(self) -> None:
+        """
+        Write a snapshot to the attached store and start a new log.
+
+        :raises AttributeError: If no store is attached.
+        """
+        if self.store is None:
+            raise AttributeError("No store attached to this platform")
+        self.store.write_snapshot(self)
+
+    def close(self) -> None:
+        """
+        Flush and close the attached store, if any.
+        """
+        if self.store is not None:
+            self.store.close()
 
     def register_card(self, card: TournamentCard, card_id: str) -> str:
         """
@@ -23,9 +96,112 @@ class TournamentPlatform:
         :param card_id: A unique identifier for the card.
         :return: The registered card identifier.
         """
+        key = self._ranked_keys.get(card_id)
+        if key is None:
+            order = len(self._ids_by_order)
+            self._ids_by_order.append(card_id)
+        else:
+            order = key[1]
+            self._ranking.remove(key)
+            self._untrack_rating(-key[0])
         self.registry[card_id] = card
+        key = self._ranked_keys[card_id] = (-card.rating, order)
+        self._ranking.add(key)
+        self._track_rating(card.rating)
+        if self.store is not None:
+            self.store.log_register(order, card_id, card)
         return card_id
 
+    def ids_by_order(self) -> List[str]:
+        """
+        Return every card ID in registration order.
+
+        The list is shared with the platform and must not be modified.
+        """
+        return self._ids_by_order
+
+    def load_state(
+        self, registry: MutableMapping[str, TournamentCard],
+        ids: List[str], ratings: Sequence[int],
+        ranked_orders: Sequence[int], matches_played: int
+    ) -> None:
+        """
+        Bulk-load cards into an empty platform.
+
+        The ratings are passed separately so the leaderboard and the
+        aggregates can be built without touching the cards themselves
+        (e.g. a SnapshotRegistry that builds them on demand).
+
+        :param registry: The cards, by ID.
+        :param ids: Card IDs in registration order.
+        :param ratings: The card ratings, in registration order.
+        :param ranked_orders: Registration orders in leaderboard order.
+        :param matches_played: Number of matches already played.
+        :raises ValueError: If the platform is not empty.
+        """
+        if self.registry:
+            raise ValueError("Cannot load state into a non-empty platform")
+        self.registry = registry
+        self._ids_by_order = list(ids)
+        keys = list(zip([-rating for rating in ratings], range(len(ids))))
+        self._ranked_keys = dict(zip(ids, keys))
+        self._ranking = RatingIndex.from_sorted(
+            list(map(keys.__getitem__, ranked_orders)))
+        self._rating_sum = sum(ratings)
+        self._rating_histogram = Counter(ratings)
+        self._histogram_keys = None
+        self.matches_played = matches_played
+
+    def apply_result(self, winner_id: str, loser_id: str, delta: int) -> None:
+        """
+        Apply an already decided match result (used for log replay).
+
+        :param winner_id: ID of the winner.
+        :param loser_id: ID of the loser.
+        :param delta: Rating points moved from loser to winner.
+        """
+        self.registry[winner_id].update_wins(1, delta)
+        self.registry[loser_id].update_losses(1, delta)
+        self.matches_played += 1
+        self.reindex(winner_id)
+        self.reindex(loser_id)
+
+    def reindex(self, card_id: str) -> None:
+        """
+        Refresh a card's leaderboard position after an external change.
+
+        :param card_id: ID of the card whose rating changed.
+        """
+        old_key = self._ranked_keys[card_id]
+        new_key = (-self.registry[card_id].rating, old_key[1])
+        if new_key != old_key:
+            self._ranking.remove(old_key)
+            self._ranking.add(new_key)
+            self._ranked_keys[card_id] = new_key
+            self._untrack_rating(-old_key[0])
+            self._track_rating(-new_key[0])
+
+    def _track_rating(self, rating: int) -> None:
+        """
+        Add one card's rating to the running aggregates.
+        """
+        self._rating_sum += rating
+        histogram = self._rating_histogram
+        if not histogram[rating]:
+            self._histogram_keys = None
+        histogram[rating] += 1
+
+    def _untrack_rating(self, rating: int) -> None:
+        """
+        Remove one card's rating from the running aggregates.
+        """
+        self._rating_sum -= rating
+        histogram = self._rating_histogram
+        histogram[rating] -= 1
+        if not histogram[rating]:
+            del histogram[rating]
+            self._histogram_keys = None
+
     def create_match(self, card1_id: str, card2_id: str) -> Dict[str, Any]:
         """
         Execute a match between two registered cards based on attack power.
@@ -45,9 +221,15 @@ class TournamentPlatform:
             winner, loser = card2, card1
             w_id, l_id = card2_id, card1_id
 
-        winner.update_wins(1)
-        loser.update_losses(1)
+        delta = self._elo_deltas[winner.rating - loser.rating]
+        winner.update_wins(1, delta)
+        loser.update_losses(1, delta)
         self.matches_played += 1
+        self.reindex(w_id)
+        self.reindex(l_id)
+        if self.store is not None:
+            self.store.log_match(
+                self._ranked_keys[w_id][1], self._ranked_keys[l_id][1], delta)
 
         return {
             "winner": w_id,
@@ -56,28 +238,204 @@ class TournamentPlatform:
             "loser_rating": loser.rating
         }
 
+    def create_matches(
+        self, pairs: Iterable[Tuple[str, str]]
+    ) -> List[str]:
+        """
+        Execute a batch of matches, in order, in one pass.
+
+        Ratings and records are pulled into flat per-batch lists, every
+        match is resolved against them, and cards (and the leaderboard)
+        are written back once per participant at the end. The outcome is
+        identical to calling create_match() on each pair in turn.
+
+        :param pairs: (card1_id, card2_id) pairs to play, in order.
+        :return: The winner ID of each match.
+        :raises KeyError: If a card ID is not registered.
+        """
+        registry = self.registry
+        slots: Dict[str, int] = {}
+        ids: List[str] = []
+        attacks: List[int] = []
+        ratings: List[int] = []
+        winners: List[str] = []
+
+        def slot_of(card_id: str) -> int:
+            slot = slots.get(card_id)
+            if slot is None:
+                card = registry[card_id]
+                slot = slots[card_id] = len(ids)
+                ids.append(card_id)
+                attacks.append(card.attack_power)
+                ratings.append(card.rating)
+            return slot
+
+        elo_deltas = self._elo_deltas
+        results = []
+        for card1_id, card2_id in pairs:
+            s1 = slot_of(card1_id)
+            s2 = slot_of(card2_id)
+            if attacks[s1] >= attacks[s2]:
+                w, lo = s1, s2
+            else:
+                w, lo = s2, s1
+            delta = elo_deltas[ratings[w] - ratings[lo]]
+            ratings[w] += delta
+            ratings[lo] -= delta
+            results.append((w, lo, delta))
+            winners.append(ids[w])
+
+        wins = [0] * len(ids)
+        losses = [0] * len(ids)
+        for w, lo, _ in results:
+            wins[w] += 1
+            losses[lo] += 1
+        for slot, card_id in enumerate(ids):
+            card = registry[card_id]
+            card.update_wins(wins[slot], ratings[slot] - card.rating)
+            card.update_losses(losses[slot], 0)
+            self.reindex(card_id)
+        self.matches_played += len(results)
+        if self.store is not None:
+            orders = [self._ranked_keys[card_id][1] for card_id in ids]
+            log_match = self.store.log_match
+            for w, lo, delta in results:
+                log_match(orders[w], orders[lo], delta)
+        return winners
+
     def get_leaderboard(self) -> List[str]:
         """
         Generate a formatted leaderboard sorted by Elo rating.
 
         :return: A list of strings representing the ranked players.
         """
-        # Sort cards by rating in descending order
-        sorted_cards = sorted(
-            self.registry.values(),
-            key=lambda x: x.rating,
-            reverse=True
-        )
+        return self.page(0, len(self.registry))
+
+    def top_k(self, k: int) -> List[str]:
+        """
+        Format the k highest-rated entries of the leaderboard.
+
+        :param k: Number of entries to return.
+        :return: The formatted leaderboard rows, best first.
+        """
+        return self.page(0, k)
+
+    def page(self, offset: int, limit: int) -> List[str]:
+        """
+        Format a window of the leaderboard.
+
+        :param offset: 0-based rank of the first entry.
+        :param limit: Maximum number of entries to return.
+        :return: The formatted leaderboard rows of that window.
+        """
+        return self._format_rows(
+            self.ranked_ids(offset, limit), max(0, offset) + 1)
+
+    def ranked_ids(
+        self, offset: int = 0, limit: Optional[int] = None
+    ) -> Iterator[str]:
+        """
+        Iterate over card IDs in leaderboard order.
+
+        :param offset: 0-based rank of the first ID.
+        :param limit: Maximum number of IDs (all remaining by default).
+        """
+        if limit is None:
+            limit = len(self.registry)
+        ids = self._ids_by_order
+        for _, order in self._ranking.islice(offset, offset + limit):
+            yield ids[order]
+
+    def play_swiss_round(self) -> Dict[str, Any]:
+        """
+        Pair every registered card for a Swiss round and play it.
 
-        leaderboard = []
-        for i, card in enumerate(sorted_cards, 1):
+        :return: The round's pairs, bye and winners.
+        """
+        round_info = self.scheduler.swiss_round()
+        round_info["winners"] = self.create_matches(round_info["pairs"])
+        return round_info
+
+    def rank_of(self, card_id: str) -> int:
+        """
+        Return the 1-based leaderboard rank of a card.
+
+        :param card_id: ID of a registered card.
+        :return: The card's rank.
+        :raises KeyError: If the card is not registered.
+        """
+        return self._ranking.index(self._ranked_keys[card_id]) + 1
+
+    def _format_rows(
+        self, card_ids: Iterable[str], first_rank: int
+    ) -> List[str]:
+        """
+        Format leaderboard rows for consecutive ranks.
+
+        :param card_ids: IDs of the cards, in rank order.
+        :param first_rank: Rank of the first card.
+        :return: The formatted rows.
+        """
+        rows = []
+        for i, card_id in enumerate(card_ids, first_rank):
+            card = self.registry[card_id]
             info = card.get_rank_info()
-            entry = (
+            rows.append(
                 f"{i}. {card.name} - Rating: {info['rating']} "
                 f"({info['record']})"
             )
-            leaderboard.append(entry)
-        return leaderboard
+        return rows
+
+    def rating_histogram(self) -> Dict[int, int]:
+        """
+        Return a copy of the rating histogram (rating -> card count).
+        """
+        return dict(self._rating_histogram)
+
+    def rating_percentiles(self, *percents: float) -> List[int]:
+        """
+        Return rating percentiles using the nearest-rank method.
+
+        Answered from the rating histogram in a single walk over the
+        distinct ratings, never over the cards.
+
+        :param percents: Percentiles in the 0-100 range, ascending.
+        :return: For each percentile, the smallest rating with at least
+                 that share of cards at or below it (0 if empty).
+        """
+        if self._histogram_keys is None:
+            self._histogram_keys = sorted(self._rating_histogram)
+        return self.histogram_percentiles(
+            self._rating_histogram, self._histogram_keys,
+            len(self.registry), percents)
+
+    @staticmethod
+    def histogram_percentiles(
+        histogram: Dict[int, int], keys: List[int], count: int,
+        percents: Iterable[float]
+    ) -> List[int]:
+        """
+        Return nearest-rank percentiles of a rating histogram.
+
+        :param histogram: Rating -> number of cards with that rating.
+        :param keys: The ratings of the histogram, ascending.
+        :param count: Total number of cards in the histogram.
+        :param percents: Percentiles in the 0-100 range, ascending.
+        :return: For each percentile, the smallest rating with at least
+                 that share of cards at or below it (0 if empty).
+        """
+        if not count:
+            return [0 for _ in percents]
+        results = []
+        seen = 0
+        pos = 0
+        for percent in percents:
+            target = max(1, -(-percent * count // 100))
+            while seen < target and pos < len(keys):
+                seen += histogram[keys[pos]]
+                pos += 1
+            results.append(keys[pos - 1] if pos else keys[0])
+        return results
 
     def generate_tournament_report(self) -> Dict[str, Any]:
         """
@@ -85,13 +443,19 @@ class TournamentPlatform:
 
         :return: A dictionary containing platform-wide metrics.
         """
-        total_rating = sum(c.rating for c in self.registry.values())
         count = len(self.registry)
-        avg_rating = total_rating // count if count > 0 else 0
+        avg_rating = self._rating_sum // count if count > 0 else 0
+        p0, p50, p90, p99, p100 = self.rating_percentiles(
+            0, 50, 90, 99, 100)
 
         return {
             "total_cards": count,
             "matches_played": self.matches_played,
             "avg_rating": avg_rating,
+            "min_rating": p0,
+            "max_rating": p100,
+            "p50_rating": p50,
+            "p90_rating": p90,
+            "p99_rating": p99,
             "platform_status": "active"
         }
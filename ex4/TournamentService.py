@@ -0,0 +1,149 @@
+import asyncio
+from typing import Any, List, Optional, Tuple
+from ex4.TournamentPlatform import TournamentPlatform
+
+
+class TournamentService:
+    """
+    Asyncio front-end coalescing concurrent requests to a platform.
+
+    Match submissions go through a bounded queue; a single batcher task
+    drains whatever is waiting (up to max_batch) and resolves it with one
+    create_matches() call. A full queue makes submitters wait, which is
+    the backpressure signal. Leaderboard reads are served from a
+    snapshot of the top rows tagged with the batch version it was built
+    at, so reads never run platform queries while writes are pending.
+    """
+
+    def __init__(
+        self, platform: TournamentPlatform, max_batch: int = 1024,
+        max_queue: int = 10_000, snapshot_rows: int = 100
+    ):
+        """
+        Wrap a platform in a batching service.
+
+        :param platform: The TournamentPlatform to serve.
+        :param max_batch: Maximum matches resolved per batch.
+        :param max_queue: Pending submissions before submitters block.
+        :param snapshot_rows: Leaderboard rows kept in the read snapshot.
+        :raises ValueError: If a size is not a positive integer.
+        """
+        for label, value in (("Batch size", max_batch),
+                             ("Queue size", max_queue),
+                             ("Snapshot size", snapshot_rows)):
+            if not isinstance(value, int) or value < 1:
+                raise ValueError(f"{label} must be a positive integer")
+        self.platform = platform
+        self.max_batch = max_batch
+        self.max_queue = max_queue
+        self.snapshot_rows = snapshot_rows
+        self.version: int = 0
+        self.batches_run: int = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._batcher: Optional[asyncio.Task] = None
+        self._snapshot: List[str] = []
+        self._snapshot_version: int = -1
+
+    async def start(self) -> None:
+        """
+        Start the batcher task on the running event loop.
+        """
+        if self._batcher is None:
+            queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_queue)
+            self._queue = queue
+            self._batcher = asyncio.create_task(self._run_batches(queue))
+
+    async def stop(self) -> None:
+        """
+        Resolve every queued submission, then stop the batcher task.
+        """
+        if self._batcher is not None and self._queue is not None:
+            await self._queue.join()
+            self._batcher.cancel()
+            try:
+                await self._batcher
+            except asyncio.CancelledError:
+                pass
+            self._batcher = None
+
+    async def __aenter__(self) -> "TournamentService":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.stop()
+
+    async def submit_match(self, card1_id: str, card2_id: str) -> str:
+        """
+        Queue a match and wait for the batch that resolves it.
+
+        :param card1_id: ID of the first participant.
+        :param card2_id: ID of the second participant.
+        :return: The winner's ID.
+        :raises KeyError: If a card is not registered.
+        :raises RuntimeError: If the service is not started.
+        """
+        queue = self._queue
+        if self._batcher is None or queue is None:
+            raise RuntimeError("Service must be started before use")
+        registry = self.platform.registry
+        for card_id in (card1_id, card2_id):
+            if card_id not in registry:
+                raise KeyError(card_id)
+        future = asyncio.get_running_loop().create_future()
+        await queue.put(((card1_id, card2_id), future))
+        return await future
+
+    async def get_leaderboard(
+        self, offset: int = 0, limit: int = 10
+    ) -> Tuple[int, List[str]]:
+        """
+        Read a window of the leaderboard from the versioned snapshot.
+
+        Windows beyond the snapshot rows fall back to a direct page()
+        query on the platform.
+
+        :param offset: 0-based rank of the first row.
+        :param limit: Maximum number of rows.
+        :return: The snapshot version and the formatted rows.
+        """
+        if offset + limit > self.snapshot_rows:
+            return self.version, self.platform.page(offset, limit)
+        if self._snapshot_version != self.version:
+            self._snapshot = self.platform.top_k(self.snapshot_rows)
+            self._snapshot_version = self.version
+        return self.version, self._snapshot[offset:offset + limit]
+
+    def queue_depth(self) -> int:
+        """
+        Return the number of submissions waiting for a batch.
+        """
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def _run_batches(self, queue: asyncio.Queue) -> None:
+        """
+        Batcher loop: wait for work, drain a batch, resolve it.
+
+        :param queue: The submission queue created by start().
+        """
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.max_batch and not queue.empty():
+                batch.append(queue.get_nowait())
+            pairs = [pair for pair, _ in batch]
+            try:
+                winners = self.platform.create_matches(pairs)
+            except Exception as error:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(error)
+            else:
+                for (_, future), winner in zip(batch, winners):
+                    if not future.done():
+                        future.set_result(winner)
+            self.version += 1
+            self.batches_run += 1
+            for _ in batch:
+                queue.task_done()
+            # Let submitters and readers run between batches.
+            await asyncio.sleep(0)
@@ -0,0 +1,339 @@
+import gc
+import mmap
+import os
+import struct
+from typing import Dict, Any, List, Literal, Optional, Sequence, Tuple
+from ex4.SnapshotRegistry import SnapshotRegistry
+from ex4.TournamentCard import TournamentCard
+
+_MATCH = struct.Struct("<cIIi")
+_REGISTER = struct.Struct("<cIhhiiiI")
+_LOG_HEADER = struct.Struct("<8sQ")
+_LOG_MAGIC = b"DDLOG001"
+_SNAPSHOT_HEADER = struct.Struct("<8sQQQQ")
+_SNAPSHOT_MAGIC = b"DDSNAP02"
+
+# Numeric snapshot columns, in file order: name, typecode, width.
+_COLUMNS: Tuple[Tuple[str, Literal["i", "I", "h"], int], ...] = (
+    ("ratings", "i", 4), ("wins", "i", 4), ("losses", "i", 4),
+    ("ranked", "I", 4), ("costs", "h", 2), ("attacks", "h", 2),
+)
+
+
+class TournamentStore:
+    """
+    Local persistence for a TournamentPlatform.
+
+    Two files live in the store directory:
+
+    - matches.log: an append-only binary log of card registrations and
+      match results, written in group-committed batches;
+    - snapshot.bin: a compact snapshot of every card, with fixed-width
+      numeric columns followed by one NUL-separated string blob, read
+      back through mmap.
+
+    Restoring loads the snapshot, then replays the log on top of it.
+    Writing a snapshot starts a new, empty log.
+
+    Both files carry a generation number: a snapshot covers every log
+    of an older generation. A log left behind by a crash between the
+    snapshot and the log rotation is therefore discarded instead of
+    being replayed a second time.
+    """
+
+    LOG_NAME = "matches.log"
+    SNAPSHOT_NAME = "snapshot.bin"
+
+    def __init__(
+        self, directory: str, batch_size: int = 4096, durable: bool = False
+    ):
+        """
+        Open (or create) a store directory.
+
+        :param directory: Directory holding the log and the snapshot.
+        :param batch_size: Records buffered before the log is written.
+        :param durable: If True, fsync the log on every flush.
+        :raises ValueError: If batch_size is not a positive integer, or
+                            the log does not match the snapshot.
+        """
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise ValueError("Batch size must be a positive integer")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.batch_size = batch_size
+        self.durable = durable
+        self.log_path = os.path.join(directory, self.LOG_NAME)
+        self.snapshot_path = os.path.join(directory, self.SNAPSHOT_NAME)
+        self._buffer = bytearray()
+        self._pending = 0
+        self.generation = self._snapshot_generation()
+        log_generation = self._log_generation()
+        if log_generation is None or log_generation < self.generation:
+            self._start_log(self.generation)
+        elif log_generation > self.generation:
+            raise ValueError("Match log is newer than the snapshot")
+        self._log = open(self.log_path, "ab")
+
+    def _snapshot_generation(self) -> int:
+        """
+        Read the generation of the snapshot, 0 if there is none.
+
+        :raises ValueError: If the snapshot file is not a valid snapshot.
+        """
+        if not os.path.exists(self.snapshot_path):
+            return 0
+        with open(self.snapshot_path, "rb") as source:
+            header = source.read(_SNAPSHOT_HEADER.size)
+        if len(header) < _SNAPSHOT_HEADER.size:
+            raise ValueError("Not a tournament snapshot")
+        magic, generation, _, _, _ = _SNAPSHOT_HEADER.unpack(header)
+        if magic != _SNAPSHOT_MAGIC:
+            raise ValueError("Not a tournament snapshot")
+        return generation
+
+    def _log_generation(self) -> Optional[int]:
+        """
+        Read the generation of the log, None if there is no log yet.
+
+        :raises ValueError: If the log file is not a match log.
+        """
+        if not os.path.exists(self.log_path):
+            return None
+        with open(self.log_path, "rb") as source:
+            header = source.read(_LOG_HEADER.size)
+        if not header:
+            return None
+        magic, generation = (_LOG_HEADER.unpack(header)
+                             if len(header) == _LOG_HEADER.size
+                             else (None, 0))
+        if magic != _LOG_MAGIC:
+            raise ValueError("Not a tournament match log")
+        return generation
+
+    def _start_log(self, generation: int) -> None:
+        """
+        Atomically replace the log with an empty one of a generation.
+        """
+        tmp_path = self.log_path + ".tmp"
+        with open(tmp_path, "wb") as out:
+            out.write(_LOG_HEADER.pack(_LOG_MAGIC, generation))
+            out.flush()
+            os.fsync(out.fileno())
+        os.replace(tmp_path, self.log_path)
+        self._sync_directory()
+
+    def _sync_directory(self) -> None:
+        """
+        Make renames in the store directory durable.
+        """
+        if os.name != "posix":
+            return
+        descriptor = os.open(self.directory, os.O_RDONLY)
+        try:
+            os.fsync(descriptor)
+        finally:
+            os.close(descriptor)
+
+    def log_register(self, order: int, card_id: str,
+                     card: TournamentCard) -> None:
+        """
+        Append a card registration to the log.
+
+        :param order: The card's registration order on the platform.
+        :param card_id: The card identifier.
+        :param card: The registered card.
+        """
+        text = f"{card_id}\0{card.name}\0{card.rarity}".encode()
+        self._buffer += _REGISTER.pack(
+            b"R", order, card.cost, card.attack_power,
+            card.rating, card.wins, card.losses, len(text))
+        self._buffer += text
+        self._count_record()
+
+    def log_match(self, winner_order: int, loser_order: int,
+                  delta: int) -> None:
+        """
+        Append a match result to the log.
+
+        :param winner_order: Registration order of the winner.
+        :param loser_order: Registration order of the loser.
+        :param delta: Rating points moved from loser to winner.
+        """
+        self._buffer += _MATCH.pack(b"M", winner_order, loser_order, delta)
+        self._count_record()
+
+    def _count_record(self) -> None:
+        """
+        Track a buffered record and commit the batch once it is full.
+        """
+        self._pending += 1
+        if self._pending >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Write every buffered record to the log.
+        """
+        if self._buffer:
+            self._log.write(self._buffer)
+            self._buffer.clear()
+            self._pending = 0
+        self._log.flush()
+        if self.durable:
+            os.fsync(self._log.fileno())
+
+    def close(self) -> None:
+        """
+        Flush pending records and close the log.
+        """
+        if not self._log.closed:
+            self.flush()
+            self._log.close()
+
+    def write_snapshot(self, platform: Any) -> None:
+        """
+        Write a snapshot of the platform and start a new log.
+
+        The snapshot is written to a temporary file and moved into place,
+        so a crash never leaves a half-written snapshot behind. It
+        belongs to the next generation, so the old log is ignored even
+        if the crash comes before the new log replaces it.
+
+        :param platform: The TournamentPlatform to snapshot.
+        """
+        ids = platform.ids_by_order()
+        cards = [platform.registry[card_id] for card_id in ids]
+        order_of = {card_id: order for order, card_id in enumerate(ids)}
+        ranked = [order_of[card_id] for card_id in platform.ranked_ids()]
+        text = "\0".join(
+            f"{card_id}\0{card.name}\0{card.rarity}"
+            for card_id, card in zip(ids, cards)
+        ).encode()
+
+        generation = self.generation + 1
+        columns = {
+            "ratings": [card.rating for card in cards],
+            "wins": [card.wins for card in cards],
+            "losses": [card.losses for card in cards],
+            "ranked": ranked,
+            "costs": [card.cost for card in cards],
+            "attacks": [card.attack_power for card in cards],
+        }
+        tmp_path = self.snapshot_path + ".tmp"
+        with open(tmp_path, "wb") as out:
+            out.write(_SNAPSHOT_HEADER.pack(
+                _SNAPSHOT_MAGIC, generation, len(ids),
+                platform.matches_played, len(text)))
+            for name, typecode, _ in _COLUMNS:
+                values = columns[name]
+                out.write(struct.pack(f"<{len(values)}{typecode}", *values))
+            out.write(text)
+            out.flush()
+            os.fsync(out.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+        self._sync_directory()
+
+        self._buffer.clear()
+        self._pending = 0
+        self._log.close()
+        self._start_log(generation)
+        self.generation = generation
+        self._log = open(self.log_path, "ab")
+
+    def restore(self, platform: Any) -> None:
+        """
+        Load the snapshot and replay the log into an empty platform.
+
+        :param platform: The TournamentPlatform to fill.
+        :raises ValueError: If the snapshot file is not a valid snapshot.
+        """
+        self.flush()
+        # Restoring allocates millions of long-lived objects; pausing the
+        # cyclic GC keeps it from rescanning the growing heap meanwhile.
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            if os.path.exists(self.snapshot_path):
+                self._load_snapshot(platform)
+            self._replay_log(platform)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+    def _load_snapshot(self, platform: Any) -> None:
+        """
+        Rebuild the platform from the snapshot file through mmap.
+
+        Numeric columns stay zero-copy memoryview casts of the mapped
+        file, and the string blob is decoded and split in one call.
+        Cards are only built when first looked up (see SnapshotRegistry);
+        the file stays mapped as long as the registry needs it.
+
+        :raises ValueError: If the file is not a valid snapshot.
+        """
+        with open(self.snapshot_path, "rb") as source:
+            if os.fstat(source.fileno()).st_size == 0:
+                raise ValueError("Empty snapshot file")
+            mapped = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, _, count, matches, text_len = (
+            _SNAPSHOT_HEADER.unpack_from(mapped))
+        if magic != _SNAPSHOT_MAGIC:
+            mapped.close()
+            raise ValueError("Not a tournament snapshot")
+        view = memoryview(mapped)
+        offset = _SNAPSHOT_HEADER.size
+        columns: Dict[str, Sequence[int]] = {}
+        for name, typecode, width in _COLUMNS:
+            size = count * width
+            columns[name] = view[offset:offset + size].cast(typecode)
+            offset += size
+        text = bytes(view[offset:offset + text_len])
+
+        strings = text.decode().split("\0") if count else []
+        ids = strings[0::3]
+        platform.load_state(
+            SnapshotRegistry(ids, strings, columns), ids,
+            columns["ratings"], columns["ranked"], matches)
+
+    def _replay_log(self, platform: Any) -> None:
+        """
+        Apply every complete log record after the header to the platform.
+
+        A truncated record at the end of the log (e.g. after a crash in
+        the middle of a write) is cut off so new records follow the last
+        complete one.
+        """
+        with open(self.log_path, "rb") as source:
+            data = source.read()
+        offset = _LOG_HEADER.size
+        end = len(data)
+        ids: Optional[List[str]] = None
+        while offset < end:
+            kind = data[offset:offset + 1]
+            if kind == b"M":
+                if offset + _MATCH.size > end:
+                    break
+                _, w_order, l_order, delta = _MATCH.unpack_from(data, offset)
+                offset += _MATCH.size
+                if ids is None:
+                    ids = platform.ids_by_order()
+                platform.apply_result(ids[w_order], ids[l_order], delta)
+            elif kind == b"R":
+                if offset + _REGISTER.size > end:
+                    break
+                (_, _, cost, attack, rating, wins, losses,
+                 text_len) = _REGISTER.unpack_from(data, offset)
+                start = offset + _REGISTER.size
+                if start + text_len > end:
+                    break
+                card_id, name, rarity = (
+                    data[start:start + text_len].decode().split("\0"))
+                offset = start + text_len
+                card = TournamentCard.from_record(
+                    name, cost, rarity, attack, rating, wins, losses)
+                platform.register_card(card, card_id)
+                ids = None
+            else:
+                raise ValueError(f"Corrupt match log at byte {offset}")
+        if offset < end:
+            os.truncate(self.log_path, offset)
@@ -0,0 +1,60 @@
+import random
+from collections import Counter
+from itertools import islice, permutations
+from ex0.CreatureCard import CreatureCard
+from ex1.Deck import Deck
+
+NAMES = ("a", "b", "c", "d")
+
+
+def lazy_deck(rng: random.Random) -> Deck:
+    """
+    Build a lazily shuffled deck of four distinct creatures.
+    """
+    deck = Deck(rng=rng, lazy_shuffle=True)
+    deck.add_cards(CreatureCard(name, 1, "Common", 1, 1) for name in NAMES)
+    deck.shuffle()
+    return deck
+
+
+def chi_square(histogram: Counter, trials: int) -> float:
+    """
+    Chi-square statistic of a histogram against all 24 orders of NAMES.
+    """
+    expected = trials / 24
+    return sum((histogram[order] - expected) ** 2 / expected
+               for order in permutations(NAMES))
+
+
+def test_draws_after_partial_iteration_are_uniform() -> None:
+    rng = random.Random(2024)
+    trials = 24_000
+    histogram: Counter = Counter()
+    for _ in range(trials):
+        deck = lazy_deck(rng)
+        peeked = [card.name for card in islice(deck, 2)]
+        drawn = tuple(card.name for card in deck.draw_many(4))
+        assert list(drawn[:2]) == peeked
+        histogram[drawn] += 1
+    # 23 degrees of freedom: 49.7 is the 0.1% critical value.
+    assert chi_square(histogram, trials) < 49.7
+
+
+def test_cards_after_partial_iteration_are_uniform() -> None:
+    rng = random.Random(7)
+    trials = 24_000
+    histogram: Counter = Counter()
+    for _ in range(trials):
+        deck = lazy_deck(rng)
+        top = next(iter(deck))
+        cards = deck.cards
+        assert cards[0] is top
+        histogram[tuple(card.name for card in cards)] += 1
+    assert chi_square(histogram, trials) < 49.7
+
+
+def test_sample_keeps_the_order_already_read() -> None:
+    deck = lazy_deck(random.Random(1))
+    peeked = list(islice(deck, 2))
+    assert sorted(card.name for card in deck.sample(4)) == list(NAMES)
+    assert deck.draw_many(2) == peeked
@@ -0,0 +1,112 @@
+import pickle
+import pytest
+from typing import Any, Dict
+from ex0.CreatureCard import CreatureCard
+from ex3.AggressiveStrategy import AggressiveStrategy
+from ex3.CardCatalog import CardCatalog
+from ex3.FantasyCardFactory import FantasyCardFactory
+from ex3.GameEngine import GameEngine
+
+
+def test_factory_with_cached_prototypes_pickles() -> None:
+    factory = FantasyCardFactory()
+    factory.create_creature("dragon")
+    copy = pickle.loads(pickle.dumps(factory))
+    assert copy.create_creature("dragon").name == "Fire Dragon"
+    assert copy.create_spell("bolt").name == "Lightning Bolt"
+
+
+def build_catalog(path: str, dragon_type: str) -> CardCatalog:
+    """
+    Write a two-card catalog whose 'dragon' entry has the given type.
+    """
+    dragon: Dict[str, Any] = {"id": "dragon", "type": dragon_type,
+                              "name": "Catalog Dragon", "cost": 9,
+                              "rarity": "Epic"}
+    for field in CardCatalog.LAYOUTS[dragon_type]:
+        dragon[field] = "Deal 9 damage" if field == "effect" else 9
+    CardCatalog.build([dragon, {
+        "id": "imp", "type": "creatures", "name": "Imp", "cost": 1,
+        "rarity": "Common", "attack": 1, "health": 1,
+    }], path)
+    return CardCatalog(path)
+
+
+def test_catalog_replaces_templates_of_the_same_kind(tmp_path: Any) -> None:
+    with build_catalog(str(tmp_path / "cards.bin"), "creatures") as catalog:
+        factory = FantasyCardFactory(catalog=catalog)
+        assert factory.create_creature("dragon").name == "Catalog Dragon"
+
+
+def test_catalog_entry_of_another_kind_is_ignored(tmp_path: Any) -> None:
+    with build_catalog(str(tmp_path / "cards.bin"), "spells") as catalog:
+        factory = FantasyCardFactory(catalog=catalog)
+        dragon = factory.create_creature("dragon")
+        assert isinstance(dragon, CreatureCard)
+        assert dragon.name == "Fire Dragon"
+        assert factory.create_card("dragon").name == "Catalog Dragon"
+
+
+def test_factory_with_catalog_runs_on_worker_processes(
+    tmp_path: Any
+) -> None:
+    with build_catalog(str(tmp_path / "cards.bin"), "creatures") as catalog:
+        factory = FantasyCardFactory(catalog=catalog)
+        copy = pickle.loads(pickle.dumps(factory))
+        assert copy.create_card("imp").name == "Imp"
+        copy.catalog.close()
+
+        strategy = AggressiveStrategy()
+        engine = GameEngine()
+        expected = engine.run_simulations(
+            factory, strategy, strategy, 20, workers=1, seed=3)
+        result = engine.run_simulations(
+            factory, strategy, strategy, 20, workers=2, seed=3)
+        assert result == expected
+
+
+def test_cache_evicts_the_least_recently_used_prototype() -> None:
+    factory = FantasyCardFactory(cache_size=2)
+    factory.create_creature("dragon")
+    factory.create_creature("goblin")
+    factory.create_creature("dragon")
+    factory.create_spell("bolt")
+    factory.create_creature("dragon")
+    assert factory.get_cache_stats()["hits"] == 2
+    assert factory.create_creature("goblin").name == "Goblin Warrior"
+    assert factory.get_cache_stats()["misses"] == 4
+
+
+def test_copies_do_not_share_state() -> None:
+    factory = FantasyCardFactory()
+    ring = factory.create_artifact("ring")
+    ring.durability -= 1
+    assert factory.create_artifact("ring").durability == ring.durability + 1
+
+
+def test_empty_themed_deck_accepts_zero_weights() -> None:
+    factory = FantasyCardFactory()
+    weights = {"creatures": 0.0, "spells": 0.0, "artifacts": 0.0}
+    assert len(factory.create_themed_deck(0, type_weights=weights)) == 0
+    table = factory.create_themed_deck(0, type_weights=weights,
+                                       as_table=True)
+    assert len(table) == 0
+
+
+def test_negative_themed_deck_weights_are_rejected() -> None:
+    factory = FantasyCardFactory()
+    with pytest.raises(ValueError):
+        factory.create_themed_deck(10, type_weights={
+            "creatures": -1.0, "spells": 1.0, "artifacts": 1.0})
+    with pytest.raises(ValueError):
+        factory.create_themed_deck(10, rarity_weights={"Rare": -0.5})
+
+
+def test_catalog_rejects_out_of_range_values(tmp_path: Any) -> None:
+    path = str(tmp_path / "cards.bin")
+    with pytest.raises(ValueError):
+        CardCatalog.build([{
+            "id": "titan", "type": "creatures", "name": "Titan",
+            "cost": 40000, "rarity": "Epic", "attack": 1, "health": 1,
+        }], path)
+    assert list(tmp_path.iterdir()) == []
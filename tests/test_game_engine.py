@@ -0,0 +1,35 @@
+from typing import Any, Dict, List, Optional
+from ex3.AggressiveStrategy import AggressiveStrategy
+from ex3.FantasyCardFactory import FantasyCardFactory
+from ex3.GameEngine import GameEngine
+from ex3.GameStrategy import GameStrategy
+
+
+class NamedPlays(GameStrategy):
+    """
+    Aggressive play reported by name only, so the engine goes through
+    the default GameStrategy.select_plays().
+    """
+
+    def __init__(self) -> None:
+        self.inner = AggressiveStrategy()
+
+    def execute_turn(
+        self, hand: List[Any], battlefield: List[Any],
+        game_state: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        return self.inner.execute_turn(hand, battlefield, game_state)
+
+    def get_strategy_name(self) -> str:
+        return "NamedPlays"
+
+
+def test_strategies_reporting_names_play_the_same_games() -> None:
+    factory = FantasyCardFactory()
+    by_index = AggressiveStrategy()
+    by_name = NamedPlays()
+    engine = GameEngine()
+    expected = engine.run_simulations(
+        factory, by_index, by_index, 50, seed=5)
+    assert engine.run_simulations(
+        factory, by_name, by_name, 50, seed=5) == expected
@@ -0,0 +1,64 @@
+import random
+from typing import Dict, List, Set
+from ex4.TournamentCard import TournamentCard
+from ex4.TournamentPlatform import TournamentPlatform
+
+
+def fresh_pairing_exists(ids: List[str], met: Dict[str, Set[str]]) -> bool:
+    """
+    Brute-force check for a pairing of `ids` without any rematch.
+    """
+    if not ids:
+        return True
+    head, rest = ids[0], ids[1:]
+    return any(
+        other not in met.get(head, set())
+        and fresh_pairing_exists([x for x in rest if x != other], met)
+        for other in rest
+    )
+
+
+def play_rounds(n_cards: int, seed: int) -> List[bool]:
+    """
+    Play n_cards - 1 Swiss rounds and report, per round, whether it had
+    a rematch that some other pairing of its entrants would avoid.
+    """
+    rng = random.Random(seed)
+    platform = TournamentPlatform()
+    for i in range(n_cards):
+        card = TournamentCard(f"Card {i}", 3, "Common", rng.randrange(1, 9))
+        platform.register_card(card, f"card_{i}")
+    scheduler = platform.scheduler
+    avoidable = []
+    for _ in range(n_cards - 1):
+        met = {cid: set(opp) for cid, opp in scheduler.opponents.items()}
+        pairs = platform.play_swiss_round()["pairs"]
+        entrants = [card_id for pair in pairs for card_id in pair]
+        assert len(set(entrants)) == len(entrants) == n_cards // 2 * 2
+        rematch = any(second in met.get(first, set())
+                      for first, second in pairs)
+        avoidable.append(rematch and fresh_pairing_exists(entrants, met))
+    return avoidable
+
+
+def test_six_entrants_never_rematch_when_avoidable():
+    for seed in range(200):
+        assert not any(play_rounds(6, seed)), seed
+
+
+def test_larger_fields_never_rematch_when_avoidable():
+    for n_cards in (7, 8, 10, 12):
+        for seed in range(40):
+            assert not any(play_rounds(n_cards, seed)), (n_cards, seed)
+
+
+def test_first_round_pairs_closest_ratings():
+    platform = TournamentPlatform()
+    for i, attack in enumerate((1, 2, 3, 4)):
+        card = TournamentCard(f"Card {i}", 3, "Common", attack)
+        card.rating = 1000 + 100 * i
+        platform.register_card(card, f"card_{i}")
+    pairs = platform.scheduler.swiss_round()["pairs"]
+    assert sorted(map(sorted, pairs)) == [
+        ["card_0", "card_1"], ["card_2", "card_3"]
+    ]
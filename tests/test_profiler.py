@@ -0,0 +1,37 @@
+import pickle
+from ex0.Profiler import Profiler
+from ex3.AggressiveStrategy import AggressiveStrategy
+from ex3.FantasyCardFactory import FantasyCardFactory
+from ex3.GameEngine import GameEngine
+
+
+def test_profiled_engine_runs_on_worker_processes() -> None:
+    engine = GameEngine()
+    factory = FantasyCardFactory()
+    strategy = AggressiveStrategy()
+    engine.configure_engine(factory, strategy)
+    profiler = Profiler()
+    profiler.attach_engine(engine)
+
+    expected = engine.run_simulations(
+        factory, strategy, strategy, 40, workers=1, seed=7)
+    calls = profiler.snapshot()["strategy.select_plays"]["calls"]
+    assert calls > 0
+    result = engine.run_simulations(
+        factory, strategy, strategy, 40, workers=2, seed=7)
+
+    assert result == expected
+    # Worker copies run untimed; the parent's samples are untouched.
+    assert profiler.snapshot()["strategy.select_plays"]["calls"] == calls
+
+
+def test_pickled_copy_runs_plain_methods() -> None:
+    factory = FantasyCardFactory()
+    profiler = Profiler()
+    profiler.attach(factory, "factory", "create_creature")
+
+    copy = pickle.loads(pickle.dumps(factory))
+    copy.create_creature("dragon")
+    assert profiler.snapshot()["factory.create_creature"]["calls"] == 0
+    factory.create_creature("dragon")
+    assert profiler.snapshot()["factory.create_creature"]["calls"] == 1
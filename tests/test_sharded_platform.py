@@ -0,0 +1,27 @@
+from ex4.ShardedPlatform import ShardedPlatform
+from ex4.TournamentCard import TournamentCard
+from ex4.TournamentPlatform import TournamentPlatform
+
+CARDS = [
+    ("dragon", TournamentCard("Fire Dragon", 5, "Rare", 7)),
+    ("goblin", TournamentCard("Goblin", 2, "Common", 2)),
+    ("wizard", TournamentCard("Ice Wizard", 4, "Rare", 5)),
+    ("knight", TournamentCard("Knight", 3, "Common", 4)),
+]
+
+
+def test_create_match_matches_a_single_platform() -> None:
+    single = TournamentPlatform()
+    for card_id, card in CARDS:
+        single.register_card(TournamentCard.from_record(
+            card.name, card.cost, card.rarity, card.attack_power,
+            card.rating, card.wins, card.losses), card_id)
+    with ShardedPlatform(3) as sharded:
+        sharded.register_cards(CARDS)
+        for card1_id, card2_id in [("goblin", "dragon"),
+                                   ("wizard", "knight"),
+                                   ("dragon", "wizard"),
+                                   ("knight", "goblin")]:
+            assert (sharded.create_match(card1_id, card2_id)
+                    == single.create_match(card1_id, card2_id))
+        assert sharded.get_leaderboard() == single.get_leaderboard()
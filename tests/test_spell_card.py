@@ -0,0 +1,10 @@
+from ex1.ArtifactCard import ArtifactCard
+from ex1.SpellCard import SpellCard
+
+
+def test_only_artifacts_expose_an_effect_attribute() -> None:
+    spell = SpellCard("Lightning Bolt", 3, "Common", "Deal 3 damage")
+    ring = ArtifactCard("Mana Ring", 2, "Rare", 5, "+1 mana")
+    assert spell.compiled_effect.damage == 3
+    assert not hasattr(spell, "effect")
+    assert ring.effect == "+1 mana"
@@ -0,0 +1,77 @@
+from typing import Any
+import pytest
+from ex4.SnapshotRegistry import SnapshotRegistry
+from ex4.TournamentCard import TournamentCard
+from ex4.TournamentPlatform import TournamentPlatform
+from ex4.TournamentStore import TournamentStore
+
+
+def play_one_match(directory: str) -> TournamentPlatform:
+    """
+    Open a store, register two cards and play one match between them.
+    """
+    platform = TournamentPlatform.open(directory)
+    platform.register_card(TournamentCard("Fire Dragon", 5, "Rare", 7),
+                           "dragon")
+    platform.register_card(TournamentCard("Goblin", 2, "Common", 2),
+                           "goblin")
+    platform.create_match("dragon", "goblin")
+    return platform
+
+
+def test_restore_replays_log_after_snapshot(tmp_path: Any) -> None:
+    platform = play_one_match(str(tmp_path))
+    platform.save_snapshot()
+    platform.create_match("dragon", "goblin")
+    platform.close()
+    restored = TournamentPlatform.open(str(tmp_path))
+    assert restored.matches_played == 2
+    assert len(restored.registry) == 2
+    restored.close()
+
+
+def test_crash_before_log_rotation_does_not_replay_twice(
+    tmp_path: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    platform = play_one_match(str(tmp_path))
+    assert platform.store is not None
+
+    def crash(generation: int) -> None:
+        raise OSError("crashed before the log was rotated")
+
+    monkeypatch.setattr(platform.store, "_start_log", crash)
+    with pytest.raises(OSError):
+        platform.save_snapshot()
+
+    restored = TournamentPlatform.open(str(tmp_path))
+    assert restored.matches_played == 1
+    assert len(restored.registry) == 2
+    assert len(restored.ids_by_order()) == 2
+    restored.close()
+
+
+def test_log_newer_than_snapshot_is_rejected(tmp_path: Any) -> None:
+    platform = play_one_match(str(tmp_path))
+    platform.save_snapshot()
+    platform.close()
+    (tmp_path / TournamentStore.SNAPSHOT_NAME).unlink()
+    with pytest.raises(ValueError):
+        TournamentStore(str(tmp_path))
+
+
+def test_snapshot_cards_are_built_on_first_access(tmp_path: Any) -> None:
+    platform = play_one_match(str(tmp_path))
+    platform.save_snapshot()
+    expected = platform.registry["dragon"].get_tournament_stats()
+    platform.close()
+
+    restored = TournamentPlatform.open(str(tmp_path))
+    assert isinstance(restored.registry, SnapshotRegistry)
+    assert "goblin" in restored.registry
+    assert restored.top_k(1) == platform.top_k(1)
+    assert restored.registry["dragon"].get_tournament_stats() == expected
+    restored.register_card(TournamentCard("Imp", 1, "Common", 1), "imp")
+    restored.create_match("imp", "goblin")
+    assert list(restored.registry) == ["dragon", "goblin", "imp"]
+    assert restored.registry.get("missing") is None
+    restored.close()